@@ -0,0 +1,240 @@
+"""
+Vectorized metrics rollups.
+
+The metrics collection is loaded once per data version into columnar NumPy
+arrays: metric values plus integer codes for category, metric_name,
+metric_unit and the parsed time bucket. A rollup is then a handful of array
+operations over all rows at once (bincount for sums and counts, one lexsort
+for percentiles, a shifted diff for growth) instead of a Python loop per
+document. Results are cached until versions.bump_versions(db, "metrics")
+is called by a writer.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from datetime import date
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from versions import get_versions
+
+GROUP_FIELDS = ["category", "metric_name", "metric_unit", "period"]
+GRANULARITIES = ["month", "quarter", "year"]
+DEFAULT_PERCENTILES = [50.0, 90.0, 99.0]
+
+_MONTHS = {
+    name: index + 1
+    for index, names in enumerate([
+        ("january", "jan"), ("february", "feb"), ("march", "mar"), ("april", "apr"),
+        ("may",), ("june", "jun"), ("july", "jul"), ("august", "aug"),
+        ("september", "sep", "sept"), ("october", "oct"), ("november", "nov"), ("december", "dec"),
+    ])
+    for name in names
+}
+_QUARTER = re.compile(r"^\s*q([1-4])[\s-]*(?:fy)?\s*(\d{4})\s*$", re.IGNORECASE)
+_HALF = re.compile(r"^\s*h([12])[\s-]*(?:fy)?\s*(\d{4})\s*$", re.IGNORECASE)
+_MONTH_YEAR = re.compile(r"^\s*([a-z]+)\.?[\s,-]*(\d{4})\s*$", re.IGNORECASE)
+_ISO_MONTH = re.compile(r"^\s*(\d{4})-(\d{1,2})(?:-\d{1,2})?\s*$")
+_YEAR = re.compile(r"^\s*(?:fy|cy)?\s*(\d{4})\s*$", re.IGNORECASE)
+
+
+def parse_time_period(period: Any) -> Optional[date]:
+    """
+    Start date of a free-form period label: "Q4 2023" -> 2023-10-01,
+    "December 2023" -> 2023-12-01, "2023-07" -> 2023-07-01, "H2 2023" -> 2023-07-01,
+    "2023" -> 2023-01-01. Returns None for labels it cannot place.
+    """
+    if not isinstance(period, str):
+        return None
+    match = _QUARTER.match(period)
+    if match:
+        return date(int(match[2]), 3 * int(match[1]) - 2, 1)
+    match = _HALF.match(period)
+    if match:
+        return date(int(match[2]), 6 * int(match[1]) - 5, 1)
+    match = _MONTH_YEAR.match(period)
+    if match and match[1].lower() in _MONTHS:
+        return date(int(match[2]), _MONTHS[match[1].lower()], 1)
+    match = _ISO_MONTH.match(period)
+    if match and 1 <= int(match[2]) <= 12:
+        return date(int(match[1]), int(match[2]), 1)
+    match = _YEAR.match(period)
+    if match:
+        return date(int(match[1]), 1, 1)
+    return None
+
+
+def bucket_start(start: date, granularity: str) -> date:
+    if granularity == "year":
+        return date(start.year, 1, 1)
+    if granularity == "quarter":
+        return date(start.year, 3 * ((start.month - 1) // 3) + 1, 1)
+    return start
+
+
+class MetricColumns:
+    """Columnar snapshot of the metrics collection"""
+
+    def __init__(self, values: np.ndarray, codes: Dict[str, np.ndarray], labels: Dict[str, List[Any]]):
+        self.values = values
+        self.codes = codes
+        self.labels = labels
+
+    @classmethod
+    def load(cls, db, batch_size: int = 10000) -> "MetricColumns":
+        fields = ["category", "metric_name", "metric_unit", "time_period"]
+        lookups: Dict[str, Dict[Any, int]] = {field: {} for field in fields}
+        codes: Dict[str, List[int]] = {field: [] for field in fields}
+        values: List[float] = []
+
+        projection = {"_id": 0, "metric_value": 1, **{field: 1 for field in fields}}
+        # The only per-document work: interning strings to integer codes
+        for doc in db.metrics.find({}, projection, batch_size=batch_size):
+            values.append(doc.get("metric_value") or 0.0)
+            for field in fields:
+                lookup = lookups[field]
+                codes[field].append(lookup.setdefault(doc.get(field), len(lookup)))
+
+        labels = {field: list(lookups[field]) for field in fields}
+        return cls(
+            np.asarray(values, dtype=np.float64),
+            {field: np.asarray(codes[field], dtype=np.int64) for field in fields},
+            labels,
+        )
+
+    def period_codes(self, granularity: str) -> Tuple[np.ndarray, List[Optional[date]]]:
+        """Per-row bucket codes, ordered chronologically, plus the bucket dates (None = unparsed)"""
+        # Parse each distinct label once, then map every row through the code array
+        starts = [parse_time_period(label) for label in self.labels["time_period"]]
+        buckets = [bucket_start(start, granularity) if start else None for start in starts]
+        ordered = sorted(set(buckets), key=lambda bucket: (bucket is None, bucket or date.min))
+        position = {bucket: index for index, bucket in enumerate(ordered)}
+        mapping = np.asarray([position[bucket] for bucket in buckets], dtype=np.int64)
+        return mapping[self.codes["time_period"]], ordered
+
+
+def _group_percentiles(sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float) -> np.ndarray:
+    """Linear-interpolated percentile of every group at once, given values sorted within groups"""
+    position = starts + (counts - 1) * (q / 100.0)
+    lower = np.floor(position).astype(np.int64)
+    upper = np.minimum(lower + 1, starts + counts - 1)
+    fraction = position - lower
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * fraction
+
+
+def rollup(
+    columns: MetricColumns,
+    group_by: Sequence[str] = GROUP_FIELDS,
+    granularity: str = "quarter",
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    category: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    values = columns.values
+    if values.size == 0:
+        return []
+    # Canonical order keeps "period" last, which the growth calculation relies on
+    group_by = [field for field in GROUP_FIELDS if field in group_by]
+
+    dimension_codes: Dict[str, np.ndarray] = {}
+    dimension_labels: Dict[str, List[Any]] = {}
+    for field in group_by:
+        if field == "period":
+            dimension_codes[field], buckets = columns.period_codes(granularity)
+            dimension_labels[field] = [bucket.isoformat() if bucket else None for bucket in buckets]
+        else:
+            dimension_codes[field] = columns.codes[field]
+            dimension_labels[field] = columns.labels[field]
+
+    if category is not None:
+        if category not in columns.labels["category"]:
+            return []
+        mask = columns.codes["category"] == columns.labels["category"].index(category)
+        values = values[mask]
+        dimension_codes = {field: codes[mask] for field, codes in dimension_codes.items()}
+        if values.size == 0:
+            return []
+
+    # Combine the dimension codes into one group id per row. "period" goes last so
+    # consecutive group ids within a series are consecutive time buckets.
+    if dimension_codes:
+        keys = np.stack([dimension_codes[field] for field in group_by], axis=1)
+        unique_keys, group_ids = np.unique(keys, axis=0, return_inverse=True)
+        group_ids = group_ids.reshape(-1)
+    else:
+        unique_keys = np.zeros((1, 0), dtype=np.int64)
+        group_ids = np.zeros(values.size, dtype=np.int64)
+    group_count = unique_keys.shape[0]
+
+    counts = np.bincount(group_ids, minlength=group_count)
+    sums = np.bincount(group_ids, weights=values, minlength=group_count)
+    means = sums / counts
+
+    order = np.lexsort((values, group_ids))
+    sorted_values = values[order]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    minimums = sorted_values[starts]
+    maximums = sorted_values[starts + counts - 1]
+    percentile_columns = {q: _group_percentiles(sorted_values, starts, counts, q) for q in percentiles}
+
+    # Period-over-period growth of the sum within each series (same key minus period)
+    growth = np.full(group_count, np.nan)
+    if "period" in group_by and group_count > 1:
+        period_index = list(group_by).index("period")
+        series = np.delete(unique_keys, period_index, axis=1)
+        periods_known = np.asarray([label is not None for label in dimension_labels["period"]])
+        same_series = np.all(series[1:] == series[:-1], axis=1)
+        valid = same_series & periods_known[unique_keys[1:, period_index]] & periods_known[unique_keys[:-1, period_index]]
+        previous = sums[:-1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            change = (sums[1:] - previous) / np.abs(previous)
+        growth[1:] = np.where(valid & (previous != 0), change, np.nan)
+
+    rows = []
+    for index in range(group_count):
+        row: Dict[str, Any] = {
+            field: dimension_labels[field][unique_keys[index, position]]
+            for position, field in enumerate(group_by)
+        }
+        row.update({
+            "count": int(counts[index]),
+            "sum": float(sums[index]),
+            "mean": float(means[index]),
+            "min": float(minimums[index]),
+            "max": float(maximums[index]),
+        })
+        for q, column in percentile_columns.items():
+            row[f"p{q:g}"] = float(column[index])
+        if "period" in group_by:
+            row["growth"] = None if np.isnan(growth[index]) else round(float(growth[index]), 6)
+        rows.append(row)
+    return rows
+
+
+class RollupCache:
+    """Columns and rollup results, kept until the metrics version changes"""
+
+    def __init__(self, max_results: int = 64):
+        self.max_results = max_results
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._columns: Optional[MetricColumns] = None
+        self._results: "OrderedDict[Tuple, List[Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, db, group_by: Sequence[str], granularity: str, percentiles: Sequence[float], category: Optional[str]):
+        version = get_versions(db).get("metrics", 0)
+        key = (tuple(group_by), granularity, tuple(percentiles), category)
+        with self._lock:
+            if version != self._version:
+                self._columns = MetricColumns.load(db)
+                self._results.clear()
+                self._version = version
+            if key in self._results:
+                self._results.move_to_end(key)
+                return self._results[key], version
+            result = rollup(self._columns, group_by, granularity, percentiles, category)
+            self._results[key] = result
+            if len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+            return result, version
@@ -0,0 +1,165 @@
+"""
+Cross-portfolio benchmarking of case study KPIs.
+
+For every peer segment (the whole portfolio, each industry, each company_type
+and each industry + company_type pair) the index keeps one sorted NumPy array
+per metric. "Where does case X rank on metric Y within segment Z" is then two
+binary searches (np.searchsorted) instead of a scan.
+
+The arrays are built in bulk from one projected pass over case_studies and
+follow the case_studies data version (see versions.py): when it moves, they
+are rebuilt. updated_at cannot drive an incremental refresh, since ingest
+stores it as given by the import source, so a changed document may carry an
+older timestamp than the last refresh saw.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from versions import get_versions
+
+# metric -> (document path, higher is better)
+BENCHMARK_METRICS: Dict[str, Tuple[str, bool]] = {
+    "success_rate": ("success_rate", True),
+    "ltv_cac_ratio": ("numeric.key_metrics.ltv_cac_ratio.value", True),
+    "customer_acquisition_cost": ("numeric.key_metrics.customer_acquisition_cost.value", False),
+    "churn_rate": ("numeric.key_metrics.churn_rate.value", False),
+    "average_sales_cycle": ("numeric.channel_strategy.average_sales_cycle.value", False),
+}
+# segment -> fields that define the peer group
+SEGMENTS: Dict[str, List[str]] = {
+    "portfolio": [],
+    "industry": ["industry"],
+    "company_type": ["company_type"],
+    "industry_company_type": ["industry", "company_type"],
+}
+DISTRIBUTION_PERCENTILES = [10, 25, 50, 75, 90]
+
+# Sales cycles are stored in whatever unit the case study used
+_DAYS_PER_UNIT = {"days": 1.0, "weeks": 7.0, "months": 30.4, "years": 365.0}
+
+SegmentKey = Tuple[str, Tuple[Any, ...]]
+
+# Everything the index reads from a case study
+BENCHMARK_PROJECTION = {
+    "_id": 0,
+    "id": 1,
+    "numeric.channel_strategy.average_sales_cycle.unit": 1,
+    **{field: 1 for fields in SEGMENTS.values() for field in fields},
+    **{path: 1 for path, _ in BENCHMARK_METRICS.values()},
+}
+
+
+def _get(doc: Dict[str, Any], path: str) -> Any:
+    value: Any = doc
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def metric_values(doc: Dict[str, Any]) -> Dict[str, float]:
+    """The benchmarked metrics a case study has numeric values for"""
+    values = {}
+    for metric, (path, _) in BENCHMARK_METRICS.items():
+        value = _get(doc, path)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        if metric == "average_sales_cycle":
+            unit = _get(doc, "numeric.channel_strategy.average_sales_cycle.unit")
+            if unit not in _DAYS_PER_UNIT:
+                continue
+            value = value * _DAYS_PER_UNIT[unit]
+        values[metric] = float(value)
+    return values
+
+
+def segment_keys(doc: Dict[str, Any]) -> List[SegmentKey]:
+    return [(segment, tuple(doc.get(field) for field in fields)) for segment, fields in SEGMENTS.items()]
+
+
+def _rank(values: np.ndarray, value: float) -> Dict[str, Any]:
+    """Mid-rank percentile of `value` among `values` (sorted), in O(log n)"""
+    below = int(np.searchsorted(values, value, side="left"))
+    at_or_below = int(np.searchsorted(values, value, side="right"))
+    count = int(values.size)
+    percentile = 100.0 * (below + 0.5 * (at_or_below - below)) / count
+    return {"percentile": round(percentile, 1), "peers_below": below, "peers_above": count - at_or_below}
+
+
+class BenchmarkIndex:
+    """Sorted per-segment metric arrays, rebuilt whenever the case_studies version changes"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version: Optional[int] = None
+        self._arrays: Dict[SegmentKey, Dict[str, np.ndarray]] = {}
+
+    def _build(self, docs: List[Dict[str, Any]]) -> None:
+        """Bulk build: group values per segment and metric, then one np.sort per array"""
+        grouped: Dict[SegmentKey, Dict[str, List[float]]] = {}
+        for doc in docs:
+            values = metric_values(doc)
+            for key in segment_keys(doc):
+                metrics = grouped.setdefault(key, {})
+                for metric, value in values.items():
+                    metrics.setdefault(metric, []).append(value)
+        self._arrays = {
+            key: {metric: np.sort(np.asarray(values, dtype=np.float64)) for metric, values in metrics.items()}
+            for key, metrics in grouped.items()
+        }
+
+    def refresh(self, db) -> int:
+        """Rebuild the arrays if the case_studies version has moved; returns that version"""
+        version = get_versions(db).get("case_studies", 0)
+        with self._lock:
+            if version != self._version:
+                self._build(list(db.case_studies.find({}, BENCHMARK_PROJECTION)))
+                self._version = version
+            return version
+
+    def rank(self, doc: Dict[str, Any], segments: List[str], metrics: List[str]) -> Dict[str, Any]:
+        """Percentile of each of the case study's metrics within each requested peer segment"""
+        values = metric_values(doc)
+        result = {}
+        with self._lock:
+            for segment, key in segment_keys(doc):
+                if segment not in segments:
+                    continue
+                arrays = self._arrays.get((segment, key), {})
+                ranked = {}
+                for metric in metrics:
+                    array = arrays.get(metric)
+                    if metric not in values or array is None or array.size == 0:
+                        continue
+                    entry = {"value": round(values[metric], 4), "peer_count": int(array.size), **_rank(array, values[metric])}
+                    higher_is_better = BENCHMARK_METRICS[metric][1]
+                    # 100 = best in segment regardless of the metric's direction
+                    entry["standing"] = entry["percentile"] if higher_is_better else round(100.0 - entry["percentile"], 1)
+                    ranked[metric] = entry
+                result[segment] = {"peers": dict(zip(SEGMENTS[segment], key)), "metrics": ranked}
+        return result
+
+    def distributions(self, segment: str, metrics: List[str]) -> List[Dict[str, Any]]:
+        """Percentile summary of every peer group in a segment"""
+        rows = []
+        with self._lock:
+            for (name, key), arrays in self._arrays.items():
+                if name != segment:
+                    continue
+                summary = {}
+                for metric in metrics:
+                    array = arrays.get(metric)
+                    if array is None or array.size == 0:
+                        continue
+                    points = np.percentile(array, DISTRIBUTION_PERCENTILES)
+                    summary[metric] = {
+                        "count": int(array.size),
+                        "min": round(float(array[0]), 4),
+                        "max": round(float(array[-1]), 4),
+                        **{f"p{q}": round(float(point), 4) for q, point in zip(DISTRIBUTION_PERCENTILES, points)},
+                    }
+                if summary:
+                    rows.append({"peers": dict(zip(SEGMENTS[segment], key)), "metrics": summary})
+        return sorted(rows, key=lambda row: [str(value) for value in row["peers"].values()])
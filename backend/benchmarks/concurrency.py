@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Before/after concurrency benchmark for the async data layer.
+
+Drives the API in-process over an ASGI transport at 1, 16 and 128 concurrent
+clients and prints requests/sec for two apps against the same MONGO_URL:
+
+  before  - the original handlers calling pymongo directly inside async routes
+  after   - server.app's routes, which await queries through repository.py
+
+The after app is mounted without server.app's middleware and with single-flight
+coalescing off, so no request is answered from the response cache, with a 304,
+or by sharing another request's query: both apps run every query they serve.
+
+Usage (from backend/, with a seeded database):
+    python benchmarks/concurrency.py --duration 10
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import httpx
+from fastapi import FastAPI
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository  # noqa: E402
+from serialization import FastJSONResponse  # noqa: E402
+from server import app as server_app  # noqa: E402
+
+CONCURRENCY_LEVELS = [1, 16, 128]
+# view=full matches the before handler, which returns whole documents (it ignores the parameter)
+ENDPOINTS = ["/api/case-studies?view=full", "/api/frameworks", "/api/dashboard-stats"]
+
+
+def build_blocking_app() -> FastAPI:
+    """The pre-repository handlers: synchronous pymongo calls in async routes"""
+    app = FastAPI()
+    db = repository.db
+
+    @app.get("/api/case-studies")
+    async def get_case_studies():
+        return {"case_studies": list(db.case_studies.find({}, {"_id": 0}))}
+
+    @app.get("/api/frameworks")
+    async def get_frameworks():
+        return {"frameworks": list(db.frameworks.find({}, {"_id": 0}))}
+
+    @app.get("/api/dashboard-stats")
+    async def get_dashboard_stats():
+        pipeline = [{"$group": {"_id": None, "avg_success_rate": {"$avg": "$success_rate"}}}]
+        avg_result = list(db.case_studies.aggregate(pipeline))
+        return {
+            "total_case_studies": db.case_studies.count_documents({}),
+            "startup_studies": db.case_studies.count_documents({"company_type": "startup"}),
+            "mnc_studies": db.case_studies.count_documents({"company_type": "mnc"}),
+            "average_success_rate": avg_result[0]["avg_success_rate"] if avg_result else 0,
+        }
+
+    return app
+
+
+def build_async_app() -> FastAPI:
+    """server.app's routes without its middleware stack (response cache, conditional GET, compression)"""
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(server_app.router)
+    return app
+
+
+async def run_level(app, concurrency: int, duration: float) -> float:
+    transport = httpx.ASGITransport(app=app)
+    completed = 0
+    deadline = time.perf_counter() + duration
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def worker(offset: int):
+            nonlocal completed
+            i = offset
+            while time.perf_counter() < deadline:
+                response = await client.get(ENDPOINTS[i % len(ENDPOINTS)])
+                response.raise_for_status()
+                completed += 1
+                i += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(n) for n in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return completed / elapsed
+
+
+async def main(duration: float):
+    repository.connect()
+    repository._flights.enabled = False
+    apps = [("before", build_blocking_app()), ("after", build_async_app())]
+    results = {name: {} for name, _ in apps}
+
+    for name, app in apps:
+        for concurrency in CONCURRENCY_LEVELS:
+            results[name][concurrency] = await run_level(app, concurrency, duration)
+            print(f"{name:>6} c={concurrency:<4} {results[name][concurrency]:10.1f} req/s")
+
+    print()
+    print(f"{'clients':>8} {'before':>12} {'after':>12} {'speedup':>8}")
+    for concurrency in CONCURRENCY_LEVELS:
+        before = results["before"][concurrency]
+        after = results["after"][concurrency]
+        print(f"{concurrency:>8} {before:>12.1f} {after:>12.1f} {after / before:>7.2f}x")
+
+    repository.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per concurrency level")
+    args = parser.parse_args()
+    asyncio.run(main(args.duration))
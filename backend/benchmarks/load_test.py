@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Concurrent load test and latency benchmark for every API route.
+
+Each scenario is driven for --duration seconds by --concurrency closed-loop
+clients, then the next one starts. Per scenario it reports throughput, error
+count, response-cache hit ratio and p50/p95/p99/max latency. Targets:
+
+  --url http://host:8001   a running server over HTTP
+  (default)                server.app in-process over an ASGI transport, against MONGO_URL
+  --mongomock              server.app in-process against an in-memory mongomock
+                           database filled by synthetic_data.py (needs mongomock);
+                           scenarios mongomock cannot serve are skipped
+
+--output writes the results as JSON. --baseline compares against an earlier
+output and exits non-zero when a scenario's p95 grew, or its throughput
+dropped, by more than --tolerance.
+
+Usage (from backend/):
+    python benchmarks/load_test.py --concurrency 32 --duration 10 --output results.json
+    python benchmarks/load_test.py --mongomock --case-studies 5000 --baseline results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+PERCENTILES = [50, 95, 99]
+
+# Scenarios mongomock cannot serve, with the reason printed when --mongomock skips them
+MONGOMOCK_UNSUPPORTED = {"search": "$text is not implemented in mongomock"}
+
+
+@dataclass
+class Scenario:
+    name: str
+    method: str
+    path: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    json: Optional[Dict[str, Any]] = None
+
+
+def scenarios(case_ids: List[str]) -> List[Scenario]:
+    """One scenario per route (and per notable variant); ids come from the target's data"""
+    case_id = case_ids[0]
+    return [
+        Scenario("case_studies_summary", "GET", "/api/case-studies"),
+        Scenario("case_studies_full", "GET", "/api/case-studies", {"view": "full", "limit": 20}),
+        Scenario("case_studies_filtered_sorted", "GET", "/api/case-studies",
+                 {"company_type": "startup", "min_success_rate": 80, "sort": "-success_rate"}),
+        Scenario("case_study_detail", "GET", f"/api/case-studies/{case_id}"),
+        Scenario("case_study_with_metrics", "GET", f"/api/case-studies/{case_id}", {"include": "metrics"}),
+        Scenario("case_study_benchmarks", "GET", f"/api/case-studies/{case_id}/benchmarks"),
+        Scenario("case_studies_batch", "POST", "/api/case-studies/batch", json={"ids": case_ids[:20]}),
+        Scenario("benchmark_distributions", "GET", "/api/benchmarks", {"segment": "industry"}),
+        Scenario("frameworks", "GET", "/api/frameworks"),
+        Scenario("metrics", "GET", f"/api/metrics/{case_id}"),
+        Scenario("dashboard_stats", "GET", "/api/dashboard-stats"),
+        Scenario("search", "GET", "/api/search", {"q": "compliance enterprise"}),
+        Scenario("metrics_rollup", "GET", "/api/analytics/metrics-rollup", {"granularity": "quarter"}),
+        Scenario("export_case_studies", "GET", "/api/export/case-studies"),
+        Scenario("export_metrics", "GET", "/api/export/metrics", {"case_study_id": case_id}),
+        Scenario("cache_stats", "GET", "/api/cache/stats"),
+    ]
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: Scenario, concurrency: int, duration: float) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    cache_hits = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors, cache_hits
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                response = await client.request(scenario.method, scenario.path, params=scenario.params, json=scenario.json)
+                # Streaming routes are only done once the body has arrived
+                await response.aread()
+                if response.status_code >= 400:
+                    errors += 1
+                elif response.headers.get("x-cache") == "HIT":
+                    cache_hits += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+            # In-process, a response-cache hit completes without awaiting anything that
+            # suspends; yield so one worker cannot hold the loop until the deadline
+            await asyncio.sleep(0)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    samples = np.asarray(latencies) * 1000
+    result = {
+        "requests": len(latencies),
+        "errors": errors,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "cache_hit_ratio": round(cache_hits / len(latencies), 3) if latencies else 0.0,
+        "max_ms": round(float(samples.max()), 2) if samples.size else None,
+    }
+    for q, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES) if samples.size else [None] * len(PERCENTILES)):
+        result[f"p{q}_ms"] = round(float(value), 2) if value is not None else None
+    return result
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Scenarios whose p95 grew or throughput dropped by more than `tolerance` (a fraction)"""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous or not previous.get("p95_ms") or current.get("p95_ms") is None:
+            continue
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {previous['p95_ms']}ms -> {current['p95_ms']}ms")
+        if current["throughput_rps"] < previous["throughput_rps"] * (1 - tolerance):
+            regressions.append(f"{name}: throughput {previous['throughput_rps']} -> {current['throughput_rps']} req/s")
+        if current["errors"] > previous.get("errors", 0):
+            regressions.append(f"{name}: errors {previous.get('errors', 0)} -> {current['errors']}")
+    return regressions
+
+
+def use_mongomock(case_studies: int, metrics: int) -> None:
+    """Point every MongoClient at one in-memory database and fill it with synthetic data"""
+    try:
+        import mongomock
+    except ImportError:
+        sys.exit("--mongomock needs the mongomock package (pip install mongomock)")
+    import pymongo
+
+    client = mongomock.MongoClient()
+    pymongo.MongoClient = lambda *args, **kwargs: client
+
+    import synthetic_data
+
+    generator = synthetic_data.Generator(seed=42, case_studies=case_studies, metrics=metrics, frameworks=20)
+    synthetic_data.generate(generator, synthetic_data.MongoWriter(client.gtm_portfolio_db))
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args) -> int:
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+        lifespan = None
+    else:
+        if args.mongomock:
+            use_mongomock(args.case_studies, args.case_studies * 10)
+        from server import app, lifespan as app_lifespan
+
+        lifespan = app_lifespan(app)
+        await lifespan.__aenter__()
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=args.timeout)
+
+    results: Dict[str, Any] = {}
+    try:
+        listing = await client.get("/api/case-studies", params={"limit": 20})
+        listing.raise_for_status()
+        case_ids = [doc["id"] for doc in listing.json()["case_studies"]]
+        if not case_ids:
+            print("No case studies found; seed the database first", file=sys.stderr)
+            return 2
+
+        selected = [s for s in scenarios(case_ids) if not args.only or s.name in args.only]
+        print(f"{'scenario':<30} {'req/s':>9} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'errors':>7} {'hit':>5}")
+        for scenario in selected:
+            if args.mongomock and scenario.name in MONGOMOCK_UNSUPPORTED:
+                print(f"{scenario.name:<30} skipped: {MONGOMOCK_UNSUPPORTED[scenario.name]}")
+                continue
+            result = await run_scenario(client, scenario, args.concurrency, args.duration)
+            results[scenario.name] = result
+            print(f"{scenario.name:<30} {result['throughput_rps']:>9.1f} {result['p50_ms'] or 0:>8.2f} "
+                  f"{result['p95_ms'] or 0:>8.2f} {result['p99_ms'] or 0:>8.2f} {result['max_ms'] or 0:>8.2f} "
+                  f"{result['errors']:>7} {result['cache_hit_ratio']:>5.2f}")
+    finally:
+        await client.aclose()
+        if lifespan is not None:
+            await lifespan.__aexit__(None, None, None)
+
+    if args.output:
+        report = {
+            "meta": {
+                "target": args.url or ("in-process (mongomock)" if args.mongomock else "in-process"),
+                "concurrency": args.concurrency,
+                "duration": args.duration,
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nWrote {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as handle:
+            baseline = json.load(handle)["results"]
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\nRegressions against {args.baseline} (tolerance {args.tolerance:.0%}):")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nNo regressions against {args.baseline} (tolerance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--url", help="base URL of a running server")
+    target.add_argument("--mongomock", action="store_true", help="in-process against synthetic in-memory data")
+    parser.add_argument("--case-studies", type=int, default=2000, help="synthetic case studies for --mongomock")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=5.0, help="seconds per scenario")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="run only these scenarios")
+    parser.add_argument("--output", help="write JSON results here")
+    parser.add_argument("--baseline", help="JSON results from an earlier run to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed regression as a fraction (default 0.2)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
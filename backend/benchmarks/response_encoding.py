@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Bytes-on-wire and CPU cost per response encoding.
+
+Loads the seeded case studies from MONGO_URL, replicates them up to each
+target size (fresh ids, same text), renders the /api/case-studies?view=full
+payload with serialization.dumps exactly as the API does, and compresses it with every encoding the
+server can negotiate. Replicated text repeats within the compression window,
+so ratios at the larger sizes are an upper bound.
+
+Usage (from backend/, with a seeded database):
+    python benchmarks/response_encoding.py --sizes 3,300,3000 --repeat 5
+"""
+
+import argparse
+import os
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import repository  # noqa: E402
+import serialization  # noqa: E402
+from compression import Compressor, available_encodings  # noqa: E402
+
+
+def scaled_payload(studies, size: int) -> bytes:
+    docs = [{**studies[i % len(studies)], "id": str(uuid.uuid4())} for i in range(size)]
+    return serialization.dumps({"case_studies": docs, "next_cursor": None})
+
+
+def measure(compressor: Compressor, body: bytes, encoding: str, repeat: int):
+    started = time.process_time()
+    for _ in range(repeat):
+        compressed = compressor.compress(body, encoding)
+    cpu_ms = (time.process_time() - started) * 1000 / repeat
+    return len(compressed), cpu_ms
+
+
+def main(sizes, repeat: int):
+    repository.connect()
+    studies = list(repository.case_studies_collection.find({}, {"_id": 0}))
+    if not studies:
+        sys.exit("No case studies found; run seed_data.py first")
+
+    compressor = Compressor(encodings=available_encodings())
+    print(f"{'docs':>7} {'encoding':>9} {'bytes':>12} {'ratio':>7} {'cpu ms':>9} {'MB/s':>8}")
+    for size in sizes:
+        body = scaled_payload(studies, size)
+        print(f"{size:>7} {'identity':>9} {len(body):>12,} {1.0:>7.2f} {0.0:>9.2f} {'-':>8}")
+        for encoding in compressor.encodings:
+            compressed_size, cpu_ms = measure(compressor, body, encoding, repeat)
+            throughput = len(body) / (cpu_ms / 1000) / 1e6 if cpu_ms else float("inf")
+            print(f"{size:>7} {encoding:>9} {compressed_size:>12,} {len(body) / compressed_size:>7.2f} "
+                  f"{cpu_ms:>9.2f} {throughput:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="3,300,3000", help="comma-separated document counts")
+    parser.add_argument("--repeat", type=int, default=5, help="compressions per measurement")
+    args = parser.parse_args()
+    main([int(size) for size in args.sizes.split(",")], args.repeat)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Per-response JSON serialization cost at 1, 100 and 10k case studies.
+
+Builds full case study documents with synthetic_data.py (no database needed)
+and times encoding a /api/case-studies?view=full style payload into response
+bytes along each path:
+
+  jsonable_encoder   FastAPI's default: recursive walk, then JSONResponse (json.dumps)
+  model_dump_json    TypeAdapter(List[CaseStudy]) over already-validated models
+  validate+dump      the same adapter, including validating the Mongo dicts first
+  pydantic_core      pydantic_core.to_json on the plain dicts
+  orjson             orjson.dumps on the plain dicts (skipped when not installed)
+  FastJSONResponse   what the routes use (serialization.py)
+
+Usage (from backend/):
+    python benchmarks/serialization.py --sizes 1,100,10000
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+import pydantic_core
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import serialization  # noqa: E402
+import synthetic_data  # noqa: E402
+from models import CaseStudy  # noqa: E402
+
+case_study_list = TypeAdapter(List[CaseStudy])
+
+
+def case_studies(count: int) -> List[Dict[str, Any]]:
+    generator = synthetic_data.Generator(seed=7, case_studies=count, metrics=0, frameworks=0)
+    docs: List[Dict[str, Any]] = []
+    for cases, _ in generator.chunks():
+        docs.extend(cases)
+    return docs
+
+
+def encoders(docs: List[Dict[str, Any]]) -> Dict[str, Callable[[], bytes]]:
+    payload = {"case_studies": docs, "next_cursor": None}
+    models = case_study_list.validate_python(docs)
+    paths = {
+        "jsonable_encoder": lambda: JSONResponse(jsonable_encoder(payload)).body,
+        "model_dump_json": lambda: case_study_list.dump_json(models),
+        "validate+dump": lambda: case_study_list.dump_json(case_study_list.validate_python(docs)),
+        "pydantic_core": lambda: pydantic_core.to_json(payload),
+    }
+    if serialization.orjson is not None:
+        paths["orjson"] = lambda: serialization.orjson.dumps(payload, option=serialization.ORJSON_OPTIONS)
+    paths["FastJSONResponse"] = lambda: serialization.FastJSONResponse(payload).body
+    return paths
+
+
+def measure(encode: Callable[[], bytes], min_time: float) -> Dict[str, float]:
+    """Repeat until `min_time` seconds have passed; returns the best and mean per-call time"""
+    timings = []
+    deadline = time.perf_counter() + min_time
+    while time.perf_counter() < deadline or len(timings) < 3:
+        started = time.perf_counter()
+        body = encode()
+        timings.append(time.perf_counter() - started)
+    return {"best_ms": min(timings) * 1000, "mean_ms": sum(timings) / len(timings) * 1000, "bytes": len(body)}
+
+
+def main(sizes: List[int], min_time: float) -> None:
+    print(f"{'docs':>7} {'path':<18} {'bytes':>12} {'best ms':>10} {'mean ms':>10} {'speedup':>8}")
+    for size in sizes:
+        docs = case_studies(size)
+        baseline = None
+        for name, encode in encoders(docs).items():
+            result = measure(encode, min_time)
+            baseline = baseline or result["best_ms"]
+            print(f"{size:>7} {name:<18} {result['bytes']:>12,} {result['best_ms']:>10.3f} "
+                  f"{result['mean_ms']:>10.3f} {baseline / result['best_ms']:>7.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="1,100,10000", help="comma-separated document counts")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds spent timing each path")
+    args = parser.parse_args()
+    main([int(size) for size in args.sizes.split(",")], args.min_time)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Throughput scaling of launcher.py from 1 to N worker processes.
+
+For each worker count the launcher is started on --port against MONGO_URL and
+the benchmark waits until readiness has answered from every worker (each
+reports its pid). Then --clients load-generator processes, each with
+--connections closed-loop connections, cycle through a mix of load_test.py
+scenarios for --duration seconds after a --warmup. Reported per worker count:
+throughput, speedup and per-worker efficiency relative to the first count,
+p50/p99 latency and errors.
+
+The load generators run on the same machine and compete with the workers for
+cores, so scaling flattens before the worker count reaches the core count;
+leave cores for the clients (or pin them with taskset) when reading the curve.
+
+Usage (from backend/, with a seeded database):
+    python benchmarks/worker_scaling.py --workers 1 2 4 8 --duration 10
+    python benchmarks/worker_scaling.py --workers 1 2 --only dashboard_stats frameworks --output scaling.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import httpx
+import numpy as np
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+from load_test import PERCENTILES, Scenario, _git_commit, scenarios  # noqa: E402
+
+# Read routes a multi-worker deployment serves most; cached and uncached paths mixed
+DEFAULT_SCENARIOS = ["dashboard_stats", "frameworks", "case_studies_summary", "case_study_detail", "case_study_benchmarks"]
+
+
+async def _drive(url: str, mix: List[Scenario], connections: int, duration: float, timeout: float) -> Dict[str, Any]:
+    latencies: List[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=connections, max_keepalive_connections=connections)
+    async with httpx.AsyncClient(base_url=url, timeout=timeout, limits=limits) as client:
+        deadline = time.perf_counter() + duration
+
+        async def connection(offset: int):
+            nonlocal errors
+            i = offset
+            while time.perf_counter() < deadline:
+                scenario = mix[i % len(mix)]
+                i += 1
+                started = time.perf_counter()
+                try:
+                    response = await client.request(scenario.method, scenario.path, params=scenario.params, json=scenario.json)
+                    if response.status_code >= 400:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(connection(offset) for offset in range(connections)))
+        elapsed = time.perf_counter() - started
+    return {"latencies": latencies, "errors": errors, "elapsed": elapsed}
+
+
+def drive(url: str, mix: List[Scenario], connections: int, duration: float, timeout: float) -> Dict[str, Any]:
+    """Load-generator process body"""
+    return asyncio.run(_drive(url, mix, connections, duration, timeout))
+
+
+def wait_ready(url: str, workers: int, timeout: float) -> None:
+    """Poll readiness on fresh connections until every worker has answered"""
+    seen = set()
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            # A new connection per probe, so SO_REUSEPORT hashing reaches different workers
+            response = httpx.get(f"{url}/api/health/ready", timeout=2)
+            if response.status_code == 200:
+                seen.add(response.json()["worker_pid"])
+                if len(seen) >= workers:
+                    return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.05)
+    raise RuntimeError(f"only {len(seen)} of {workers} workers became ready within {timeout}s")
+
+
+def start_launcher(workers: int, port: int) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, os.path.join(BACKEND_DIR, "launcher.py"), "--workers", str(workers),
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning", "--graceful-timeout", "5"],
+        cwd=BACKEND_DIR,
+    )
+
+
+def stop_launcher(process: subprocess.Popen) -> None:
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=20)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+
+
+def measure(pool, url: str, mix: List[Scenario], args) -> Dict[str, Any]:
+    jobs = [(url, mix, args.connections, args.duration, args.timeout)] * args.clients
+    runs = pool.starmap(drive, jobs)
+    samples = np.concatenate([np.asarray(run["latencies"]) for run in runs]) * 1000
+    requests = int(samples.size)
+    result = {
+        "requests": requests,
+        "errors": sum(run["errors"] for run in runs),
+        # Each client's own rate, summed, so start-up skew between clients does not dilute it
+        "throughput_rps": round(sum(len(run["latencies"]) / run["elapsed"] for run in runs), 1),
+    }
+    for q, value in zip(PERCENTILES, np.percentile(samples, PERCENTILES) if requests else [None] * len(PERCENTILES)):
+        result[f"p{q}_ms"] = round(float(value), 2) if value is not None else None
+    return result
+
+
+def main(args) -> int:
+    url = f"http://127.0.0.1:{args.port}"
+    context = multiprocessing.get_context("spawn")
+    results: Dict[str, Any] = {}
+    baseline: Optional[Dict[str, Any]] = None
+
+    print(f"{'workers':>7} {'req/s':>10} {'speedup':>8} {'eff.':>6} {'p50':>8} {'p99':>8} {'errors':>7}")
+    with context.Pool(args.clients) as pool:
+        for workers in args.workers:
+            launcher = start_launcher(workers, args.port)
+            try:
+                wait_ready(url, workers, args.startup_timeout)
+                listing = httpx.get(f"{url}/api/case-studies", params={"limit": 20}, timeout=args.timeout)
+                listing.raise_for_status()
+                case_ids = [doc["id"] for doc in listing.json()["case_studies"]]
+                if not case_ids:
+                    print("No case studies found; seed the database first", file=sys.stderr)
+                    return 2
+                mix = [s for s in scenarios(case_ids) if s.name in (args.only or DEFAULT_SCENARIOS)]
+
+                if args.warmup > 0:
+                    pool.starmap(drive, [(url, mix, args.connections, args.warmup, args.timeout)] * args.clients)
+                result = measure(pool, url, mix, args)
+            finally:
+                stop_launcher(launcher)
+
+            baseline = baseline or {"workers": workers, "throughput_rps": result["throughput_rps"]}
+            speedup = result["throughput_rps"] / baseline["throughput_rps"] if baseline["throughput_rps"] else 0.0
+            result["speedup"] = round(speedup, 2)
+            result["efficiency"] = round(speedup * baseline["workers"] / workers, 2)
+            results[str(workers)] = result
+            print(f"{workers:>7} {result['throughput_rps']:>10.1f} {result['speedup']:>7.2f}x {result['efficiency']:>6.2f} "
+                  f"{result['p50_ms'] or 0:>8.2f} {result['p99_ms'] or 0:>8.2f} {result['errors']:>7}")
+
+    if args.output:
+        report = {
+            "meta": {
+                "scenarios": [s.name for s in mix],
+                "clients": args.clients,
+                "connections": args.connections,
+                "duration": args.duration,
+                "cpu_count": os.cpu_count(),
+                "commit": _git_commit(),
+                "python": platform.python_version(),
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+            },
+            "results": results,
+        }
+        with open(args.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+        print(f"\nWrote {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    cpus = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=sorted({1, *[2 ** i for i in range(1, 8) if 2 ** i <= cpus], cpus}),
+                        help="worker counts to measure (default 1, powers of two, CPU count)")
+    parser.add_argument("--port", type=int, default=18001)
+    parser.add_argument("--clients", type=int, default=max(1, cpus // 2), help="load-generator processes")
+    parser.add_argument("--connections", type=int, default=16, help="connections per load-generator process")
+    parser.add_argument("--duration", type=float, default=10.0, help="measured seconds per worker count")
+    parser.add_argument("--warmup", type=float, default=2.0, help="unmeasured seconds before each measurement")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--startup-timeout", type=float, default=60.0, help="seconds to wait for all workers to be ready")
+    parser.add_argument("--only", nargs="+", metavar="SCENARIO", help="load_test.py scenarios to mix (default: common reads)")
+    parser.add_argument("--output", help="write JSON results here")
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,212 @@
+"""
+In-process response cache for read endpoints.
+
+ResponseCacheMiddleware stores complete 200 responses to GET requests whose
+path matches a configured prefix, keyed on the path plus the normalised query
+string (plus the data version ConditionalGetMiddleware resolved, when there
+is one), and replays them without touching the route or Mongo. Storage is
+behind the CacheBackend interface; LRUCache is the default, bounded by entry
+count and total body bytes, with a TTL per entry.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+
+from compression import Compressor, encoded_headers, request_accept_encoding, vary_accept_encoding
+from conditional import DATA_VERSION_KEY
+
+Headers = List[Tuple[bytes, bytes]]
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: Headers
+    body: bytes
+    expires_at: float
+    # Compressed copies of `body`, keyed by content-coding, built on first use
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(variant) for variant in self.variants.values())
+
+
+class CacheBackend:
+    """Storage interface used by ResponseCacheMiddleware"""
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        raise NotImplementedError
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        raise NotImplementedError
+
+    def add_variant(self, key: str, encoding: str, body: bytes) -> None:
+        """Attach a compressed copy of the entry's body"""
+        raise NotImplementedError
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drop every entry whose key starts with `prefix`; returns the number removed"""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        raise NotImplementedError
+
+
+class LRUCache(CacheBackend):
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        if response.size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = response
+        self._bytes += response.size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def add_variant(self, key: str, encoding: str, body: bytes) -> None:
+        entry = self._entries.get(key)
+        if entry is None or encoding in entry.variants:
+            return
+        entry.variants[encoding] = body
+        self._bytes += len(body)
+        while self._bytes > self.max_bytes and self._entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def invalidate(self, prefix: str = "") -> int:
+        keys = [key for key in self._entries if key.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        self.invalidations += len(keys)
+        return len(keys)
+
+    def _remove(self, key: str) -> None:
+        self._bytes -= self._entries.pop(key).size
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+        }
+
+
+def cache_key(path: str, query_string: bytes) -> str:
+    """Path plus query parameters in a canonical order, so ?a=1&b=2 and ?b=2&a=1 share an entry"""
+    params = sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True))
+    return f"{path}?{urlencode(params)}" if params else path
+
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware caching GET responses for paths matching `ttls`, a mapping
+    of path prefix to TTL in seconds. The longest matching prefix wins.
+
+    With a `compressor`, cached bodies are served in the negotiated encoding
+    and each encoding is compressed once per entry rather than once per hit.
+    """
+
+    def __init__(self, app, backend: CacheBackend, ttls: Dict[str, float], compressor: Optional[Compressor] = None):
+        self.app = app
+        self.backend = backend
+        self.compressor = compressor
+        self.ttls = sorted(ttls.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        for prefix, ttl in self.ttls:
+            if path.startswith(prefix):
+                return ttl
+        return None
+
+    async def _send_entry(self, scope, send, key: str, entry: CachedResponse, status: bytes):
+        headers = list(entry.headers)
+        body = entry.body
+        if self.compressor and self.compressor.should_compress(entry.headers, entry.body):
+            encoding = self.compressor.negotiate(request_accept_encoding(scope))
+            if encoding:
+                body = entry.variants.get(encoding)
+                if body is None:
+                    body = self.compressor.compress(entry.body, encoding)
+                    self.backend.add_variant(key, encoding, body)
+            headers = encoded_headers(entry.headers, encoding, len(body))
+        elif self.compressor and self.compressor.negotiable(entry.headers):
+            headers = vary_accept_encoding(headers)
+        await send({"type": "http.response.start", "status": entry.status,
+                    "headers": headers + [(b"x-cache", status)]})
+        await send({"type": "http.response.body", "body": body})
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+        ttl = self.ttl_for(scope["path"])
+        if not ttl:
+            return await self.app(scope, receive, send)
+
+        key = cache_key(scope["path"], scope.get("query_string", b""))
+        version = scope.get(DATA_VERSION_KEY)
+        if version:
+            # Entries from before a data change are never replayed; they age out of the LRU
+            key = f"{key}#{version}"
+        entry = self.backend.get(key)
+        if entry is not None:
+            return await self._send_entry(scope, send, key, entry, b"HIT")
+
+        # Buffer the response so a cacheable one can be stored before it is encoded and sent
+        start: Dict[str, Any] = {}
+        chunks: List[bytes] = []
+
+        async def capture(message):
+            if message["type"] == "http.response.start":
+                start.update(message)
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+
+        await self.app(scope, receive, capture)
+
+        entry = CachedResponse(
+            status=start["status"],
+            headers=list(start.get("headers", [])),
+            body=b"".join(chunks),
+            expires_at=time.monotonic() + ttl,
+        )
+        if entry.status == 200:
+            self.backend.set(key, entry)
+        await self._send_entry(scope, send, key, entry, b"MISS")
@@ -0,0 +1,200 @@
+"""
+Response compression negotiated via Accept-Encoding.
+
+gzip is always available; brotli ("br") and zstd are used when the `brotli`
+and `zstandard` packages are installed. Bodies smaller than the minimum size
+are sent as-is. Cached responses are compressed once per encoding by the
+response cache (see cache.py); CompressionMiddleware covers everything else.
+
+Every response of a compressible type carries Vary: Accept-Encoding, including
+identity ones (no Accept-Encoding, or a body under the minimum size), so a
+shared cache never hands an uncompressed copy to a client that asked for
+compression or a compressed one to a client that did not.
+"""
+
+import gzip
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+Headers = List[Tuple[bytes, bytes]]
+
+DEFAULT_LEVELS = {"gzip": 6, "br": 5, "zstd": 3}
+
+COMPRESSIBLE_TYPES = (b"application/json", b"application/x-ndjson", b"text/")
+
+
+def available_encodings() -> List[str]:
+    encodings = ["gzip"]
+    if brotli is not None:
+        encodings.append("br")
+    if zstandard is not None:
+        encodings.append("zstd")
+    return encodings
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """Map each coding in an Accept-Encoding header to its q-value"""
+    accepted = {}
+    for part in header.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        accepted[coding] = q
+    return accepted
+
+
+class Compressor:
+    def __init__(
+        self,
+        encodings: Optional[List[str]] = None,
+        minimum_size: int = 1024,
+        levels: Optional[Dict[str, int]] = None,
+    ):
+        """`encodings` is in server preference order; unavailable ones are dropped"""
+        supported = available_encodings()
+        self.encodings = [e for e in (encodings or ["br", "zstd", "gzip"]) if e in supported]
+        self.minimum_size = minimum_size
+        self.levels = {**DEFAULT_LEVELS, **(levels or {})}
+        self._zstd = zstandard.ZstdCompressor(level=self.levels["zstd"]) if "zstd" in self.encodings else None
+
+    def negotiate(self, accept_encoding: str) -> Optional[str]:
+        """Pick the client's highest-q encoding, breaking ties by server preference"""
+        if not accept_encoding or not self.encodings:
+            return None
+        accepted = parse_accept_encoding(accept_encoding)
+        wildcard = accepted.get("*", 0.0)
+        best, best_q = None, 0.0
+        for encoding in self.encodings:
+            q = accepted.get(encoding, wildcard)
+            if q > best_q:
+                best, best_q = encoding, q
+        return best
+
+    def compress(self, body: bytes, encoding: str) -> bytes:
+        if encoding == "gzip":
+            return gzip.compress(body, compresslevel=self.levels["gzip"], mtime=0)
+        if encoding == "br":
+            return brotli.compress(body, quality=self.levels["br"])
+        if encoding == "zstd":
+            return self._zstd.compress(body)
+        raise ValueError(f"Unsupported encoding: {encoding}")
+
+    def negotiable(self, headers: Headers) -> bool:
+        """Whether a response with these headers could be sent in more than one encoding"""
+        if not self.encodings:
+            return False
+        content_type = b""
+        for name, value in headers:
+            name = name.lower()
+            if name == b"content-encoding":
+                return False
+            if name == b"content-type":
+                content_type = value.lower()
+        return content_type.startswith(COMPRESSIBLE_TYPES)
+
+    def should_compress(self, headers: Headers, body: bytes) -> bool:
+        return len(body) >= self.minimum_size and self.negotiable(headers)
+
+
+def request_accept_encoding(scope) -> str:
+    for name, value in scope.get("headers", []):
+        if name == b"accept-encoding":
+            return value.decode("latin-1")
+    return ""
+
+
+def vary_accept_encoding(headers: Headers) -> Headers:
+    """Add Accept-Encoding to Vary, keeping any fields already listed"""
+    result, listed = [], []
+    for name, value in headers:
+        if name.lower() == b"vary":
+            listed.extend(field.strip() for field in value.split(b",") if field.strip())
+        else:
+            result.append((name, value))
+    if b"accept-encoding" not in (field.lower() for field in listed):
+        listed.append(b"Accept-Encoding")
+    result.append((b"vary", b", ".join(listed)))
+    return result
+
+
+def encoded_headers(headers: Headers, encoding: Optional[str], length: int) -> Headers:
+    """Replace Content-Length, add Content-Encoding and Vary for an encoded body"""
+    result = [(name, value) for name, value in headers if name.lower() not in (b"content-length", b"vary")]
+    result.append((b"content-length", str(length).encode()))
+    result.append((b"vary", b"Accept-Encoding"))
+    if encoding:
+        result.append((b"content-encoding", encoding.encode()))
+    return result
+
+
+class CompressionMiddleware:
+    """
+    Compress complete (single-message) responses. Streaming responses and
+    bodies that already carry a Content-Encoding pass through untouched.
+    """
+
+    def __init__(self, app, compressor: Compressor):
+        self.app = app
+        self.compressor = compressor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        encoding = self.compressor.negotiate(request_accept_encoding(scope))
+        if encoding is None:
+            return await self.app(scope, receive, self._with_vary(send))
+
+        start = {}
+        passthrough = False
+
+        async def compress_send(message):
+            nonlocal passthrough
+            if message["type"] == "http.response.start":
+                start.update(message)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                return await send(message)
+
+            body = message.get("body", b"")
+            headers = list(start.get("headers", []))
+            if message.get("more_body") or not self.compressor.should_compress(headers, body):
+                passthrough = True
+                if self.compressor.negotiable(headers):
+                    start["headers"] = vary_accept_encoding(headers)
+                await send(start)
+                return await send(message)
+
+            compressed = self.compressor.compress(body, encoding)
+            await send({**start, "headers": encoded_headers(headers, encoding, len(compressed))})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, compress_send)
+
+    def _with_vary(self, send):
+        """send, adding Vary to identity responses another client could get compressed"""
+        async def vary_send(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                if self.compressor.negotiable(headers):
+                    message = {**message, "headers": vary_accept_encoding(headers)}
+            await send(message)
+
+        return vary_send
@@ -0,0 +1,191 @@
+"""
+Conditional GET: ETag and Last-Modified validators with 304 Not Modified.
+
+For routes backed by versioned collections, a resolver supplies a Validator
+from cheap metadata (collection versions, a document's updated_at) before the
+route runs. A request whose If-None-Match (or, without one, If-Modified-Since)
+still matches is answered with 304 without touching the route, the response
+cache or Mongo beyond that metadata. The validator tag is also placed in the
+scope under DATA_VERSION_KEY, which ResponseCacheMiddleware adds to its cache
+key, so a cached body is never served under a newer tag.
+
+ETags are strong and per representation: the content-coding the response was
+sent with is appended ("<tag>-br"), since compressed and identity bodies
+differ byte for byte. Other 200 GET responses are tagged with a hash of the
+body they send; that saves the transfer but not the work.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from compression import Compressor, request_accept_encoding
+
+Headers = List[Tuple[bytes, bytes]]
+
+DATA_VERSION_KEY = "data_version"
+
+
+@dataclass
+class Validator:
+    tag: str
+    last_modified: Optional[datetime] = None
+
+    @classmethod
+    def from_parts(cls, parts: Iterable[Any], last_modified: Optional[datetime] = None) -> "Validator":
+        digest = hashlib.blake2b("|".join(str(part) for part in parts).encode(), digest_size=12).hexdigest()
+        return cls(digest, last_modified)
+
+
+Resolver = Callable[[Dict[str, Any]], Awaitable[Optional[Validator]]]
+
+
+def entity_tag(tag: str, encoding: Optional[str] = None) -> str:
+    return f'"{tag}-{encoding}"' if encoding else f'"{tag}"'
+
+
+def http_date(value: datetime) -> str:
+    """RFC 7231 date; naive datetimes are UTC, as Mongo returns them"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _response_header(headers: Headers, name: bytes) -> Optional[bytes]:
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def etag_matches(if_none_match: str, etags: Iterable[str]) -> bool:
+    """Weak comparison, as RFC 7232 requires for If-None-Match"""
+    if if_none_match.strip() == "*":
+        return True
+    offered = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return any(etag in offered for etag in etags)
+
+
+def not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    # HTTP dates have one-second resolution
+    return last_modified.replace(microsecond=0) <= since
+
+
+class ConditionalGetMiddleware:
+    """
+    ASGI middleware adding ETag/Last-Modified to 200 GET responses and
+    answering matching conditional requests with 304. `resolve` returns the
+    Validator for a request, or None to fall back to hashing the body.
+    """
+
+    def __init__(self, app, resolve: Resolver, compressor: Optional[Compressor] = None):
+        self.app = app
+        self.resolve = resolve
+        self.compressor = compressor
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            return await self.app(scope, receive, send)
+
+        try:
+            validator = await self.resolve(scope)
+        except Exception:
+            # No validators is always safe; the request is served in full
+            return await self.app(scope, receive, send)
+
+        if validator is None:
+            return await self._tag_by_content(scope, receive, send)
+
+        scope[DATA_VERSION_KEY] = validator.tag
+        encoding = self.compressor.negotiate(request_accept_encoding(scope)) if self.compressor else None
+        # Small bodies go out uncompressed even when an encoding was negotiated
+        candidates = [entity_tag(validator.tag, encoding), entity_tag(validator.tag)]
+        fresh = self._fresh_etag(scope, candidates, validator.last_modified)
+        if fresh is not None:
+            headers = [(b"etag", fresh.encode())]
+            if self.compressor:
+                headers.append((b"vary", b"Accept-Encoding"))
+            return await self._send_not_modified(send, headers, validator.last_modified)
+
+        async def send_with_validators(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = list(message.get("headers", []))
+                sent_encoding = _response_header(headers, b"content-encoding")
+                etag = entity_tag(validator.tag, sent_encoding.decode("latin-1") if sent_encoding else None)
+                headers.append((b"etag", etag.encode()))
+                if validator.last_modified is not None:
+                    headers.append((b"last-modified", http_date(validator.last_modified).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_validators)
+
+    def _fresh_etag(self, scope, etags: List[str], last_modified: Optional[datetime]) -> Optional[str]:
+        """The ETag to answer 304 with when the client's copy is current, else None"""
+        if_none_match = _header(scope, b"if-none-match")
+        if if_none_match is not None:
+            return next((etag for etag in etags if etag_matches(if_none_match, [etag])), None)
+        if_modified_since = _header(scope, b"if-modified-since")
+        if if_modified_since is not None and last_modified is not None:
+            if not_modified_since(if_modified_since, last_modified):
+                return etags[0]
+        return None
+
+    async def _send_not_modified(self, send, headers: Headers, last_modified: Optional[datetime]):
+        if last_modified is not None:
+            headers.append((b"last-modified", http_date(last_modified).encode()))
+        await send({"type": "http.response.start", "status": 304, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _tag_by_content(self, scope, receive, send):
+        """Buffer single-message 200 bodies to hash them; streamed bodies pass through untagged"""
+        start: Dict[str, Any] = {}
+        passthrough = False
+
+        async def capture(message):
+            nonlocal passthrough
+            if passthrough:
+                return await send(message)
+            if message["type"] == "http.response.start":
+                if message["status"] != 200:
+                    passthrough = True
+                    return await send(message)
+                start.update(message)
+                return
+            if message["type"] != "http.response.body":
+                return await send(message)
+            body = message.get("body", b"")
+            if message.get("more_body", False):
+                passthrough = True
+                await send(start)
+                return await send(message)
+
+            etag = entity_tag(hashlib.blake2b(body, digest_size=12).hexdigest())
+            if_none_match = _header(scope, b"if-none-match")
+            if if_none_match is not None and etag_matches(if_none_match, [etag]):
+                headers = [(b"etag", etag.encode())]
+                vary = _response_header(start.get("headers", []), b"vary")
+                if vary is not None:
+                    headers.append((b"vary", vary))
+                return await self._send_not_modified(send, headers, None)
+            await send({**start, "headers": list(start.get("headers", [])) + [(b"etag", etag.encode())]})
+            await send(message)
+
+        await self.app(scope, receive, capture)
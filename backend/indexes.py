@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Index management for the GTM portfolio collections.
+
+REQUIRED_INDEXES declares every index the API relies on. ensure_indexes()
+creates any that are missing and is safe to run repeatedly; it is called at
+app startup and from the command line:
+
+    python indexes.py ensure
+    python indexes.py report
+
+The report (missing, undeclared and unused indexes) is also served at
+GET /api/admin/indexes.
+"""
+
+import argparse
+import json
+from typing import Any, Dict, List
+
+from pymongo import ASCENDING, DESCENDING, TEXT, IndexModel
+from pymongo.errors import OperationFailure
+
+from search import CASE_STUDY_SEARCH_WEIGHTS, FRAMEWORK_SEARCH_WEIGHTS
+
+REQUIRED_INDEXES: Dict[str, List[IndexModel]] = {
+    "case_studies": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        # Listing sorts: (sort key, id) so keyset pages walk the index in either direction
+        IndexModel([("success_rate", ASCENDING), ("id", ASCENDING)], name="success_rate_id"),
+        IndexModel([("company_name", ASCENDING), ("id", ASCENDING)], name="company_name_id"),
+        IndexModel([("created_at", ASCENDING), ("id", ASCENDING)], name="created_at_id"),
+        # Listing filters: equality first, then the success_rate sort/range (ESR order)
+        IndexModel([("company_type", ASCENDING), ("success_rate", ASCENDING), ("id", ASCENDING)],
+                   name="company_type_success_rate_id"),
+        IndexModel([("industry", ASCENDING), ("success_rate", ASCENDING), ("id", ASCENDING)],
+                   name="industry_success_rate_id"),
+        IndexModel([("product_category", ASCENDING), ("success_rate", ASCENDING), ("id", ASCENDING)],
+                   name="product_category_success_rate_id"),
+        # Numeric shadows written by normalization.py
+        IndexModel([("numeric.key_metrics.ltv_cac_ratio.value", DESCENDING)], name="numeric_ltv_cac_ratio"),
+        IndexModel([("numeric.key_metrics.customer_acquisition_cost.value", ASCENDING)], name="numeric_cac"),
+        IndexModel([("numeric.key_metrics.churn_rate.value", ASCENDING)], name="numeric_churn_rate"),
+        IndexModel([("numeric.market_research.total_addressable_market.value", DESCENDING)], name="numeric_tam"),
+        IndexModel([("numeric.revenue_impact.value", DESCENDING)], name="numeric_revenue_impact"),
+        # /api/search; a collection can have only one text index
+        IndexModel([(field, TEXT) for field in CASE_STUDY_SEARCH_WEIGHTS], name="search_text",
+                   weights=CASE_STUDY_SEARCH_WEIGHTS, default_language="english"),
+    ],
+    "frameworks": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([(field, TEXT) for field in FRAMEWORK_SEARCH_WEIGHTS], name="search_text",
+                   weights=FRAMEWORK_SEARCH_WEIGHTS, default_language="english"),
+    ],
+    "metrics": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("case_study_id", ASCENDING)], name="case_study_id"),
+    ],
+}
+
+
+def _key(spec) -> tuple:
+    """Normalise an index key (SON from IndexModel or pairs from index_information)"""
+    pairs = spec.items() if hasattr(spec, "items") else spec
+    return tuple((field, direction) for field, direction in pairs)
+
+
+def ensure_collection_indexes(collection, models: List[IndexModel]) -> List[str]:
+    """Create the given indexes on one collection unless an equivalent one exists"""
+    # Match on key pattern so an equivalent index under another name is not rebuilt;
+    # text indexes are stored under an internal key, so match those by name
+    information = collection.index_information()
+    existing = {_key(info["key"]) for info in information.values()}
+    missing = [
+        model for model in models
+        if model.document["name"] not in information and _key(model.document["key"]) not in existing
+    ]
+    return collection.create_indexes(missing) if missing else []
+
+
+def ensure_indexes(db) -> Dict[str, List[str]]:
+    """Create any declared index that does not exist yet, returning the names created"""
+    return {
+        collection_name: ensure_collection_indexes(db[collection_name], models)
+        for collection_name, models in REQUIRED_INDEXES.items()
+    }
+
+
+def _index_usage(collection) -> Dict[str, int]:
+    """Operations served per index since the server started, if $indexStats is available"""
+    try:
+        stats = collection.aggregate([{"$indexStats": {}}])
+        return {entry["name"]: entry["accesses"]["ops"] for entry in stats}
+    except (OperationFailure, NotImplementedError):
+        return {}
+
+
+def index_report(db) -> Dict[str, Dict[str, Any]]:
+    """Compare declared indexes against the live ones for every collection"""
+    report = {}
+    for collection_name, models in REQUIRED_INDEXES.items():
+        collection = db[collection_name]
+        existing = set(collection.index_information())
+        declared = {model.document["name"] for model in models}
+        usage = _index_usage(collection)
+        report[collection_name] = {
+            "missing": sorted(declared - existing),
+            "undeclared": sorted(existing - declared - {"_id_"}),
+            "unused": sorted(name for name, ops in usage.items() if ops == 0 and name != "_id_"),
+            "usage": usage,
+        }
+    return report
+
+
+if __name__ == "__main__":
+    import repository
+
+    db = repository.connect()
+
+    parser = argparse.ArgumentParser(description="Manage MongoDB indexes for the GTM portfolio")
+    parser.add_argument("command", choices=["ensure", "report"])
+    args = parser.parse_args()
+
+    if args.command == "ensure":
+        for collection_name, names in ensure_indexes(db).items():
+            print(f"{collection_name}: created {', '.join(names) if names else 'nothing (up to date)'}")
+    else:
+        print(json.dumps(index_report(db), indent=2))
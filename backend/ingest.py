@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Chunked, idempotent bulk ingest for the GTM portfolio collections.
+
+Documents are streamed from JSON (a top-level array) or NDJSON files,
+validated against the Pydantic models in models.py and written in fixed-size
+chunks as unordered bulk_write upserts keyed on `id`, so re-running the same
+import changes nothing and an interrupted one can simply be restarted.
+Case studies get their `numeric` shadow fields computed on the way in.
+
+With --swap every collection is loaded into a `<name>__staging` copy, indexed,
+and only then renamed over the live collection (dropTarget), so readers see
+either the old dataset or the new one, never a partial load:
+
+    python ingest.py case_studies data/case_studies.ndjson
+    python ingest.py --swap case_studies cases.ndjson frameworks frameworks.json metrics metrics.ndjson
+"""
+
+import argparse
+import sys
+import time
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type
+
+from bson import json_util
+from pydantic import BaseModel, ValidationError
+from pymongo import UpdateOne
+
+from indexes import REQUIRED_INDEXES, ensure_collection_indexes, ensure_indexes
+from models import CaseStudy, GTMFramework, Metric
+from normalization import normalize_case_study
+from stats import rebuild_dashboard_stats
+from versions import bump_versions
+
+MODELS: Dict[str, Type[BaseModel]] = {
+    "case_studies": CaseStudy,
+    "frameworks": GTMFramework,
+    "metrics": Metric,
+}
+STAGING_SUFFIX = "__staging"
+DEFAULT_CHUNK_SIZE = 1000
+# Validation errors kept per collection for the report
+MAX_REPORTED_ERRORS = 20
+
+
+@dataclass
+class IngestReport:
+    collection: str
+    read: int = 0
+    invalid: int = 0
+    upserted: int = 0
+    modified: int = 0
+    unchanged: int = 0
+    seconds: float = 0.0
+    errors: List[str] = field(default_factory=list)
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.read / self.seconds if self.seconds else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.collection}: {self.read} read, {self.upserted} inserted, {self.modified} updated, "
+            f"{self.unchanged} unchanged, {self.invalid} invalid in {self.seconds:.2f}s "
+            f"({self.docs_per_second:,.0f} docs/s)"
+        )
+
+
+def read_documents(path: str) -> Iterator[Dict[str, Any]]:
+    """Documents from a JSON array file or an NDJSON file (one object per line, streamed)"""
+    with open(path, encoding="utf-8") as handle:
+        if path.endswith(".json"):
+            documents = json_util.loads(handle.read())
+            yield from documents if isinstance(documents, list) else [documents]
+            return
+        for line in handle:
+            if line.strip():
+                yield json_util.loads(line)
+
+
+def chunks(documents: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    iterator = iter(documents)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def prepare(collection_name: str, document: Dict[str, Any]) -> Dict[str, Any]:
+    """Validate one document against its model and return what gets stored"""
+    prepared = MODELS[collection_name].model_validate(document).model_dump()
+    if collection_name == "case_studies":
+        prepared = normalize_case_study(prepared)
+    return prepared
+
+
+def _upsert(document: Dict[str, Any]) -> UpdateOne:
+    fields = dict(document)
+    # created_at records the first import; later imports must not move it
+    created_at = fields.pop("created_at", None)
+    update: Dict[str, Any] = {"$set": fields}
+    if created_at is not None:
+        update["$setOnInsert"] = {"created_at": created_at}
+    return UpdateOne({"id": document["id"]}, update, upsert=True)
+
+
+def ingest(
+    db,
+    collection_name: str,
+    documents: Iterable[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    target: Optional[str] = None,
+    strict: bool = False,
+) -> IngestReport:
+    """
+    Upsert `documents` into `target` (default: the collection itself) chunk by
+    chunk. Invalid documents are skipped and counted, or raise ValueError
+    when `strict` is set.
+    """
+    collection = db[target or collection_name]
+    report = IngestReport(collection_name)
+    started = time.perf_counter()
+    for chunk in chunks(documents, chunk_size):
+        operations = []
+        for document in chunk:
+            report.read += 1
+            if not isinstance(document, dict):
+                message = f"document {report.read}: expected an object, got {type(document).__name__}"
+            else:
+                try:
+                    operations.append(_upsert(prepare(collection_name, document)))
+                    continue
+                except ValidationError as e:
+                    message = f"document {report.read} (id={document.get('id')!r}): {e.errors()[0]['loc']} {e.errors()[0]['msg']}"
+            if strict:
+                raise ValueError(f"{collection_name} {message}")
+            report.invalid += 1
+            if len(report.errors) < MAX_REPORTED_ERRORS:
+                report.errors.append(message)
+        if not operations:
+            continue
+        result = collection.bulk_write(operations, ordered=False)
+        report.upserted += result.upserted_count
+        report.modified += result.modified_count
+        report.unchanged += result.matched_count - result.modified_count
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def ingest_collections(
+    db,
+    sources: Dict[str, Iterable[Dict[str, Any]]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    swap: bool = False,
+    strict: bool = False,
+) -> List[IngestReport]:
+    """
+    Ingest several collections, then refresh everything derived from them:
+    indexes, the dashboard stats document and the data versions.
+
+    With `swap`, all collections are fully loaded and indexed in staging
+    first; the renames happen back to back at the end, each one atomic.
+    """
+    unknown = set(sources) - set(MODELS)
+    if unknown:
+        raise ValueError(f"Unknown collections: {', '.join(sorted(unknown))}")
+
+    reports = []
+    for collection_name, documents in sources.items():
+        target = create_staging(db, collection_name) if swap else None
+        try:
+            reports.append(ingest(db, collection_name, documents, chunk_size, target, strict))
+        except Exception:
+            for name in sources:
+                db.drop_collection(name + STAGING_SUFFIX)
+            raise
+        if target:
+            index_staging(db, collection_name)
+
+    if swap:
+        swap_in(db, list(sources))
+    refresh_derived(db, list(sources))
+    return reports
+
+
+def create_staging(db, collection_name: str) -> str:
+    """
+    Empty `<name>__staging` holding only the unique id index: upserts during the
+    load are index lookups, not scans of an unindexed collection, while the
+    remaining indexes are built once at the end by index_staging()
+    """
+    target = collection_name + STAGING_SUFFIX
+    db.drop_collection(target)
+    id_index = [model for model in REQUIRED_INDEXES[collection_name] if model.document["name"] == "id_unique"]
+    ensure_collection_indexes(db[target], id_index)
+    return target
+
+
+def index_staging(db, collection_name: str) -> List[str]:
+    """Build every declared index on a loaded staging collection, before it is swapped in"""
+    return ensure_collection_indexes(db[collection_name + STAGING_SUFFIX], REQUIRED_INDEXES[collection_name])
+
+
+def swap_in(db, collection_names: List[str]) -> None:
+    """Rename fully loaded staging collections over the live ones"""
+    for collection_name in collection_names:
+        db[collection_name + STAGING_SUFFIX].rename(collection_name, dropTarget=True)
+
+
+def refresh_derived(db, collection_names: List[str]) -> None:
+    """Bring indexes, dashboard stats and data versions up to date after a bulk load"""
+    ensure_indexes(db)
+    if "case_studies" in collection_names:
+        rebuild_dashboard_stats(db)
+    bump_versions(db, *collection_names)
+
+
+if __name__ == "__main__":
+    import repository
+
+    db = repository.connect()
+
+    parser = argparse.ArgumentParser(description="Bulk-load case studies, frameworks and metrics")
+    parser.add_argument("sources", nargs="+", metavar="COLLECTION PATH",
+                        help=f"pairs of collection ({', '.join(MODELS)}) and JSON/NDJSON file")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--swap", action="store_true", help="load into staging and replace the collections atomically")
+    parser.add_argument("--strict", action="store_true", help="abort on the first invalid document")
+    args = parser.parse_args()
+
+    if len(args.sources) % 2:
+        parser.error("sources must be COLLECTION PATH pairs")
+    pairs = dict(zip(args.sources[::2], args.sources[1::2]))
+
+    try:
+        reports = ingest_collections(
+            db,
+            {name: read_documents(path) for name, path in pairs.items()},
+            chunk_size=args.chunk_size,
+            swap=args.swap,
+            strict=args.strict,
+        )
+    except ValueError as e:
+        print(f"Ingest failed: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    for report in reports:
+        print(report.summary())
+        for error in report.errors:
+            print(f"  invalid {error}", file=sys.stderr)
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Production entry point: runs the API in several worker processes on one port.
+
+Each worker binds its own socket with SO_REUSEPORT, so the kernel spreads
+incoming connections across workers without a shared accept queue. A worker's
+socket only starts listening once the app's lifespan startup has finished
+(Mongo pool warm-up, index check, response cache priming), so no connection
+reaches a cold worker.
+
+On SIGTERM or SIGINT the supervisor forwards SIGTERM to every worker; each one
+stops accepting, lets in-flight requests finish for up to --graceful-timeout
+seconds, runs the lifespan shutdown and exits. Workers still alive after that
+(plus a short grace period) are killed. A worker that exits on its own while
+the supervisor is running is restarted.
+
+`python server.py` remains the single-process development server.
+
+Usage (from backend/):
+    python launcher.py --workers 4 --port 8001
+    WEB_CONCURRENCY=8 python launcher.py
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger("launcher")
+
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+HOST = os.getenv("HOST", "0.0.0.0")
+PORT = int(os.getenv("PORT", "8001"))
+# Seconds a worker waits for in-flight requests after SIGTERM before closing them
+GRACEFUL_SHUTDOWN_TIMEOUT = float(os.getenv("GRACEFUL_SHUTDOWN_TIMEOUT", "30"))
+# Crash loops back off instead of respawning as fast as workers die
+RESTART_BACKOFF_SECONDS = 1.0
+
+
+def bind_socket(host: str, port: int) -> socket.socket:
+    """
+    A bound but not yet listening socket with SO_REUSEPORT set. The kernel only
+    routes connections to it once uvicorn calls listen() after startup.
+    """
+    if not hasattr(socket, "SO_REUSEPORT"):
+        raise RuntimeError("SO_REUSEPORT is not available on this platform; run server.py instead")
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def run_worker(host: str, port: int, graceful_timeout: float, log_level: str, access_log: bool) -> None:
+    """Worker process body: import the app, bind, and serve until SIGTERM/SIGINT"""
+    import uvicorn
+
+    from server import app
+
+    sock = bind_socket(host, port)
+    config = uvicorn.Config(
+        app,
+        lifespan="on",
+        log_level=log_level,
+        access_log=access_log,
+        timeout_graceful_shutdown=graceful_timeout,
+    )
+    # Server.run installs uvicorn's SIGTERM/SIGINT handlers, which start the graceful drain
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+class Supervisor:
+    def __init__(self, workers: int, host: str, port: int, graceful_timeout: float,
+                 log_level: str = "info", access_log: bool = False):
+        self.workers = workers
+        self.worker_args = (host, port, graceful_timeout, log_level, access_log)
+        self.graceful_timeout = graceful_timeout
+        # spawn rather than fork: every worker gets a fresh interpreter and its own Mongo client
+        self.context = multiprocessing.get_context("spawn")
+        self.processes: Dict[int, multiprocessing.Process] = {}
+        self.stopping = False
+
+    def spawn(self, slot: int) -> None:
+        process = self.context.Process(target=run_worker, args=self.worker_args, name=f"worker-{slot}")
+        process.start()
+        self.processes[slot] = process
+        logger.info("Started worker %d (pid %d)", slot, process.pid)
+
+    def handle_signal(self, signum, frame) -> None:
+        if not self.stopping:
+            logger.info("Received %s, draining workers", signal.Signals(signum).name)
+        self.stopping = True
+
+    def run(self) -> int:
+        # Fail fast in the supervisor if the port is unusable, rather than in every worker
+        bind_socket(*self.worker_args[:2]).close()
+
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            signal.signal(signum, self.handle_signal)
+        for slot in range(self.workers):
+            self.spawn(slot)
+
+        last_restart: Dict[int, float] = {}
+        while not self.stopping:
+            time.sleep(0.2)
+            for slot, process in list(self.processes.items()):
+                if process.is_alive() or self.stopping:
+                    continue
+                logger.warning("Worker %d (pid %d) exited with code %s", slot, process.pid, process.exitcode)
+                if time.monotonic() - last_restart.get(slot, 0.0) < RESTART_BACKOFF_SECONDS:
+                    time.sleep(RESTART_BACKOFF_SECONDS)
+                last_restart[slot] = time.monotonic()
+                self.spawn(slot)
+        return self.drain()
+
+    def drain(self) -> int:
+        """SIGTERM every worker, wait for the graceful period, then kill stragglers"""
+        for process in self.processes.values():
+            if process.is_alive():
+                os.kill(process.pid, signal.SIGTERM)
+
+        # uvicorn's own timeout covers in-flight requests; the extra seconds cover lifespan shutdown
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        for process in self.processes.values():
+            process.join(max(0.0, deadline - time.monotonic()))
+
+        killed = 0
+        for slot, process in self.processes.items():
+            if process.is_alive():
+                logger.warning("Worker %d (pid %d) did not drain in time, killing it", slot, process.pid)
+                process.kill()
+                process.join()
+                killed += 1
+        logger.info("All workers stopped")
+        return 1 if killed else 0
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=WEB_CONCURRENCY, help="worker processes (default WEB_CONCURRENCY or CPU count)")
+    parser.add_argument("--host", default=HOST)
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--graceful-timeout", type=float, default=GRACEFUL_SHUTDOWN_TIMEOUT,
+                        help="seconds to let in-flight requests finish on shutdown")
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--access-log", action="store_true")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=args.log_level.upper(), format="%(asctime)s %(name)s %(levelname)s %(message)s")
+    supervisor = Supervisor(args.workers, args.host, args.port, args.graceful_timeout, args.log_level, args.access_log)
+    return supervisor.run()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
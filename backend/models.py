@@ -0,0 +1,50 @@
+"""
+Pydantic models for the stored documents, shared by the API and the ingest pipeline.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List
+
+from pydantic import BaseModel
+
+
+class CaseStudy(BaseModel):
+    id: str
+    company_name: str
+    company_type: str  # "startup" or "mnc"
+    industry: str
+    product_category: str
+    challenge: str
+    solution_overview: str
+    market_research: Dict[str, Any]
+    competitive_analysis: Dict[str, Any]
+    pricing_strategy: Dict[str, Any]
+    channel_strategy: Dict[str, Any]
+    execution_timeline: List[Dict[str, Any]]
+    key_metrics: Dict[str, Any]
+    success_rate: float
+    revenue_impact: str
+    # Parsed numeric shadows of the display-string KPIs (see normalization.py)
+    numeric: Dict[str, Any] = {}
+    created_at: datetime
+    updated_at: datetime
+
+
+class GTMFramework(BaseModel):
+    id: str
+    name: str
+    description: str
+    phases: List[Dict[str, Any]]
+    success_rate: float
+    use_cases: List[str]
+    created_at: datetime
+
+
+class Metric(BaseModel):
+    id: str
+    case_study_id: str
+    metric_name: str
+    metric_value: float
+    metric_unit: str
+    time_period: str
+    category: str  # "market", "pricing", "channel", "revenue"
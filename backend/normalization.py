@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Ingest-time normalization of display-string KPIs.
+
+Case studies store figures as display strings ("$2,847", "10.0x", "3.2%",
+"$847K", "$47.2B", "4.2 months"). normalize_case_study() parses them into a
+`numeric` shadow object mirroring the source paths, e.g.
+
+    numeric.key_metrics.monthly_recurring_revenue = {"value": 847000.0, "unit": "USD", "scale": 1000}
+
+so Mongo can sort, filter and aggregate on real numbers while the original
+strings stay untouched for display. `value` is already multiplied by `scale`.
+
+Existing documents are backfilled with:
+
+    python normalization.py backfill [--all] [--batch-size 500]
+"""
+
+import argparse
+import re
+from typing import Any, Dict, Optional
+
+from pymongo import UpdateOne
+
+from versions import bump_versions
+
+CURRENCIES = {"$": "USD", "€": "EUR", "£": "GBP"}
+SCALES = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000, "T": 1_000_000_000_000}
+SCALE_WORDS = {"thousand": "K", "million": "M", "billion": "B", "trillion": "T"}
+DURATION_UNITS = {
+    "day": "days", "week": "weeks", "wk": "weeks", "month": "months", "mo": "months", "year": "years", "yr": "years",
+}
+
+# Sub-document keys to normalize; None means every key of that sub-document
+NORMALIZED_FIELDS = {
+    "key_metrics": None,
+    "market_research": ["total_addressable_market", "serviceable_addressable_market", "target_segment_size"],
+    "channel_strategy": ["average_sales_cycle"],
+}
+# Top-level string fields to normalize
+NORMALIZED_SCALARS = ["revenue_impact"]
+
+_QUANTITY = re.compile(
+    r"""^\s*(?P<currency>[$€£])?\s*
+        (?P<number>\d[\d,]*(?:\.\d+)?|\.\d+)\s*
+        (?:(?P<scale>[KMBT]|(?i:thousand|million|billion|trillion))(?![A-Za-z])
+          |(?P<ratio>[xX])(?![A-Za-z])|(?P<percent>%)|(?P<word>[A-Za-z]+))?""",
+    re.VERBOSE,
+)
+
+
+def parse_quantity(raw: Any) -> Optional[Dict[str, Any]]:
+    """Parse one display value into {"value", "unit", "scale"}, or None if it is not numeric"""
+    if isinstance(raw, bool):
+        return None
+    if isinstance(raw, (int, float)):
+        return {"value": float(raw), "unit": "count", "scale": 1}
+    if not isinstance(raw, str):
+        return None
+
+    match = _QUANTITY.match(raw)
+    if not match:
+        return None
+
+    number = float(match["number"].replace(",", ""))
+    scale = SCALES.get(SCALE_WORDS.get((match["scale"] or "").lower(), match["scale"]), 1)
+    if match["currency"]:
+        unit = CURRENCIES[match["currency"]]
+    elif match["ratio"]:
+        unit = "ratio"
+    elif match["percent"]:
+        unit = "percent"
+    elif match["word"] and match["word"].lower().rstrip("s") in DURATION_UNITS:
+        unit = DURATION_UNITS[match["word"].lower().rstrip("s")]
+    else:
+        unit = "count"
+    return {"value": number * scale, "unit": unit, "scale": scale}
+
+
+def normalize_case_study(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Return `doc` with its `numeric` shadow object (re)computed from the display strings"""
+    numeric: Dict[str, Any] = {}
+    for field, keys in NORMALIZED_FIELDS.items():
+        source = doc.get(field)
+        if not isinstance(source, dict):
+            continue
+        parsed = {}
+        for key in keys if keys is not None else source:
+            quantity = parse_quantity(source.get(key))
+            if quantity is not None:
+                parsed[key] = quantity
+        if parsed:
+            numeric[field] = parsed
+    for field in NORMALIZED_SCALARS:
+        quantity = parse_quantity(doc.get(field))
+        if quantity is not None:
+            numeric[field] = quantity
+    return {**doc, "numeric": numeric}
+
+
+def backfill(db, only_missing: bool = True, batch_size: int = 500) -> int:
+    """Compute `numeric` for stored case studies; returns the number of documents updated"""
+    query = {"numeric": {"$exists": False}} if only_missing else {}
+    projection = {field: 1 for field in [*NORMALIZED_FIELDS, *NORMALIZED_SCALARS]}
+    updated = 0
+    operations = []
+    for doc in db.case_studies.find(query, projection, batch_size=batch_size):
+        operations.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"numeric": normalize_case_study(doc)["numeric"]}}))
+        if len(operations) >= batch_size:
+            updated += db.case_studies.bulk_write(operations, ordered=False).modified_count
+            operations = []
+    if operations:
+        updated += db.case_studies.bulk_write(operations, ordered=False).modified_count
+    if updated:
+        # Invalidates ETags and cached responses that include the old numeric fields
+        bump_versions(db, "case_studies")
+    return updated
+
+
+if __name__ == "__main__":
+    import repository
+
+    db = repository.connect()
+
+    parser = argparse.ArgumentParser(description="Normalize display-string KPIs into numeric fields")
+    parser.add_argument("command", choices=["backfill"])
+    parser.add_argument("--all", action="store_true", help="recompute documents that already have numeric fields")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    count = backfill(db, only_missing=not args.all, batch_size=args.batch_size)
+    print(f"Normalized {count} case studies")
@@ -0,0 +1,82 @@
+"""
+Keyset (cursor) pagination helpers.
+
+A cursor is the sort spec plus the sort-key values of the last document on a
+page, serialised with bson's extended JSON (so datetimes round-trip) and
+base64url-encoded.
+The next page is fetched with a range filter on those values instead of a
+skip, so every page costs the same regardless of how deep it is.
+"""
+
+import base64
+import binascii
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from bson import json_util
+
+Sort = List[Tuple[str, int]]
+
+
+def _get_path(doc: Dict[str, Any], path: str) -> Any:
+    for part in path.split("."):
+        doc = doc.get(part) if isinstance(doc, dict) else None
+    return doc
+
+
+def encode_cursor(doc: Dict[str, Any], sort: Sort) -> str:
+    payload = {"sort": [[field, direction] for field, direction in sort],
+               "values": [_get_path(doc, field) for field, _ in sort]}
+    raw = json_util.dumps(payload).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: Sort) -> List[Any]:
+    """Raises ValueError if the cursor is malformed or was issued for another sort"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json_util.loads(raw)
+    except (binascii.Error, ValueError, UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("Invalid pagination cursor")
+    if not isinstance(payload, dict) or not isinstance(payload.get("values"), list):
+        raise ValueError("Invalid pagination cursor")
+    if payload.get("sort") != [[field, direction] for field, direction in sort]:
+        raise ValueError("Pagination cursor was issued for a different sort order")
+    return payload["values"]
+
+
+def keyset_filter(values: List[Any], sort: Sort) -> Dict[str, Any]:
+    """Match documents strictly after `values` in `sort` order"""
+    clauses = []
+    for i, (field, direction) in enumerate(sort):
+        clause = {prev_field: values[j] for j, (prev_field, _) in enumerate(sort[:i])}
+        clause[field] = {"$gt" if direction > 0 else "$lt": values[i]}
+        clauses.append(clause)
+    return clauses[0] if len(clauses) == 1 else {"$or": clauses}
+
+
+def project_sort_fields(projection: Dict[str, Any], sort: Sort) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Make sure the sort keys come back from Mongo so a cursor can be built from
+    the last document. Returns the adjusted projection and the fields that were
+    added only for that purpose and should be stripped from the response.
+    """
+    inclusive = any(value == 1 for key, value in projection.items() if key != "_id")
+    projection = dict(projection)
+    hidden = []
+    for field, _ in sort:
+        if inclusive and not any(field == path or field.startswith(path + ".") for path in projection):
+            projection[field] = 1
+            hidden.append(field)
+        elif not inclusive and projection.get(field) == 0:
+            del projection[field]
+            hidden.append(field)
+    return projection, hidden
+
+
+def paginate_query(query: Dict[str, Any], sort: Sort, after: Optional[str]) -> Dict[str, Any]:
+    """Combine a base filter with the keyset filter for the page after `after`"""
+    if not after:
+        return query
+    after_filter = keyset_filter(decode_cursor(after, sort), sort)
+    return {"$and": [query, after_filter]} if query else after_filter
@@ -0,0 +1,65 @@
+"""
+Sparse fieldsets: turn `fields` / `exclude` query parameters into Mongo projections.
+
+Both parameters are comma-separated lists of field paths. The first segment
+of every path must be a field on the Pydantic model for the resource; further
+dotted segments (e.g. `key_metrics.ltv_cac_ratio`) are only accepted for
+fields that hold nested documents or lists, since their inner shape is free-form.
+"""
+
+from typing import Any, Dict, List, Optional, Type, get_origin
+
+from pydantic import BaseModel
+
+
+def parse_field_list(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [field.strip() for field in value.split(",") if field.strip()]
+
+
+def _validate_path(model: Type[BaseModel], path: str) -> None:
+    root, _, rest = path.partition(".")
+    field = model.model_fields.get(root)
+    if field is None:
+        raise ValueError(f"Unknown field '{root}' for {model.__name__}")
+    if rest and get_origin(field.annotation) not in (dict, list):
+        raise ValueError(f"Field '{root}' of {model.__name__} has no nested fields")
+
+
+def _collapse(paths: List[str]) -> List[str]:
+    """Drop duplicates and paths already covered by a parent (Mongo rejects path collisions)"""
+    kept = []
+    for path in sorted(set(paths)):
+        if not any(path.startswith(parent + ".") for parent in kept):
+            kept.append(path)
+    return kept
+
+
+def build_projection(
+    model: Type[BaseModel],
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+    default_fields: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """
+    Build a projection for `model`. `fields` replaces the default field set;
+    `exclude` removes paths from it. `default_fields` of None means the whole
+    document. Raises ValueError for unknown paths or when both are given.
+    """
+    include = parse_field_list(fields)
+    omit = parse_field_list(exclude)
+    if include and omit:
+        raise ValueError("Use either 'fields' or 'exclude', not both")
+    for path in include + omit:
+        _validate_path(model, path)
+
+    if include:
+        return {"_id": 0, **{path: 1 for path in _collapse(include)}}
+    if default_fields is not None:
+        omitted = set(omit)
+        kept = [path for path in default_fields if path not in omitted]
+        if not kept:
+            raise ValueError("'exclude' removes every field")
+        return {"_id": 0, **{path: 1 for path in kept}}
+    return {"_id": 0, **{path: 0 for path in _collapse(omit)}}
@@ -0,0 +1,442 @@
+"""
+Async data access layer for the GTM portfolio collections.
+
+pymongo is a blocking driver, so every query is executed on a bounded thread
+pool and the route coroutines await the result instead of stalling the event
+loop. Cursors are fully consumed inside the worker thread, except for
+iter_batches(), which pulls one batch per executor call for streaming.
+
+Importing this module does not connect: the app lifespan (or a CLI) calls
+connect(), which builds the MongoClient from the MONGO_* settings below, and
+shutdown() closes it. Reads that tolerate replication lag (listings, search,
+exports, analytics) go through `read_db`, which uses MONGO_READ_PREFERENCE;
+single-document reads stay on the primary so they see the latest write.
+
+Reads issued while an identical one is already in flight do not reach Mongo;
+they await the same result (see singleflight.py).
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from pymongo import MongoClient, read_preferences
+
+import analytics
+import benchmarking
+import search
+import singleflight
+import slow_queries
+import stats
+import telemetry
+import versions
+from pagination import Sort, encode_cursor, paginate_query, project_sort_fields
+
+
+def _env_int(name: str, default: Optional[int]) -> Optional[int]:
+    value = os.getenv(name, "")
+    return int(value) if value.strip() else default
+
+
+# MongoDB connection
+MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/gtm_portfolio_db")
+DATABASE_NAME = "gtm_portfolio_db"
+# Upper bound on Mongo operations in flight per worker process
+MONGO_MAX_CONCURRENCY = int(os.getenv("MONGO_MAX_CONCURRENCY", "32"))
+# Connection pool; keep max pool size >= MONGO_MAX_CONCURRENCY so executor threads never queue for a socket
+MONGO_MAX_POOL_SIZE = _env_int("MONGO_MAX_POOL_SIZE", 100)
+MONGO_MIN_POOL_SIZE = _env_int("MONGO_MIN_POOL_SIZE", 4)
+MONGO_MAX_IDLE_TIME_MS = _env_int("MONGO_MAX_IDLE_TIME_MS", None)
+MONGO_WAIT_QUEUE_TIMEOUT_MS = _env_int("MONGO_WAIT_QUEUE_TIMEOUT_MS", 10000)
+MONGO_CONNECT_TIMEOUT_MS = _env_int("MONGO_CONNECT_TIMEOUT_MS", 20000)
+MONGO_SOCKET_TIMEOUT_MS = _env_int("MONGO_SOCKET_TIMEOUT_MS", None)
+MONGO_SERVER_SELECTION_TIMEOUT_MS = _env_int("MONGO_SERVER_SELECTION_TIMEOUT_MS", 30000)
+# primary, primaryPreferred, secondary, secondaryPreferred or nearest; applies to read_db only
+MONGO_READ_PREFERENCE = os.getenv("MONGO_READ_PREFERENCE", "primary")
+MONGO_MAX_STALENESS_SECONDS = _env_int("MONGO_MAX_STALENESS_SECONDS", -1)
+# Identical concurrent reads share one query; callers wait at most the operation's timeout (seconds)
+SINGLE_FLIGHT_ENABLED = os.getenv("SINGLE_FLIGHT_ENABLED", "1") != "0"
+SINGLE_FLIGHT_TIMEOUT = float(os.getenv("SINGLE_FLIGHT_TIMEOUT", "10"))
+SINGLE_FLIGHT_TIMEOUTS = {
+    # Rebuilding the in-memory analytics indexes after a data change takes longer than a point read
+    "metrics_rollup": 60.0,
+    "benchmark_case_study": 60.0,
+    "benchmark_distributions": 60.0,
+    **singleflight.parse_timeouts(os.getenv("SINGLE_FLIGHT_TIMEOUTS", "")),
+}
+
+_READ_PREFERENCES = {
+    "primary": read_preferences.Primary,
+    "primaryPreferred": read_preferences.PrimaryPreferred,
+    "secondary": read_preferences.Secondary,
+    "secondaryPreferred": read_preferences.SecondaryPreferred,
+    "nearest": read_preferences.Nearest,
+}
+
+client: Optional[MongoClient] = None
+db = None
+read_db = None
+
+# Collections (primary)
+case_studies_collection = None
+frameworks_collection = None
+metrics_collection = None
+
+_executor: Optional[ThreadPoolExecutor] = None
+_rollup_cache = analytics.RollupCache()
+_benchmark_index = benchmarking.BenchmarkIndex()
+_flights = singleflight.SingleFlight(SINGLE_FLIGHT_TIMEOUT, SINGLE_FLIGHT_TIMEOUTS, SINGLE_FLIGHT_ENABLED)
+
+# Conditional GETs need the data versions on almost every request; one read per interval is shared
+VERSIONS_CACHE_TTL = float(os.getenv("VERSIONS_CACHE_TTL", "1"))
+_versions_snapshot: Tuple[float, Dict[str, int], Dict[str, Any]] = (float("-inf"), {}, {})
+
+
+def read_preference():
+    if MONGO_READ_PREFERENCE not in _READ_PREFERENCES:
+        raise ValueError(f"MONGO_READ_PREFERENCE must be one of: {', '.join(_READ_PREFERENCES)}")
+    if MONGO_READ_PREFERENCE == "primary":
+        return read_preferences.Primary()
+    return _READ_PREFERENCES[MONGO_READ_PREFERENCE](max_staleness=MONGO_MAX_STALENESS_SECONDS)
+
+
+def pool_settings() -> Dict[str, Any]:
+    settings = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGO_MAX_IDLE_TIME_MS,
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": MONGO_SOCKET_TIMEOUT_MS,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    }
+    return {name: value for name, value in settings.items() if value is not None}
+
+
+def connect(url: str = MONGO_URL):
+    """Create the shared client (once) and return the primary database handle"""
+    global client, db, read_db, case_studies_collection, frameworks_collection, metrics_collection
+    if client is not None:
+        return db
+    client = MongoClient(
+        url,
+        event_listeners=[telemetry.mongo_listener, telemetry.pool_stats, slow_queries.slow_query_log],
+        **pool_settings(),
+    )
+    slow_queries.slow_query_log.bind(client)
+    db = client.get_database(DATABASE_NAME)
+    read_db = client.get_database(DATABASE_NAME, read_preference=read_preference())
+    case_studies_collection = db.case_studies
+    frameworks_collection = db.frameworks
+    metrics_collection = db.metrics
+    return db
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=MONGO_MAX_CONCURRENCY, thread_name_prefix="mongo"
+        )
+    return _executor
+
+
+async def run(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking pymongo call on the Mongo executor and await its result"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_executor(), partial(fn, *args, **kwargs))
+
+
+async def _shared(operation: str, key_args: Tuple[Any, ...], fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """run(fn, *args), or join the identical read already in flight; key_args identify the read"""
+    key = singleflight.flight_key(*key_args)
+    return await _flights.do(operation, key, lambda: run(fn, *args, **kwargs))
+
+
+def ping() -> float:
+    """Round-trip a ping to the server, returning milliseconds"""
+    started = time.perf_counter()
+    client.admin.command("ping")
+    return (time.perf_counter() - started) * 1000
+
+
+async def warm_up() -> int:
+    """
+    Open connections up to minPoolSize before serving traffic by running that
+    many pings concurrently; the driver keeps the pool at that size afterwards.
+    """
+    await run(ping)
+    connections = min(MONGO_MIN_POOL_SIZE or 0, MONGO_MAX_CONCURRENCY)
+    await asyncio.gather(*(run(ping) for _ in range(connections)))
+    return connections
+
+
+def shutdown() -> None:
+    """Wait for in-flight queries, release the executor threads and close the client"""
+    global _executor, client, db, read_db, case_studies_collection, frameworks_collection, metrics_collection
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+    slow_queries.slow_query_log.shutdown()
+    if client is not None:
+        client.close()
+    client = db = read_db = None
+    case_studies_collection = frameworks_collection = metrics_collection = None
+
+
+def _find_all(collection, query: Dict[str, Any], projection: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return list(collection.find(query, projection))
+
+
+def _find_page(
+    collection,
+    query: Dict[str, Any],
+    projection: Dict[str, Any],
+    sort: Sort,
+    limit: int,
+    after: Optional[str],
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    projection, hidden = project_sort_fields(projection, sort)
+    # Fetch one extra document to learn whether another page exists
+    cursor = collection.find(paginate_query(query, sort, after), projection).sort(sort).limit(limit + 1)
+    docs = list(cursor)
+    next_cursor = encode_cursor(docs[limit - 1], sort) if len(docs) > limit else None
+    docs = docs[:limit]
+    for doc in docs:
+        for field in hidden:
+            doc.pop(field, None)
+    return docs, next_cursor
+
+
+async def iter_batches(
+    collection,
+    query: Dict[str, Any],
+    projection: Dict[str, Any],
+    batch_size: int,
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    """
+    Yield lists of up to `batch_size` documents from one server-side cursor.
+    The next batch is only fetched once the consumer asks for it, so a slow
+    reader holds at most one batch in memory.
+    """
+    cursor = await run(lambda: collection.find(query, projection, batch_size=batch_size))
+    try:
+        while True:
+            batch = await run(lambda: list(islice(cursor, batch_size)))
+            if not batch:
+                break
+            yield batch
+    finally:
+        await run(cursor.close)
+
+
+# Sort keys accepted by the case study listing; each has a compound (key, id) index
+CASE_STUDY_SORT_FIELDS = ["success_rate", "company_name", "created_at"]
+
+
+def case_study_sort(sort: Optional[str]) -> Sort:
+    """
+    Translate `field` / `-field` into a Mongo sort with `id` as tiebreaker.
+    The tiebreaker follows the primary direction so both ascending and
+    descending sorts walk the same (field, id) index.
+    """
+    if not sort:
+        return [("id", 1)]
+    direction = -1 if sort.startswith("-") else 1
+    field = sort.lstrip("-+")
+    if field not in CASE_STUDY_SORT_FIELDS:
+        raise ValueError(f"Cannot sort by '{field}'; choose from {', '.join(CASE_STUDY_SORT_FIELDS)}")
+    return [(field, direction), ("id", direction)]
+
+
+def case_study_filter(
+    company_type: Optional[str] = None,
+    industry: Optional[str] = None,
+    product_category: Optional[str] = None,
+    min_success_rate: Optional[float] = None,
+    max_success_rate: Optional[float] = None,
+) -> Dict[str, Any]:
+    query: Dict[str, Any] = {}
+    if company_type:
+        query["company_type"] = company_type
+    if industry:
+        query["industry"] = industry
+    if product_category:
+        query["product_category"] = product_category
+    if min_success_rate is not None or max_success_rate is not None:
+        query["success_rate"] = {}
+        if min_success_rate is not None:
+            query["success_rate"]["$gte"] = min_success_rate
+        if max_success_rate is not None:
+            query["success_rate"]["$lte"] = max_success_rate
+    return query
+
+
+# Queries
+async def list_case_studies(
+    limit: int,
+    after: Optional[str] = None,
+    projection: Optional[Dict[str, Any]] = None,
+    query: Optional[Dict[str, Any]] = None,
+    sort: Optional[Sort] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """One page of matching case studies plus the cursor for the next page"""
+    projection = projection or {"_id": 0}
+    query, sort = query or {}, sort or [("id", 1)]
+    return await _shared(
+        "list_case_studies", (limit, after, projection, query, sort),
+        _find_page, read_db.case_studies, query, projection, sort, limit, after,
+    )
+
+
+async def get_case_study(case_id: str, projection: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    projection = projection or {"_id": 0}
+    return await _shared("get_case_study", (case_id, projection), case_studies_collection.find_one, {"id": case_id}, projection)
+
+
+def _find_with_metrics(
+    case_id: str,
+    projection: Dict[str, Any],
+    categories: Optional[List[str]],
+) -> Optional[Dict[str, Any]]:
+    projection, hidden = project_sort_fields(projection, [("id", 1)])
+    pipeline: List[Dict[str, Any]] = [
+        {"$match": {"id": case_id}},
+        {"$limit": 1},
+        {"$project": projection},
+        # localField/foreignField lets the join use the metrics.case_study_id index
+        {"$lookup": {"from": metrics_collection.name, "localField": "id", "foreignField": "case_study_id", "as": "metrics"}},
+    ]
+    if categories:
+        pipeline.append({"$addFields": {"metrics": {"$filter": {
+            "input": "$metrics", "as": "metric", "cond": {"$in": ["$$metric.category", categories]},
+        }}}})
+    pipeline.append({"$project": {"metrics._id": 0, **{field: 0 for field in hidden}}})
+    return next(case_studies_collection.aggregate(pipeline), None)
+
+
+async def get_case_study_with_metrics(
+    case_id: str,
+    projection: Optional[Dict[str, Any]] = None,
+    categories: Optional[List[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """One case study with its metrics embedded under `metrics`, in a single aggregation"""
+    projection = projection or {"_id": 0}
+    return await _shared(
+        "get_case_study_with_metrics", (case_id, projection, categories),
+        _find_with_metrics, case_id, projection, categories,
+    )
+
+
+def _find_by_ids(collection, ids: List[str], projection: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    projection, hidden = project_sort_fields(projection, [("id", 1)])
+    found = {}
+    for doc in collection.find({"id": {"$in": ids}}, projection):
+        found[doc["id"]] = doc
+        for field in hidden:
+            doc.pop(field, None)
+    return found
+
+
+async def get_case_studies_by_ids(ids: List[str], projection: Optional[Dict[str, Any]] = None) -> Dict[str, Dict[str, Any]]:
+    """Fetch many case studies with one $in query, keyed by id"""
+    projection = projection or {"_id": 0}
+    return await _shared("get_case_studies_by_ids", (ids, projection), _find_by_ids, case_studies_collection, ids, projection)
+
+
+async def list_frameworks(projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    projection = projection or {"_id": 0}
+    return await _shared("list_frameworks", (projection,), _find_all, read_db.frameworks, {}, projection)
+
+
+async def list_metrics(case_id: str, projection: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    projection = projection or {"_id": 0}
+    return await _shared("list_metrics", (case_id, projection), _find_all, read_db.metrics, {"case_study_id": case_id}, projection)
+
+
+def export_case_studies(query: Dict[str, Any], batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    return iter_batches(read_db.case_studies, query, {"_id": 0}, batch_size)
+
+
+def export_metrics(query: Dict[str, Any], batch_size: int) -> AsyncIterator[List[Dict[str, Any]]]:
+    return iter_batches(read_db.metrics, query, {"_id": 0}, batch_size)
+
+
+async def search_case_studies(q: str, **kwargs: Any) -> Dict[str, Any]:
+    return await _shared("search_case_studies", (q, kwargs), search.search_case_studies, read_db, q, **kwargs)
+
+
+async def search_frameworks(q: str, **kwargs: Any) -> Dict[str, Any]:
+    return await _shared("search_frameworks", (q, kwargs), search.search_frameworks, read_db, q, **kwargs)
+
+
+async def metrics_rollup(
+    group_by: List[str],
+    granularity: str,
+    percentiles: List[float],
+    category: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Rollup rows plus the metrics data version they were computed from"""
+    return await _shared(
+        "metrics_rollup", (group_by, granularity, percentiles, category),
+        _rollup_cache.get, read_db, group_by, granularity, percentiles, category,
+    )
+
+
+def _benchmark_case_study(case_id: str, segments: List[str], metrics: List[str]) -> Optional[Dict[str, Any]]:
+    _benchmark_index.refresh(read_db)
+    doc = case_studies_collection.find_one({"id": case_id}, benchmarking.BENCHMARK_PROJECTION)
+    if doc is None:
+        return None
+    return _benchmark_index.rank(doc, segments, metrics)
+
+
+async def benchmark_case_study(case_id: str, segments: List[str], metrics: List[str]) -> Optional[Dict[str, Any]]:
+    """Percentile standing of a case study within its peer segments, or None if it does not exist"""
+    return await _shared("benchmark_case_study", (case_id, segments, metrics), _benchmark_case_study, case_id, segments, metrics)
+
+
+def _benchmark_distributions(segment: str, metrics: List[str]) -> List[Dict[str, Any]]:
+    _benchmark_index.refresh(read_db)
+    return _benchmark_index.distributions(segment, metrics)
+
+
+async def benchmark_distributions(segment: str, metrics: List[str]) -> List[Dict[str, Any]]:
+    return await _shared("benchmark_distributions", (segment, metrics), _benchmark_distributions, segment, metrics)
+
+
+async def get_dashboard_stats() -> Dict[str, Any]:
+    return await _shared("dashboard_stats", (), stats.load_dashboard_stats, read_db)
+
+
+async def rebuild_dashboard_stats() -> Dict[str, Any]:
+    return await run(stats.rebuild_dashboard_stats, db)
+
+
+async def refresh_dashboard_stats(max_age: float) -> bool:
+    return await run(stats.refresh_dashboard_stats, db, max_age)
+
+
+async def get_data_versions() -> Tuple[Dict[str, int], Dict[str, Any]]:
+    """
+    Collection versions and last-modified times, at most VERSIONS_CACHE_TTL
+    seconds old. Read through read_db like the listings, so a version is never
+    newer than the data the same replica would return.
+    """
+    global _versions_snapshot
+    fetched_at, current, modified = _versions_snapshot
+    if time.monotonic() - fetched_at >= VERSIONS_CACHE_TTL:
+        current, modified = await _shared("data_versions", (), versions.read_versions, read_db)
+        _versions_snapshot = (time.monotonic(), current, modified)
+    return current, modified
+
+
+async def get_case_study_updated_at(case_id: str) -> Optional[Any]:
+    doc = await _shared(
+        "case_study_updated_at", (case_id,), case_studies_collection.find_one, {"id": case_id}, {"_id": 0, "updated_at": 1},
+    )
+    return doc.get("updated_at") if doc else None
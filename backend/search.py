@@ -0,0 +1,169 @@
+"""
+Ranked full-text search over case studies and frameworks.
+
+Matching and ranking use the MongoDB text index declared in indexes.py, so a
+query costs an index lookup rather than a scan. Facet counts (industry,
+company_type) are computed over every text match in the same aggregation as
+the page of results; snippets are cut from the page's documents in Python.
+Matches are projected down to the fields the page, highlights and facets read
+before $facet, since every facet branch would otherwise carry whole documents.
+"""
+
+import html
+import re
+from typing import Any, Dict, Iterator, List, Optional
+
+# Searchable fields and their text-index weights
+CASE_STUDY_SEARCH_WEIGHTS = {
+    "company_name": 10,
+    "challenge": 5,
+    "solution_overview": 5,
+    "competitive_analysis.competitive_advantage": 3,
+    "market_research.key_insights": 2,
+}
+FRAMEWORK_SEARCH_WEIGHTS = {
+    "name": 10,
+    "description": 5,
+    "use_cases": 3,
+}
+
+CASE_STUDY_RESULT_FIELDS = ["id", "company_name", "company_type", "industry", "success_rate", "revenue_impact"]
+FRAMEWORK_RESULT_FIELDS = ["id", "name", "success_rate"]
+
+SNIPPET_RADIUS = 80
+MAX_SNIPPETS = 3
+
+_TOKEN = re.compile(r'-?"[^"]*"|-?\S+')
+_SUFFIXES = ("ing", "es", "ed", "s")
+
+
+def query_terms(q: str) -> List[str]:
+    """Words to highlight: every non-negated word or phrase word, crudely stemmed"""
+    terms = []
+    for token in _TOKEN.findall(q):
+        if token.startswith("-"):
+            continue
+        for word in re.findall(r"\w+", token.lower()):
+            for suffix in _SUFFIXES:
+                if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+                    word = word[: -len(suffix)]
+                    break
+            terms.append(word)
+    return list(dict.fromkeys(terms))
+
+
+def _texts(doc: Dict[str, Any], path: str) -> Iterator[str]:
+    value: Any = doc
+    for part in path.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, list):
+        yield from (item for item in value if isinstance(item, str))
+
+
+def highlight(doc: Dict[str, Any], fields: List[str], terms: List[str]) -> List[Dict[str, str]]:
+    """Up to MAX_SNIPPETS HTML-escaped excerpts with matching words wrapped in <mark>"""
+    if not terms:
+        return []
+    pattern = re.compile(r"\b(?:" + "|".join(re.escape(term) for term in terms) + r")\w*", re.IGNORECASE)
+    snippets = []
+    for field in fields:
+        for text in _texts(doc, field):
+            match = pattern.search(text)
+            if not match:
+                continue
+            start = max(0, match.start() - SNIPPET_RADIUS)
+            end = min(len(text), match.end() + SNIPPET_RADIUS)
+            excerpt = text[start:end]
+            marked = []
+            position = 0
+            for hit in pattern.finditer(excerpt):
+                marked.append(html.escape(excerpt[position:hit.start()]))
+                marked.append(f"<mark>{html.escape(hit.group())}</mark>")
+                position = hit.end()
+            marked.append(html.escape(excerpt[position:]))
+            prefix = "…" if start > 0 else ""
+            suffix = "…" if end < len(text) else ""
+            snippets.append({"field": field, "text": prefix + "".join(marked) + suffix})
+            if len(snippets) >= MAX_SNIPPETS:
+                return snippets
+    return snippets
+
+
+def _facet_counts(buckets: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return sorted(({"value": b["_id"], "count": b["count"]} for b in buckets), key=lambda b: (-b["count"], str(b["value"])))
+
+
+def _search(
+    collection,
+    q: str,
+    filters: Dict[str, Any],
+    weights: Dict[str, int],
+    result_fields: List[str],
+    facet_fields: List[str],
+    limit: int,
+    offset: int,
+) -> Dict[str, Any]:
+    page_projection = {"_id": 0, "score": 1, **{field: 1 for field in result_fields + list(weights)}}
+    facets: Dict[str, Any] = {
+        "results": [
+            *([{"$match": filters}] if filters else []),
+            {"$sort": {"score": -1, "id": 1}},
+            {"$skip": offset},
+            {"$limit": limit},
+            {"$project": page_projection},
+        ],
+        "total": [*([{"$match": filters}] if filters else []), {"$count": "count"}],
+    }
+    for field in facet_fields:
+        facets[field] = [{"$group": {"_id": f"${field}", "count": {"$sum": 1}}}]
+
+    needed = dict.fromkeys([*result_fields, *weights, *facet_fields, *filters], 1)
+    pipeline = [
+        {"$match": {"$text": {"$search": q}}},
+        {"$project": {"_id": 0, "score": {"$meta": "textScore"}, **needed}},
+        {"$facet": facets},
+    ]
+    result = next(collection.aggregate(pipeline), {})
+
+    terms = query_terms(q)
+    hits = []
+    for doc in result.get("results", []):
+        hit = {field: doc[field] for field in result_fields if field in doc}
+        hit["score"] = round(doc.get("score", 0.0), 4)
+        hit["highlights"] = highlight(doc, list(weights), terms)
+        hits.append(hit)
+
+    total = result.get("total") or [{"count": 0}]
+    return {
+        "total": total[0]["count"],
+        "results": hits,
+        "facets": {field: _facet_counts(result.get(field, [])) for field in facet_fields},
+    }
+
+
+def search_case_studies(
+    db,
+    q: str,
+    industry: Optional[str] = None,
+    company_type: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> Dict[str, Any]:
+    """
+    Ranked case study matches. Facet counts cover every text match so they
+    show how the results would change when a facet filter is toggled.
+    """
+    filters = {}
+    if industry:
+        filters["industry"] = industry
+    if company_type:
+        filters["company_type"] = company_type
+    return _search(db.case_studies, q, filters, CASE_STUDY_SEARCH_WEIGHTS, CASE_STUDY_RESULT_FIELDS,
+                   ["industry", "company_type"], limit, offset)
+
+
+def search_frameworks(db, q: str, limit: int = 20, offset: int = 0) -> Dict[str, Any]:
+    return _search(db.frameworks, q, {}, FRAMEWORK_SEARCH_WEIGHTS, FRAMEWORK_RESULT_FIELDS, [], limit, offset)
+
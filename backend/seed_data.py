@@ -1,25 +1,31 @@
 #!/usr/bin/env python3
+"""
+Sample portfolio data. Running this module (re)loads it through the ingest
+pipeline; ids are derived from the company/framework/metric names, so seeding
+twice updates the same documents instead of duplicating them.
 
-import os
-from pymongo import MongoClient
-from datetime import datetime
+    python seed_data.py            # replace the collections with the sample data
+    python seed_data.py --upsert   # merge the sample data into existing collections
+"""
+
+import argparse
 import uuid
+from datetime import datetime
+
+from ingest import ingest_collections
+
+# Namespace for the stable sample ids
+SEED_NAMESPACE = uuid.UUID("6f1c2b7e-3d4a-5e8f-9a0b-1c2d3e4f5a6b")
 
-# MongoDB connection
-MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/gtm_portfolio_db")
-client = MongoClient(MONGO_URL)
-db = client.gtm_portfolio_db
 
-# Clear existing data
-print("Clearing existing data...")
-db.case_studies.delete_many({})
-db.frameworks.delete_many({})
-db.metrics.delete_many({})
+def seed_id(kind: str, name: str) -> str:
+    return str(uuid.uuid5(SEED_NAMESPACE, f"{kind}:{name}"))
+
 
 # GTM Case Studies Data
 case_studies = [
     {
-        "id": str(uuid.uuid4()),
+        "id": seed_id("case_study", "CloudSync Pro"),
         "company_name": "CloudSync Pro",
         "company_type": "startup",
         "industry": "SaaS/Cloud Storage",
@@ -88,7 +94,7 @@ case_studies = [
         "updated_at": datetime.now()
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": seed_id("case_study", "EcoLogistics"),
         "company_name": "EcoLogistics",
         "company_type": "startup", 
         "industry": "GreenTech/Logistics",
@@ -157,7 +163,7 @@ case_studies = [
         "updated_at": datetime.now()
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": seed_id("case_study", "Global Enterprise Solutions (GES)"),
         "company_name": "Global Enterprise Solutions (GES)",
         "company_type": "mnc",
         "industry": "Enterprise Software",
@@ -230,7 +236,7 @@ case_studies = [
 # GTM Framework Data
 frameworks = [
     {
-        "id": str(uuid.uuid4()),
+        "id": seed_id("framework", "High-Velocity GTM Framework"),
         "name": "High-Velocity GTM Framework",
         "description": "Proven 90%+ success rate framework for B2B SaaS market entry and scaling",
         "phases": [
@@ -297,7 +303,7 @@ frameworks = [
 sample_case_id = case_studies[0]["id"]
 metrics = [
     {
-        "id": str(uuid.uuid4()),
+        "id": seed_id("metric", f"{sample_case_id}:Customer Acquisition Cost"),
         "case_study_id": sample_case_id,
         "metric_name": "Customer Acquisition Cost",
         "metric_value": 2847.0,
@@ -306,7 +312,7 @@ metrics = [
         "category": "market"
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": seed_id("metric", f"{sample_case_id}:Monthly Recurring Revenue"),
         "case_study_id": sample_case_id,
         "metric_name": "Monthly Recurring Revenue",
         "metric_value": 847000.0,
@@ -315,7 +321,7 @@ metrics = [
         "category": "revenue"
     },
     {
-        "id": str(uuid.uuid4()),
+        "id": seed_id("metric", f"{sample_case_id}:Customer Lifetime Value"),
         "case_study_id": sample_case_id,
         "metric_name": "Customer Lifetime Value",
         "metric_value": 28450.0,
@@ -325,17 +331,26 @@ metrics = [
     }
 ]
 
-# Insert data into MongoDB
-print("Inserting case studies...")
-db.case_studies.insert_many(case_studies)
-print(f"Inserted {len(case_studies)} case studies")
 
-print("Inserting frameworks...")
-db.frameworks.insert_many(frameworks)
-print(f"Inserted {len(frameworks)} frameworks")
+def seed(db, swap: bool = True):
+    """Load the sample data; with `swap` it replaces the collections atomically"""
+    return ingest_collections(
+        db,
+        {"case_studies": case_studies, "frameworks": frameworks, "metrics": metrics},
+        swap=swap,
+    )
+
+
+if __name__ == "__main__":
+    import repository
+
+    parser = argparse.ArgumentParser(description="Load the sample GTM portfolio data")
+    parser.add_argument("--upsert", action="store_true", help="merge into the existing collections instead of replacing them")
+    args = parser.parse_args()
 
-print("Inserting metrics...")
-db.metrics.insert_many(metrics)
-print(f"Inserted {len(metrics)} metrics")
+    db = repository.connect()
 
-print("Data seeding completed successfully!")
\ No newline at end of file
+    print("Seeding sample data...")
+    for report in seed(db, swap=not args.upsert):
+        print(report.summary())
+    print("Data seeding completed successfully!")
@@ -0,0 +1,38 @@
+"""
+JSON encoding for API responses, straight to bytes.
+
+FastAPI's default path runs jsonable_encoder, a recursive pure-Python walk
+that copies every nested case study blob, and then json.dumps. Routes instead
+return FastJSONResponse, which skips the walk and encodes the documents as
+Mongo returned them in one native call: orjson when the `orjson` package is
+installed, pydantic-core's serializer otherwise. datetimes (created_at,
+updated_at) come out as ISO 8601 strings, matching jsonable_encoder.
+"""
+
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson is not None else 0
+
+
+def _default(value: Any) -> Any:
+    # Types orjson has no native encoding for (Decimal, Pydantic models, ...)
+    return pydantic_core.to_jsonable_python(value)
+
+
+def dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+    return pydantic_core.to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
@@ -1,14 +1,196 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from pymongo import MongoClient
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Literal, Tuple
+from contextlib import asynccontextmanager
+import asyncio
+import logging
+import math
 import os
-from datetime import datetime
+import random
 import uuid
+from urllib.parse import parse_qsl
+
+import httpx
+from starlette.routing import Match
+
+import analytics
+import benchmarking
+import indexes
+import repository
+import serialization
+import slow_queries
+import stats
+import telemetry
+from cache import LRUCache, ResponseCacheMiddleware, cache_key
+from compression import Compressor, CompressionMiddleware
+from conditional import ConditionalGetMiddleware, Validator
+from models import CaseStudy, GTMFramework, Metric
+from projection import build_projection, parse_field_list
+from serialization import FastJSONResponse
+from telemetry import TelemetryMiddleware
+
+logger = logging.getLogger(__name__)
+
+# Response cache: size bounds and per-route TTLs (seconds) keyed by path prefix
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024"))
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+RESPONSE_CACHE_TTLS = {
+    "/api/case-studies": 300,
+    "/api/frameworks": 600,
+    "/api/metrics/": 300,
+    "/api/dashboard-stats": 30,
+    "/api/search": 60,
+}
+
+response_cache = LRUCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_MAX_BYTES)
+
+# Response compression: encodings in preference order, smallest body worth compressing, levels
+compressor = Compressor(
+    encodings=[e.strip() for e in os.getenv("COMPRESSION_ENCODINGS", "br,zstd,gzip").split(",") if e.strip()],
+    minimum_size=int(os.getenv("COMPRESSION_MIN_SIZE", "1024")),
+    levels={
+        "gzip": int(os.getenv("COMPRESSION_GZIP_LEVEL", "6")),
+        "br": int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5")),
+        "zstd": int(os.getenv("COMPRESSION_ZSTD_LEVEL", "3")),
+    },
+)
+
+# Seconds between full rebuilds of the materialized dashboard stats (0 disables)
+STATS_REFRESH_INTERVAL = float(os.getenv("STATS_REFRESH_INTERVAL", "300"))
+
+async def refresh_stats_periodically(interval: float):
+    # Every worker runs this loop, but the stats document records when it was last
+    # verified: the first worker due rebuilds it and the others skip until the next
+    # interval. The jitter keeps workers started together from checking together.
+    while True:
+        await asyncio.sleep(interval * random.uniform(0.9, 1.1))
+        try:
+            if await repository.refresh_dashboard_stats(max_age=interval * 0.8):
+                response_cache.invalidate("/api/dashboard-stats")
+        except Exception as e:
+            logger.warning("Dashboard stats refresh failed: %s", e)
+
+# Fetched through the full middleware stack at startup, so a worker's first requests are cache hits
+PRIME_CACHE_PATHS = [p.strip() for p in os.getenv("PRIME_CACHE_PATHS", "/api/dashboard-stats,/api/frameworks").split(",") if p.strip()]
+
+async def prime_response_cache(app: FastAPI, paths: List[str]) -> List[str]:
+    """
+    GET each path in-process once per configured encoding, so the response cache
+    holds the body and its compressed variants; returns the paths that were cached
+    """
+    primed = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://prime") as client:
+        for path in paths:
+            statuses = set()
+            for encoding in compressor.encodings or ["identity"]:
+                response = await client.get(path, headers={"accept-encoding": encoding})
+                statuses.add(response.status_code)
+            if statuses == {200}:
+                primed.append(path)
+            else:
+                logger.warning("Priming %s returned %s", path, sorted(statuses))
+    return primed
+
+# Collections each GET route reads; their versions make up the route's ETag. Other GET
+# routes are tagged by hashing the response body.
+VERSIONED_ROUTES = {
+    "/api/case-studies": ["case_studies"],
+    "/api/case-studies/{case_id}": ["case_studies", "metrics"],
+    "/api/case-studies/{case_id}/benchmarks": ["case_studies"],
+    "/api/benchmarks": ["case_studies"],
+    "/api/frameworks": ["frameworks"],
+    "/api/metrics/{case_id}": ["metrics"],
+    "/api/dashboard-stats": ["case_studies", stats.STATS_VERSION],
+    "/api/search": ["case_studies", "frameworks"],
+    "/api/analytics/metrics-rollup": ["metrics"],
+    "/api/export/case-studies": ["case_studies"],
+    "/api/export/metrics": ["metrics"],
+}
+
+def _match_route(scope) -> Tuple[Optional[str], Dict[str, Any]]:
+    for route in app.router.routes:
+        match, child_scope = route.matches(scope)
+        if match == Match.FULL:
+            return route.path, child_scope.get("path_params", {})
+    return None, {}
+
+async def resolve_validator(scope) -> Optional[Validator]:
+    """
+    ETag and Last-Modified from the versions document (cached for
+    VERSIONS_CACHE_TTL) and, for a case study, its updated_at; neither
+    requires fetching the documents the route returns
+    """
+    template, path_params = _match_route(scope)
+    collections = VERSIONED_ROUTES.get(template)
+    if collections is None:
+        return None
+    current, modified = await repository.get_data_versions()
+    parts = [app.version, cache_key(scope["path"], scope.get("query_string", b""))]
+    parts.extend(f"{name}={current.get(name, 0)}" for name in collections)
+    times = [modified[name] for name in collections if name in modified]
+
+    if template == "/api/case-studies/{case_id}":
+        # Dated by the document itself rather than the last bulk load, plus metrics when embedded
+        updated_at = await repository.get_case_study_updated_at(path_params["case_id"])
+        parts.append(updated_at)
+        query = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        times = [updated_at] if updated_at else []
+        if "metrics" in parse_field_list(query.get("include")) and "metrics" in modified:
+            times.append(modified["metrics"])
+    return Validator.from_parts(parts, max(times, default=None))
+
+# Readiness probe: how long the Mongo ping may take before the worker reports not ready
+READINESS_TIMEOUT = float(os.getenv("READINESS_TIMEOUT", "2"))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    repository.connect()
+    try:
+        connections = await repository.warm_up()
+        logger.info("Mongo pool warmed up with %d connections", connections)
+    except Exception as e:
+        # Serve anyway; the readiness endpoint reports Mongo as unavailable until it answers
+        logger.warning("Mongo warm-up failed: %s", e)
+
+    try:
+        created = await repository.run(indexes.ensure_indexes, repository.db)
+        for collection_name, names in created.items():
+            if names:
+                logger.info("Created indexes on %s: %s", collection_name, ", ".join(names))
+    except Exception as e:
+        # Serve anyway; queries still work without indexes, just slower
+        logger.warning("Index bootstrap failed: %s", e)
+
+    try:
+        primed = await prime_response_cache(app, PRIME_CACHE_PATHS)
+        logger.info("Primed response cache: %s", ", ".join(primed) or "nothing")
+    except Exception as e:
+        # Serve anyway; the first request per path fills the cache instead
+        logger.warning("Response cache priming failed: %s", e)
+
+    refresher = None
+    if STATS_REFRESH_INTERVAL > 0:
+        refresher = asyncio.create_task(refresh_stats_periodically(STATS_REFRESH_INTERVAL))
+    yield
+    if refresher:
+        refresher.cancel()
+    repository.shutdown()
 
 # Initialize FastAPI app
-app = FastAPI(title="GTM Strategy Portfolio API", version="1.0.0")
+# Routes returning bulk documents build FastJSONResponse themselves, which skips jsonable_encoder;
+# the default class only speeds up encoding of the small dicts the other routes return
+app = FastAPI(title="GTM Strategy Portfolio API", version="1.0.0", lifespan=lifespan,
+              default_response_class=FastJSONResponse)
+
+# Registered before CORS so cached bodies never carry per-origin CORS headers.
+# Compression wraps the cache but skips cached responses, which arrive already encoded.
+app.add_middleware(ResponseCacheMiddleware, backend=response_cache, ttls=RESPONSE_CACHE_TTLS, compressor=compressor)
+app.add_middleware(CompressionMiddleware, compressor=compressor)
+# Outside compression so ETags name the content-coding actually sent; inside CORS so 304s carry CORS headers
+app.add_middleware(ConditionalGetMiddleware, resolve=resolve_validator, compressor=compressor)
 
 # CORS middleware
 app.add_middleware(
@@ -19,118 +201,300 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# MongoDB connection
-MONGO_URL = os.getenv("MONGO_URL", "mongodb://localhost:27017/gtm_portfolio_db")
-client = MongoClient(MONGO_URL)
-db = client.gtm_portfolio_db
-
-# Collections
-case_studies_collection = db.case_studies
-frameworks_collection = db.frameworks
-metrics_collection = db.metrics
-
-# Pydantic models
-class CaseStudy(BaseModel):
-    id: str
-    company_name: str
-    company_type: str  # "startup" or "mnc"
-    industry: str
-    product_category: str
-    challenge: str
-    solution_overview: str
-    market_research: Dict[str, Any]
-    competitive_analysis: Dict[str, Any]
-    pricing_strategy: Dict[str, Any]
-    channel_strategy: Dict[str, Any]
-    execution_timeline: List[Dict[str, Any]]
-    key_metrics: Dict[str, Any]
-    success_rate: float
-    revenue_impact: str
-    created_at: datetime
-    updated_at: datetime
-
-class GTMFramework(BaseModel):
-    id: str
-    name: str
-    description: str
-    phases: List[Dict[str, Any]]
-    success_rate: float
-    use_cases: List[str]
-    created_at: datetime
-
-class Metric(BaseModel):
-    id: str
-    case_study_id: str
-    metric_name: str
-    metric_value: float
-    metric_unit: str
-    time_period: str
-    category: str  # "market", "pricing", "channel", "revenue"
+# Outermost, so timings and sizes cover everything above, including cache hits
+app.add_middleware(TelemetryMiddleware)
+
+# Request models
+class CaseStudyBatchRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=100)
+    fields: Optional[str] = None
+    exclude: Optional[str] = None
 
 # API Routes
 @app.get("/")
 async def root():
     return {"message": "GTM Strategy Portfolio API is running!"}
 
+# Fields returned by the case study listing unless view=full or `fields` is requested
+CASE_STUDY_SUMMARY_FIELDS = ["id", "company_name", "company_type", "industry", "success_rate", "revenue_impact"]
+
 @app.get("/api/case-studies")
-async def get_case_studies():
+async def get_case_studies(
+    limit: int = Query(20, ge=1, le=100),
+    after: Optional[str] = None,
+    view: Literal["summary", "full"] = "summary",
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+    company_type: Optional[str] = None,
+    industry: Optional[str] = None,
+    product_category: Optional[str] = None,
+    min_success_rate: Optional[float] = Query(None, ge=0, le=100),
+    max_success_rate: Optional[float] = Query(None, ge=0, le=100),
+    sort: Optional[str] = Query(None, description="success_rate, company_name or created_at; prefix with - for descending"),
+):
     try:
-        studies = list(case_studies_collection.find({}, {"_id": 0}))
-        return {"case_studies": studies}
+        default_fields = CASE_STUDY_SUMMARY_FIELDS if view == "summary" else None
+        projection = build_projection(CaseStudy, fields, exclude, default_fields)
+        query = repository.case_study_filter(company_type, industry, product_category, min_success_rate, max_success_rate)
+        studies, next_cursor = await repository.list_case_studies(
+            limit, after, projection, query, repository.case_study_sort(sort)
+        )
+        return FastJSONResponse({"case_studies": studies, "next_cursor": next_cursor})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Related data that can be embedded in the case study detail response
+CASE_STUDY_INCLUDES = {"metrics"}
+
 @app.get("/api/case-studies/{case_id}")
-async def get_case_study(case_id: str):
+async def get_case_study(
+    case_id: str,
+    fields: Optional[str] = None,
+    exclude: Optional[str] = None,
+    include: Optional[str] = None,
+    metric_category: Optional[str] = None,
+):
     try:
-        study = case_studies_collection.find_one({"id": case_id}, {"_id": 0})
-        if not study:
+        projection = build_projection(CaseStudy, fields, exclude)
+        includes = set(parse_field_list(include))
+        unknown = includes - CASE_STUDY_INCLUDES
+        if unknown:
+            raise ValueError(f"Unknown include: {', '.join(sorted(unknown))}")
+        if "metrics" in includes:
+            categories = parse_field_list(metric_category) or None
+            study = await repository.get_case_study_with_metrics(case_id, projection, categories)
+        else:
+            study = await repository.get_case_study(case_id, projection)
+        if study is None:
             raise HTTPException(status_code=404, detail="Case study not found")
-        return study
+        return FastJSONResponse(study)
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/case-studies/batch")
+async def get_case_studies_batch(request: CaseStudyBatchRequest):
+    try:
+        projection = build_projection(CaseStudy, request.fields, request.exclude)
+        ids = list(dict.fromkeys(request.ids))
+        found = await repository.get_case_studies_by_ids(ids, projection)
+        return FastJSONResponse({
+            "case_studies": [found[case_id] for case_id in ids if case_id in found],
+            "missing": [case_id for case_id in ids if case_id not in found],
+        })
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+def _benchmark_names(raw: Optional[str], known: Dict[str, Any], label: str) -> List[str]:
+    names = parse_field_list(raw) or list(known)
+    unknown = [name for name in names if name not in known]
+    if unknown:
+        raise ValueError(f"Unknown {label}: {', '.join(unknown)}")
+    return names
+
+@app.get("/api/case-studies/{case_id}/benchmarks")
+async def get_case_study_benchmarks(
+    case_id: str,
+    segments: Optional[str] = Query(None, description="comma-separated: portfolio, industry, company_type, industry_company_type"),
+    metrics: Optional[str] = Query(None, description="comma-separated benchmark metrics; all by default"),
+):
+    try:
+        segment_names = _benchmark_names(segments, benchmarking.SEGMENTS, "segment")
+        metric_names = _benchmark_names(metrics, benchmarking.BENCHMARK_METRICS, "metric")
+        result = await repository.benchmark_case_study(case_id, segment_names, metric_names)
+        if result is None:
+            raise HTTPException(status_code=404, detail="Case study not found")
+        return FastJSONResponse({"case_study_id": case_id, "segments": result})
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/benchmarks")
+async def get_benchmark_distributions(
+    segment: Literal["portfolio", "industry", "company_type", "industry_company_type"] = "industry",
+    metrics: Optional[str] = Query(None, description="comma-separated benchmark metrics; all by default"),
+):
+    try:
+        metric_names = _benchmark_names(metrics, benchmarking.BENCHMARK_METRICS, "metric")
+        groups = await repository.benchmark_distributions(segment, metric_names)
+        return FastJSONResponse({"segment": segment, "groups": groups})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/frameworks")
-async def get_frameworks():
+async def get_frameworks(fields: Optional[str] = None, exclude: Optional[str] = None):
     try:
-        frameworks = list(frameworks_collection.find({}, {"_id": 0}))
-        return {"frameworks": frameworks}
+        projection = build_projection(GTMFramework, fields, exclude)
+        frameworks = await repository.list_frameworks(projection)
+        return FastJSONResponse({"frameworks": frameworks})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/metrics/{case_id}")
-async def get_case_metrics(case_id: str):
+async def get_case_metrics(case_id: str, fields: Optional[str] = None, exclude: Optional[str] = None):
     try:
-        metrics = list(metrics_collection.find({"case_study_id": case_id}, {"_id": 0}))
-        return {"metrics": metrics}
+        projection = build_projection(Metric, fields, exclude)
+        metrics = await repository.list_metrics(case_id, projection)
+        return FastJSONResponse({"metrics": metrics})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/dashboard-stats")
 async def get_dashboard_stats():
     try:
-        total_studies = case_studies_collection.count_documents({})
-        startup_studies = case_studies_collection.count_documents({"company_type": "startup"})
-        mnc_studies = case_studies_collection.count_documents({"company_type": "mnc"})
-        
-        # Calculate average success rate
-        pipeline = [
-            {"$group": {"_id": None, "avg_success_rate": {"$avg": "$success_rate"}}}
-        ]
-        avg_result = list(case_studies_collection.aggregate(pipeline))
-        avg_success_rate = avg_result[0]["avg_success_rate"] if avg_result else 0
-        
-        return {
-            "total_case_studies": total_studies,
-            "startup_studies": startup_studies,
-            "mnc_studies": mnc_studies,
-            "average_success_rate": round(avg_success_rate, 1)
-        }
+        return FastJSONResponse(await repository.get_dashboard_stats())
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/search")
+async def search(
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Literal["all", "case_studies", "frameworks"] = "all",
+    industry: Optional[str] = None,
+    company_type: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    offset: int = Query(0, ge=0, le=1000),
+):
+    try:
+        searches = {}
+        if type in ("all", "case_studies"):
+            searches["case_studies"] = repository.search_case_studies(
+                q, industry=industry, company_type=company_type, limit=limit, offset=offset
+            )
+        if type in ("all", "frameworks"):
+            searches["frameworks"] = repository.search_frameworks(q, limit=limit, offset=offset)
+        results = await asyncio.gather(*searches.values())
+        return FastJSONResponse({"query": q, **dict(zip(searches, results))})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/analytics/metrics-rollup")
+async def get_metrics_rollup(
+    group_by: str = Query(",".join(analytics.GROUP_FIELDS), description="comma-separated: category, metric_name, metric_unit, period"),
+    granularity: Literal["month", "quarter", "year"] = "quarter",
+    percentiles: str = Query("50,90,99", description="comma-separated values between 0 and 100"),
+    category: Optional[str] = None,
+):
+    try:
+        dimensions = parse_field_list(group_by)
+        unknown = set(dimensions) - set(analytics.GROUP_FIELDS)
+        if unknown:
+            raise ValueError(f"Cannot group by: {', '.join(sorted(unknown))}")
+        try:
+            quantiles = [float(q) for q in parse_field_list(percentiles)]
+        except ValueError:
+            raise ValueError("percentiles must be numbers")
+        if not all(math.isfinite(q) and 0 <= q <= 100 for q in quantiles):
+            raise ValueError("percentiles must be between 0 and 100")
+        rows, version = await repository.metrics_rollup(dimensions, granularity, quantiles, category)
+        return FastJSONResponse({"group_by": dimensions, "granularity": granularity, "data_version": version, "rollup": rows})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Export endpoints: NDJSON streamed straight from a Mongo cursor
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "500"))
+
+async def ndjson_lines(batches):
+    # One chunk per batch keeps per-write overhead low; the next batch is not
+    # fetched until the client has accepted this one
+    async for batch in batches:
+        yield b"".join(serialization.dumps(doc) + b"\n" for doc in batch)
+
+def ndjson_response(batches, filename: str) -> StreamingResponse:
+    return StreamingResponse(
+        ndjson_lines(batches),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@app.get("/api/export/case-studies")
+async def export_case_studies(
+    company_type: Optional[str] = None,
+    industry: Optional[str] = None,
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=10000),
+):
+    query = {}
+    if company_type:
+        query["company_type"] = company_type
+    if industry:
+        query["industry"] = industry
+    return ndjson_response(repository.export_case_studies(query, batch_size), "case_studies.ndjson")
+
+@app.get("/api/export/metrics")
+async def export_metrics(
+    case_study_id: Optional[str] = None,
+    category: Optional[str] = None,
+    batch_size: int = Query(EXPORT_BATCH_SIZE, ge=1, le=10000),
+):
+    query = {}
+    if case_study_id:
+        query["case_study_id"] = case_study_id
+    if category:
+        query["category"] = category
+    return ndjson_response(repository.export_metrics(query, batch_size), "metrics.ndjson")
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    return response_cache.stats()
+
+@app.get("/api/admin/slow-queries")
+async def get_slow_queries(limit: int = Query(50, ge=1, le=slow_queries.SLOW_QUERY_LOG_SIZE)):
+    """Recent find/aggregate commands over the slow-query threshold, newest first"""
+    log = slow_queries.slow_query_log
+    return {
+        "threshold_ms": log.threshold_ms,
+        "explain_rate": log.explain_rate,
+        "entries": log.recent(limit),
+    }
+
+@app.get("/api/admin/indexes")
+async def get_index_report():
+    """Declared indexes missing from Mongo, live ones not declared, and per-index usage"""
+    try:
+        return FastJSONResponse(await repository.run(indexes.index_report, repository.db))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/health/ready")
+async def readiness():
+    """Ready when Mongo answers a ping within READINESS_TIMEOUT; includes live pool statistics"""
+    mongo: Dict[str, Any] = {"read_preference": repository.MONGO_READ_PREFERENCE, "settings": repository.pool_settings()}
+    ready = False
+    if repository.client is not None:
+        try:
+            mongo["ping_ms"] = round(await asyncio.wait_for(repository.run(repository.ping), READINESS_TIMEOUT), 2)
+            ready = True
+        except Exception as e:
+            mongo["error"] = str(e) or type(e).__name__
+    mongo["pools"] = telemetry.pool_stats.snapshot()
+    return FastJSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "unavailable", "worker_pid": os.getpid(), "mongo": mongo},
+    )
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(telemetry.REGISTRY.render(), media_type=telemetry.CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
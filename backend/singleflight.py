@@ -0,0 +1,92 @@
+"""
+Single-flight coalescing for identical concurrent reads.
+
+When many requests ask for the same thing at once (a dashboard opened by
+everyone at 9am, a response cache entry that just expired), only the first
+caller runs the query; callers arriving while it is in flight await the same
+result. Every caller gets the same object, so results must be treated as
+read-only.
+
+Each operation has a timeout. A caller still waiting when it elapses gets
+FlightTimeout, and the overrunning flight is dropped from the table so later
+callers start a fresh query instead of queueing behind it. The query itself
+keeps running (a driver call on a worker thread cannot be interrupted), but
+nobody new joins it.
+"""
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+import telemetry
+
+T = TypeVar("T")
+
+
+class FlightTimeout(asyncio.TimeoutError):
+    pass
+
+
+def flight_key(*args: Any, **kwargs: Any) -> str:
+    """Canonical key for call arguments; dicts compare regardless of key order"""
+    return json.dumps([args, kwargs], sort_keys=True, default=repr, separators=(",", ":"))
+
+
+def parse_timeouts(value: str) -> Dict[str, float]:
+    """Parse SINGLE_FLIGHT_TIMEOUTS: comma-separated operation=seconds pairs"""
+    timeouts = {}
+    for item in value.split(","):
+        name, _, seconds = item.partition("=")
+        if name.strip() and seconds.strip():
+            timeouts[name.strip()] = float(seconds)
+    return timeouts
+
+
+class SingleFlight:
+    def __init__(self, default_timeout: float, timeouts: Optional[Dict[str, float]] = None, enabled: bool = True):
+        self.default_timeout = default_timeout
+        self.timeouts = dict(timeouts or {})
+        self.enabled = enabled
+        self._flights: Dict[Tuple[str, Hashable], "asyncio.Future[Any]"] = {}
+
+    def timeout_for(self, operation: str) -> float:
+        return self.timeouts.get(operation, self.default_timeout)
+
+    async def do(self, operation: str, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await fn(), or the identical call already in flight for (operation, key)"""
+        if not self.enabled:
+            return await fn()
+
+        flight_id = (operation, key)
+        flight = self._flights.get(flight_id)
+        if flight is None:
+            flight = asyncio.ensure_future(fn())
+            self._flights[flight_id] = flight
+            telemetry.SINGLE_FLIGHT_IN_FLIGHT.inc(operation)
+            flight.add_done_callback(lambda done: self._land(flight_id, done))
+            telemetry.SINGLE_FLIGHT_CALLS.inc(operation, "leader")
+        else:
+            telemetry.SINGLE_FLIGHT_CALLS.inc(operation, "coalesced")
+
+        timeout = self.timeout_for(operation)
+        try:
+            # shield: a caller that times out or disconnects must not cancel the query for the others
+            return await asyncio.wait_for(asyncio.shield(flight), timeout)
+        except asyncio.TimeoutError:
+            telemetry.SINGLE_FLIGHT_TIMEOUTS.inc(operation)
+            self._drop(flight_id, flight)
+            raise FlightTimeout(f"{operation} did not complete within {timeout:g}s") from None
+
+    def _drop(self, flight_id: Tuple[str, Hashable], flight: "asyncio.Future[Any]") -> None:
+        if self._flights.get(flight_id) is flight:
+            del self._flights[flight_id]
+            telemetry.SINGLE_FLIGHT_IN_FLIGHT.dec(flight_id[0])
+
+    def _land(self, flight_id: Tuple[str, Hashable], flight: "asyncio.Future[Any]") -> None:
+        self._drop(flight_id, flight)
+        # Mark the error as retrieved even if every caller already gave up on this flight
+        if not flight.cancelled():
+            flight.exception()
+
+    def in_flight(self) -> int:
+        return len(self._flights)
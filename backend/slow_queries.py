@@ -0,0 +1,192 @@
+"""
+Slow-query log with sampled explain plans.
+
+SlowQueryLog is a pymongo CommandListener. Every find or aggregate on a
+watched collection that takes longer than the threshold is recorded with
+its filter shape (literal values replaced by "?"), sort, projection,
+duration and number of documents returned. The last N entries are kept in a
+ring buffer.
+
+A sample of the recorded commands is re-run as explain (executionStats) on a
+single background thread. The entry then gains documents/keys examined and
+the winning plan's stages and indexes, so a COLLSCAN behind a slow endpoint
+shows up without attaching a profiler.
+"""
+
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from pymongo import monitoring
+
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "100"))
+SLOW_QUERY_LOG_SIZE = int(os.getenv("SLOW_QUERY_LOG_SIZE", "200"))
+# Fraction of slow commands re-run as explain; 0 disables explain
+SLOW_QUERY_EXPLAIN_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_RATE", "0.1"))
+SLOW_QUERY_COLLECTIONS = [
+    name.strip() for name in os.getenv("SLOW_QUERY_COLLECTIONS", "case_studies,metrics").split(",") if name.strip()
+]
+
+WATCHED_COMMANDS = {"find", "aggregate"}
+# Aggregation stages whose arguments are structure (field names, directions, sizes), not user values
+_STRUCTURAL_STAGES = {"$sort", "$project", "$limit", "$skip", "$count", "$unwind", "$lookup"}
+# Driver-added command fields that explain must not be given
+_DRIVER_FIELDS = {"lsid", "txnNumber", "autocommit", "startTransaction"}
+
+
+def redact(value: Any) -> Any:
+    """Replace literal values with "?", keeping keys, operators and $field references"""
+    if isinstance(value, dict):
+        return {key: redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    if isinstance(value, str) and value.startswith("$"):
+        return value
+    return "?"
+
+
+def redact_pipeline(pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    shaped = []
+    for stage in pipeline:
+        name, argument = next(iter(stage.items()))
+        if name == "$facet":
+            shaped.append({name: {facet: redact_pipeline(stages) for facet, stages in argument.items()}})
+        elif name in _STRUCTURAL_STAGES:
+            shaped.append({name: argument})
+        else:
+            shaped.append({name: redact(argument)})
+    return shaped
+
+
+def command_shape(command_name: str, command: Dict[str, Any]) -> Dict[str, Any]:
+    if command_name == "find":
+        shape = {"filter": redact(command.get("filter", {}))}
+        for key in ("sort", "projection", "limit", "skip"):
+            if key in command:
+                shape[key] = command[key]
+        return shape
+    return {"pipeline": redact_pipeline(command.get("pipeline", []))}
+
+
+def _walk(node: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(node, dict):
+        yield node
+        for value in node.values():
+            yield from _walk(value)
+    elif isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+
+
+def summarize_explain(explain: Dict[str, Any]) -> Dict[str, Any]:
+    """Examined counts and plan stages from find or aggregate explain output"""
+    summary: Dict[str, Any] = {"docs_examined": 0, "keys_examined": 0, "stages": [], "indexes": []}
+    for node in _walk(explain):
+        if "executionStats" in node and isinstance(node["executionStats"], dict):
+            stats = node["executionStats"]
+            summary["docs_examined"] += stats.get("totalDocsExamined", 0)
+            summary["keys_examined"] += stats.get("totalKeysExamined", 0)
+            summary["execution_ms"] = stats.get("executionTimeMillis")
+        if "winningPlan" in node:
+            for stage in _walk(node["winningPlan"]):
+                if "stage" in stage:
+                    summary["stages"].append(stage["stage"])
+                if stage.get("indexName"):
+                    summary["indexes"].append(stage["indexName"])
+    summary["collection_scan"] = "COLLSCAN" in summary["stages"]
+    return summary
+
+
+class SlowQueryLog(monitoring.CommandListener):
+    def __init__(
+        self,
+        threshold_ms: float = SLOW_QUERY_THRESHOLD_MS,
+        size: int = SLOW_QUERY_LOG_SIZE,
+        explain_rate: float = SLOW_QUERY_EXPLAIN_RATE,
+        collections: Optional[List[str]] = None,
+    ):
+        self.threshold_ms = threshold_ms
+        self.explain_rate = explain_rate
+        self.collections = set(collections if collections is not None else SLOW_QUERY_COLLECTIONS)
+        self.entries: Deque[Dict[str, Any]] = deque(maxlen=size)
+        self._pending: Dict[Tuple[int, Any], Tuple[str, Dict[str, Any]]] = {}
+        self._client = None
+        self._explainer: Optional[ThreadPoolExecutor] = None
+        self._explaining = threading.Semaphore(1)
+
+    def bind(self, client) -> None:
+        """The client explain runs on; without one, entries are recorded unexplained"""
+        self._client = client
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        if event.command_name not in WATCHED_COMMANDS:
+            return
+        collection = event.command.get(event.command_name)
+        if collection in self.collections:
+            self._pending[(event.request_id, event.connection_id)] = (collection, event.command)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        pending = self._pending.pop((event.request_id, event.connection_id), None)
+        if pending is None:
+            return
+        duration_ms = event.duration_micros / 1000
+        if duration_ms < self.threshold_ms:
+            return
+        collection, command = pending
+        first_batch = (event.reply.get("cursor") or {}).get("firstBatch")
+        entry = {
+            "at": datetime.utcnow(),
+            "database": event.database_name,
+            "collection": collection,
+            "command": event.command_name,
+            "shape": command_shape(event.command_name, command),
+            "duration_ms": round(duration_ms, 2),
+            "docs_returned": len(first_batch) if first_batch is not None else None,
+            "explain": None,
+        }
+        self.entries.append(entry)
+        if self._client is not None and random.random() < self.explain_rate:
+            self._schedule_explain(entry, event.database_name, command)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        self._pending.pop((event.request_id, event.connection_id), None)
+
+    def _schedule_explain(self, entry: Dict[str, Any], database: str, command: Dict[str, Any]) -> None:
+        # At most one explain in flight; samples arriving meanwhile stay unexplained
+        if not self._explaining.acquire(blocking=False):
+            return
+        if self._explainer is None:
+            self._explainer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="explain")
+        self._explainer.submit(self._explain, entry, database, command)
+
+    def _explain(self, entry: Dict[str, Any], database: str, command: Dict[str, Any]) -> None:
+        try:
+            explained = {key: value for key, value in command.items()
+                         if not key.startswith("$") and key not in _DRIVER_FIELDS}
+            result = self._client[database].command({"explain": explained, "verbosity": "executionStats"})
+            entry["explain"] = summarize_explain(result)
+        except Exception as e:
+            entry["explain"] = {"error": str(e)}
+        finally:
+            self._explaining.release()
+
+    def recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Newest entries first"""
+        return list(reversed(self.entries))[:limit]
+
+    def clear(self) -> int:
+        count = len(self.entries)
+        self.entries.clear()
+        return count
+
+    def shutdown(self) -> None:
+        if self._explainer is not None:
+            self._explainer.shutdown(wait=False)
+            self._explainer = None
+
+
+slow_query_log = SlowQueryLog()
@@ -0,0 +1,146 @@
+"""
+Materialized dashboard statistics.
+
+The dashboard numbers live in a single document in the `stats` collection so
+/api/dashboard-stats is one point read. The document stores counts and
+success-rate sums (not averages) overall, per company_type and per industry,
+plus the portfolio-wide sum of parsed USD revenue impact (numeric.revenue_impact).
+rebuild_dashboard_stats() recomputes everything in a single $facet pass;
+ingest runs it after every load and the API re-checks it on an interval.
+
+The document, its updated_at and the dashboard_stats data version only change
+when the numbers do, so a periodic rebuild that finds nothing new does not
+invalidate cached responses or ETags. verified_at records the last rebuild,
+which lets every API worker share one periodic check.
+"""
+
+import math
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from versions import bump_versions
+
+STATS_DOCUMENT_ID = "dashboard"
+STATS_VERSION = "dashboard_stats"
+
+BREAKDOWNS = {"by_company_type": "company_type", "by_industry": "industry"}
+
+# Only USD amounts are summed; other currencies would need conversion
+_USD_REVENUE_IMPACT = {"$cond": [{"$eq": ["$numeric.revenue_impact.unit", "USD"]}, "$numeric.revenue_impact.value", 0]}
+
+
+def _bucket_key(value: Any) -> str:
+    # Field names cannot contain '.' or start with '$'; the display value is kept in "name"
+    return str(value).replace(".", "．").lstrip("$") or "_"
+
+
+def _group(field: Optional[str]) -> List[Dict[str, Any]]:
+    return [{"$group": {
+        "_id": f"${field}" if field else None,
+        "count": {"$sum": 1},
+        "success_rate_sum": {"$sum": "$success_rate"},
+    }}]
+
+
+def _totals() -> List[Dict[str, Any]]:
+    stages = _group(None)
+    stages[0]["$group"]["revenue_impact_sum"] = {"$sum": _USD_REVENUE_IMPACT}
+    return stages
+
+
+def rebuild_dashboard_stats(db) -> Dict[str, Any]:
+    """Recompute the stats document from case_studies in one aggregation pass"""
+    return _rebuild(db)[0]
+
+
+def refresh_dashboard_stats(db, max_age: float) -> bool:
+    """
+    Rebuild unless the document was verified within `max_age` seconds (by any
+    worker); returns whether the stats changed
+    """
+    current = db.stats.find_one({"_id": STATS_DOCUMENT_ID}, {"verified_at": 1})
+    verified_at = (current or {}).get("verified_at")
+    if verified_at is not None and (datetime.utcnow() - verified_at).total_seconds() < max_age:
+        return False
+    return _rebuild(db)[1]
+
+
+def _rebuild(db) -> Tuple[Dict[str, Any], bool]:
+    facets = {"totals": _totals()}
+    facets.update({name: _group(field) for name, field in BREAKDOWNS.items()})
+    result = list(db.case_studies.aggregate([{"$facet": facets}]))
+    facet = result[0] if result else {}
+
+    totals = (facet.get("totals") or [{}])[0]
+    document = {
+        "_id": STATS_DOCUMENT_ID,
+        "count": totals.get("count", 0),
+        "success_rate_sum": totals.get("success_rate_sum", 0),
+        "revenue_impact_sum": totals.get("revenue_impact_sum", 0),
+    }
+    for name in BREAKDOWNS:
+        document[name] = {
+            _bucket_key(bucket["_id"]): {
+                "name": bucket["_id"],
+                "count": bucket["count"],
+                "success_rate_sum": bucket["success_rate_sum"],
+            }
+            for bucket in facet.get(name, [])
+        }
+
+    now = datetime.utcnow()
+    current = db.stats.find_one({"_id": STATS_DOCUMENT_ID})
+    if current is not None and _same_numbers(current, document):
+        db.stats.update_one({"_id": STATS_DOCUMENT_ID}, {"$set": {"verified_at": now}})
+        return current, False
+
+    document["updated_at"] = document["verified_at"] = now
+    db.stats.replace_one({"_id": STATS_DOCUMENT_ID}, document, upsert=True)
+    bump_versions(db, STATS_VERSION)
+    return document, True
+
+
+def _same_numbers(stored: Any, computed: Any) -> bool:
+    """Compare the computed stats with the stored document, ignoring timestamps"""
+    if isinstance(computed, dict):
+        if not isinstance(stored, dict):
+            return False
+        stored = {key: value for key, value in stored.items() if key not in ("updated_at", "verified_at")}
+        return stored.keys() == computed.keys() and all(_same_numbers(stored[key], computed[key]) for key in computed)
+    if isinstance(computed, float) or isinstance(stored, float):
+        # $sum over floats can differ in the last bits when documents are visited in another order
+        return isinstance(stored, (int, float)) and math.isclose(stored, computed, rel_tol=1e-9, abs_tol=1e-9)
+    return stored == computed
+
+
+def _average(bucket: Dict[str, Any]) -> float:
+    return round(bucket["success_rate_sum"] / bucket["count"], 1) if bucket.get("count") else 0
+
+
+def _breakdown(buckets: Dict[str, Any], label: str) -> List[Dict[str, Any]]:
+    rows = [
+        {label: bucket["name"], "count": bucket["count"], "average_success_rate": _average(bucket)}
+        for bucket in buckets.values()
+        if bucket.get("count", 0) > 0
+    ]
+    return sorted(rows, key=lambda row: (-row["count"], str(row[label])))
+
+
+def load_dashboard_stats(db) -> Dict[str, Any]:
+    """Read the stats document, building it first if it does not exist yet"""
+    document = db.stats.find_one({"_id": STATS_DOCUMENT_ID})
+    if document is None or "revenue_impact_sum" not in document:
+        # Missing, or written before revenue_impact_sum was tracked
+        document = rebuild_dashboard_stats(db)
+
+    by_company_type = document.get("by_company_type", {})
+    return {
+        "total_case_studies": document.get("count", 0),
+        "startup_studies": by_company_type.get("startup", {}).get("count", 0),
+        "mnc_studies": by_company_type.get("mnc", {}).get("count", 0),
+        "average_success_rate": _average(document),
+        "total_revenue_impact": document.get("revenue_impact_sum", 0),
+        "by_company_type": _breakdown(by_company_type, "company_type"),
+        "by_industry": _breakdown(document.get("by_industry", {}), "industry"),
+        "updated_at": document.get("updated_at"),
+    }
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+"""
+Reproducible synthetic portfolio data for load testing.
+
+Documents follow the shapes in seed_data.py. Industries, company types,
+metric categories and KPI values are drawn from skewed distributions, so
+filters, facets and rollups see realistic selectivity. The same --seed,
+sizes and --chunk-size always produce the same documents, ids included,
+whatever the output.
+
+Random numbers are drawn with NumPy one chunk at a time. Python only
+assembles the dicts, which keeps generation in the tens of thousands of
+documents per second per core.
+
+    python synthetic_data.py --case-studies 1000000 --metrics 50000000 --out data/
+    python synthetic_data.py --case-studies 100000 --metrics 2000000 --db
+
+--out writes case_studies.ndjson, frameworks.ndjson and metrics.ndjson, which
+ingest.py loads. --db bulk-inserts into staging collections and swaps them in,
+replacing the current data.
+"""
+
+import argparse
+import json
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from ingest import STAGING_SUFFIX, index_staging, refresh_derived, swap_in
+from normalization import normalize_case_study
+from seed_data import case_studies as SEED_CASE_STUDIES, frameworks as SEED_FRAMEWORKS
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# (value, relative weight)
+INDUSTRIES = [
+    ("SaaS/Cloud Storage", 18), ("Enterprise Software", 15), ("Fintech", 12), ("Cybersecurity", 10),
+    ("Healthcare IT", 9), ("E-commerce", 9), ("Logistics/Supply Chain", 8), ("MarTech", 7),
+    ("EdTech", 6), ("Clean Energy", 6),
+]
+COMPANY_TYPES = [("startup", 65), ("mnc", 35)]
+PRODUCT_CATEGORIES = [
+    ("B2B Cloud Solutions", 30), ("AI/ML Platform", 20), ("Developer Tools", 15), ("Vertical SaaS", 15),
+    ("Marketplace", 10), ("Hardware + Software", 10),
+]
+# category -> (metric_name, metric_unit, log-normal median, log-normal sigma)
+METRIC_CATALOG: Dict[str, List[Tuple[str, str, float, float]]] = {
+    "market": [
+        ("Customer Acquisition Cost", "USD", 3000.0, 0.8),
+        ("Market Share", "percent", 6.0, 0.9),
+        ("Qualified Leads", "count", 400.0, 1.0),
+    ],
+    "pricing": [
+        ("Average Selling Price", "USD", 25000.0, 1.1),
+        ("Average Discount", "percent", 14.0, 0.4),
+    ],
+    "channel": [
+        ("Partner-Sourced Pipeline", "USD", 1_200_000.0, 1.2),
+        ("Sales Cycle Length", "days", 95.0, 0.5),
+    ],
+    "revenue": [
+        ("Monthly Recurring Revenue", "USD", 600_000.0, 1.3),
+        ("Customer Lifetime Value", "USD", 30000.0, 0.9),
+        ("Net Revenue Retention", "percent", 112.0, 0.12),
+    ],
+}
+CATEGORY_WEIGHTS = {"market": 30, "pricing": 15, "channel": 20, "revenue": 35}
+
+_NAME_PREFIXES = ["Cloud", "Eco", "Data", "Quantum", "Nova", "Blue", "Smart", "Secure", "Hyper", "Open", "Bright", "Swift"]
+_NAME_SUFFIXES = ["Sync", "Logistics", "Works", "Labs", "Metrics", "Stack", "Flow", "Grid", "Pilot", "Forge", "Wave", "Scale"]
+_MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July", "August",
+                "September", "October", "November", "December"]
+_EPOCH = datetime(2021, 1, 1)
+_SPAN_DAYS = 3 * 365
+
+
+def _weights(pairs: List[Tuple[Any, int]]) -> Tuple[List[Any], np.ndarray]:
+    values = [value for value, _ in pairs]
+    weights = np.asarray([weight for _, weight in pairs], dtype=np.float64)
+    return values, weights / weights.sum()
+
+
+def _ids(rng: np.random.Generator, count: int) -> List[str]:
+    raw = rng.bytes(16 * count)
+    return [str(uuid.UUID(bytes=raw[i:i + 16], version=4)) for i in range(0, len(raw), 16)]
+
+
+def money(value: float) -> str:
+    """Format like the seed data: "$2,847", "$28,450", "$847K", "$18.7M", "$47.2B" """
+    if value >= 1e9:
+        return f"${value / 1e9:.1f}B"
+    if value >= 1e6:
+        return f"${value / 1e6:.1f}M"
+    if value >= 1e5:
+        return f"${value / 1e3:.0f}K"
+    return f"${value:,.0f}"
+
+
+def _period(rng_value: float, created: datetime) -> str:
+    # Half quarterly labels, half monthly, like the seed metrics
+    month = created.month
+    if rng_value < 0.5:
+        return f"Q{(month - 1) // 3 + 1} {created.year}"
+    return f"{_MONTH_NAMES[month - 1]} {created.year}"
+
+
+class Generator:
+    """Deterministic stream of synthetic documents for a given seed and size"""
+
+    def __init__(self, seed: int, case_studies: int, metrics: int, frameworks: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.seed = seed
+        self.case_studies = case_studies
+        self.metrics = metrics
+        self.frameworks = frameworks
+        self.chunk_size = chunk_size
+
+    def frameworks_documents(self) -> Iterator[Dict[str, Any]]:
+        rng = np.random.default_rng([self.seed, 1])
+        ids = _ids(rng, self.frameworks)
+        rates = np.clip(rng.normal(85, 7, self.frameworks), 40, 99.9).round(1)
+        for index in range(self.frameworks):
+            template = SEED_FRAMEWORKS[index % len(SEED_FRAMEWORKS)]
+            yield {
+                **template,
+                "id": ids[index],
+                "name": f"{template['name']} #{index + 1}",
+                "success_rate": float(rates[index]),
+                "created_at": _EPOCH + timedelta(days=int(index % _SPAN_DAYS)),
+            }
+
+    def chunks(self) -> Iterator[Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]]:
+        """(case studies, their metrics) one chunk at a time; metrics per case study vary around the mean"""
+        metrics_per_case = self.metrics / self.case_studies if self.case_studies else 0.0
+        for chunk_index, start in enumerate(range(0, self.case_studies, self.chunk_size)):
+            # One generator per chunk, so a chunk's documents depend only on (seed, chunk index)
+            rng = np.random.default_rng([self.seed, 2, chunk_index])
+            size = min(self.chunk_size, self.case_studies - start)
+            cases = self._case_studies(rng, start, size)
+            counts = rng.poisson(metrics_per_case, size)
+            yield cases, self._metrics(rng, cases, counts)
+
+    def _case_studies(self, rng: np.random.Generator, start: int, size: int) -> List[Dict[str, Any]]:
+        industries, industry_p = _weights(INDUSTRIES)
+        company_types, company_type_p = _weights(COMPANY_TYPES)
+        categories, category_p = _weights(PRODUCT_CATEGORIES)
+
+        ids = _ids(rng, size)
+        industry = rng.choice(len(industries), size, p=industry_p)
+        company_type = rng.choice(len(company_types), size, p=company_type_p)
+        category = rng.choice(len(categories), size, p=category_p)
+        prefix = rng.integers(0, len(_NAME_PREFIXES), size)
+        suffix = rng.integers(0, len(_NAME_SUFFIXES), size)
+        template = rng.integers(0, len(SEED_CASE_STUDIES), size)
+        success_rate = np.clip(rng.normal(82, 10, size), 5, 99.9).round(1)
+        cac = rng.lognormal(np.log(3500), 0.7, size)
+        ltv_cac = np.clip(rng.lognormal(np.log(6), 0.5, size), 0.5, 60)
+        churn = np.clip(rng.lognormal(np.log(3.5), 0.5, size), 0.2, 40)
+        mrr = rng.lognormal(np.log(500_000), 1.2, size)
+        sales_cycle = np.clip(rng.lognormal(np.log(4), 0.45, size), 0.5, 24)
+        tam = rng.lognormal(np.log(20e9), 1.0, size)
+        created_offset = rng.integers(0, _SPAN_DAYS * 86400, size)
+        updated_offset = rng.integers(0, 180 * 86400, size)
+
+        docs = []
+        for i in range(size):
+            base = SEED_CASE_STUDIES[template[i]]
+            created = _EPOCH + timedelta(seconds=int(created_offset[i]))
+            is_mnc = company_types[company_type[i]] == "mnc"
+            doc = {
+                **base,
+                "id": ids[i],
+                "company_name": f"{_NAME_PREFIXES[prefix[i]]}{_NAME_SUFFIXES[suffix[i]]} {start + i + 1}",
+                "company_type": company_types[company_type[i]],
+                "industry": industries[industry[i]],
+                "product_category": categories[category[i]],
+                "market_research": {
+                    **base["market_research"],
+                    "total_addressable_market": money(tam[i]),
+                    "serviceable_addressable_market": money(tam[i] * 0.27),
+                    "target_segment_size": money(tam[i] * 0.045),
+                },
+                "channel_strategy": {**base["channel_strategy"], "average_sales_cycle": f"{sales_cycle[i]:.1f} months"},
+                "key_metrics": {
+                    "customer_acquisition_cost": money(cac[i] * (4 if is_mnc else 1)),
+                    "customer_lifetime_value": money(cac[i] * ltv_cac[i] * (4 if is_mnc else 1)),
+                    "ltv_cac_ratio": f"{ltv_cac[i]:.1f}x",
+                    "monthly_recurring_revenue": money(mrr[i] * (10 if is_mnc else 1)),
+                    "churn_rate": f"{churn[i]:.1f}%",
+                },
+                "success_rate": float(success_rate[i]),
+                "revenue_impact": f"{money(mrr[i] * 12 * (10 if is_mnc else 1))} ARR",
+                "created_at": created,
+                "updated_at": created + timedelta(seconds=int(updated_offset[i])),
+            }
+            docs.append(normalize_case_study(doc))
+        return docs
+
+    def _metrics(self, rng: np.random.Generator, cases: List[Dict[str, Any]], counts: np.ndarray) -> List[Dict[str, Any]]:
+        total = int(counts.sum())
+        if total == 0:
+            return []
+        category_names = list(CATEGORY_WEIGHTS)
+        category_p = np.asarray([CATEGORY_WEIGHTS[name] for name in category_names], dtype=np.float64)
+        category_p /= category_p.sum()
+
+        owner = np.repeat(np.arange(len(cases)), counts)
+        category = rng.choice(len(category_names), total, p=category_p)
+        pick = rng.random(total)
+        noise = rng.standard_normal(total)
+        period_style = rng.random(total)
+        period_offset = rng.integers(0, 730, total)
+        ids = _ids(rng, total)
+
+        docs = []
+        for i in range(total):
+            name = category_names[category[i]]
+            metric_name, unit, median, sigma = METRIC_CATALOG[name][int(pick[i] * len(METRIC_CATALOG[name]))]
+            case = cases[owner[i]]
+            when = case["created_at"] + timedelta(days=int(period_offset[i]))
+            docs.append({
+                "id": ids[i],
+                "case_study_id": case["id"],
+                "metric_name": metric_name,
+                "metric_value": round(float(median * np.exp(sigma * noise[i])), 2),
+                "metric_unit": unit,
+                "time_period": _period(period_style[i], when),
+                "category": name,
+            })
+        return docs
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class NDJSONWriter:
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self.files = {
+            name: open(os.path.join(directory, f"{name}.ndjson"), "w", encoding="utf-8")
+            for name in ("case_studies", "frameworks", "metrics")
+        }
+
+    def write(self, collection_name: str, docs: List[Dict[str, Any]]) -> None:
+        if docs:
+            self.files[collection_name].write(
+                "\n".join(json.dumps(doc, default=_json_default, separators=(",", ":")) for doc in docs) + "\n"
+            )
+
+    def close(self) -> None:
+        for handle in self.files.values():
+            handle.close()
+
+
+class MongoWriter:
+    """Unordered bulk inserts into staging collections, indexed and swapped in on close"""
+
+    def __init__(self, db):
+        self.db = db
+        self.names = ["case_studies", "frameworks", "metrics"]
+        for name in self.names:
+            # Plain inserts need no index; building them once after the load is faster
+            db.drop_collection(name + STAGING_SUFFIX)
+
+    def write(self, collection_name: str, docs: List[Dict[str, Any]]) -> None:
+        if docs:
+            # insert_many adds _id to the dicts it is given; copy so templates stay clean
+            self.db[collection_name + STAGING_SUFFIX].insert_many([dict(doc) for doc in docs], ordered=False)
+
+    def close(self) -> None:
+        # Index before the swap so the live collections are never unindexed
+        for name in self.names:
+            index_staging(self.db, name)
+        swap_in(self.db, self.names)
+        refresh_derived(self.db, self.names)
+
+
+def generate(generator: Generator, writer) -> Dict[str, int]:
+    written = {"case_studies": 0, "frameworks": 0, "metrics": 0}
+    started = time.perf_counter()
+    frameworks = list(generator.frameworks_documents())
+    writer.write("frameworks", frameworks)
+    written["frameworks"] = len(frameworks)
+    for cases, metrics in generator.chunks():
+        writer.write("case_studies", cases)
+        writer.write("metrics", metrics)
+        written["case_studies"] += len(cases)
+        written["metrics"] += len(metrics)
+        elapsed = time.perf_counter() - started
+        total = sum(written.values())
+        print(f"  {written['case_studies']:,} case studies, {written['metrics']:,} metrics "
+              f"({total / elapsed:,.0f} docs/s)", flush=True)
+    writer.close()
+    return written
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate a reproducible synthetic GTM portfolio dataset")
+    parser.add_argument("--case-studies", type=int, default=10000)
+    parser.add_argument("--metrics", type=int, default=200000, help="approximate total; spread around an even share per case study")
+    parser.add_argument("--frameworks", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    output = parser.add_mutually_exclusive_group(required=True)
+    output.add_argument("--out", metavar="DIR", help="write NDJSON files to DIR")
+    output.add_argument("--db", action="store_true", help="bulk insert into MONGO_URL, replacing the current data")
+    args = parser.parse_args()
+
+    generator = Generator(args.seed, args.case_studies, args.metrics, args.frameworks, args.chunk_size)
+    if args.db:
+        import repository
+
+        writer = MongoWriter(repository.connect())
+    else:
+        writer = NDJSONWriter(args.out)
+
+    started = time.perf_counter()
+    written = generate(generator, writer)
+    elapsed = time.perf_counter() - started
+    total = sum(written.values())
+    print(f"Wrote {written['case_studies']:,} case studies, {written['frameworks']:,} frameworks and "
+          f"{written['metrics']:,} metrics in {elapsed:.1f}s ({total / elapsed:,.0f} docs/s)")
@@ -0,0 +1,343 @@
+"""
+Request and MongoDB instrumentation in Prometheus text format.
+
+The metric types here are deliberately minimal: fixed buckets, one lock per
+metric and plain dicts keyed by label values, so the hot path is a bisect
+and a few increments. TelemetryMiddleware records per-route latency,
+response size, status counts and in-flight requests; MongoCommandListener is
+registered on the MongoClient and records every command's duration by
+command name and collection; ConnectionPoolStats tracks the driver's
+connection pools. GET /metrics renders everything.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Dict, List, Sequence, Tuple
+
+from pymongo import monitoring
+from starlette.routing import Match
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+MONGO_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+
+# Requests that match no route share one label so unknown paths cannot grow the label set
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}", *self.samples()]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        with self._lock:
+            return dict(self._values)
+
+    def samples(self) -> List[str]:
+        values = self.values()
+        return [f"{self.name}{_labels(self.labelnames, labels)} {_format(value)}" for labels, value in sorted(values.items())]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Sequence[float]):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (last is +Inf), sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def totals(self) -> Dict[Tuple[str, ...], Tuple[int, float]]:
+        """(count, sum) per label set"""
+        with self._lock:
+            return {labels: (sum(counts), total) for labels, (counts, total) in self._series.items()}
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            snapshot = {labels: (list(counts), total) for labels, (counts, total) in self._series.items()}
+        lines = []
+        for labels, (counts, total) in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip([*self.buckets, float("inf")], counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format(bound)
+                bucket_labels = _labels(self.labelnames, labels, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_format(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self.metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(line for metric in self.metrics for line in metric.render()) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "Time from request start to the last body byte sent",
+    ["method", "route"], LATENCY_BUCKETS,
+))
+HTTP_RESPONSE_SIZE = REGISTRY.register(Histogram(
+    "http_response_size_bytes", "Response body bytes as sent (after compression)",
+    ["method", "route"], SIZE_BUCKETS,
+))
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "Completed requests by status code", ["method", "route", "status"],
+))
+HTTP_IN_FLIGHT = REGISTRY.register(Gauge(
+    "http_requests_in_flight", "Requests currently being handled",
+))
+MONGO_COMMAND_DURATION = REGISTRY.register(Histogram(
+    "mongo_command_duration_seconds", "MongoDB command round trips as reported by the driver",
+    ["command", "collection"], MONGO_LATENCY_BUCKETS,
+))
+MONGO_COMMAND_FAILURES = REGISTRY.register(Counter(
+    "mongo_command_failures_total", "MongoDB commands that returned an error", ["command", "collection"],
+))
+MONGO_POOL_CONNECTIONS = REGISTRY.register(Gauge(
+    "mongo_pool_connections", "Open connections per server", ["address"],
+))
+MONGO_POOL_CHECKED_OUT = REGISTRY.register(Gauge(
+    "mongo_pool_checked_out", "Connections currently checked out per server", ["address"],
+))
+MONGO_POOL_WAITING = REGISTRY.register(Gauge(
+    "mongo_pool_wait_queue", "Threads waiting to check out a connection per server", ["address"],
+))
+MONGO_POOL_CHECKOUT_WAIT = REGISTRY.register(Histogram(
+    "mongo_pool_checkout_wait_seconds", "Time spent waiting for a pooled connection",
+    ["address"], MONGO_LATENCY_BUCKETS,
+))
+MONGO_POOL_CHECKOUT_FAILURES = REGISTRY.register(Counter(
+    "mongo_pool_checkout_failures_total", "Failed checkouts by reason (timeout, connectionError, poolClosed)",
+    ["address", "reason"],
+))
+SINGLE_FLIGHT_CALLS = REGISTRY.register(Counter(
+    "singleflight_calls_total", "Coalescable reads by operation; role is leader (ran the query) or coalesced (joined one in flight)",
+    ["operation", "role"],
+))
+SINGLE_FLIGHT_TIMEOUTS = REGISTRY.register(Counter(
+    "singleflight_timeouts_total", "Callers that gave up waiting for an in-flight query", ["operation"],
+))
+SINGLE_FLIGHT_IN_FLIGHT = REGISTRY.register(Gauge(
+    "singleflight_in_flight", "Distinct queries currently in flight", ["operation"],
+))
+
+
+def route_template(scope) -> str:
+    """The matched route's path template, e.g. /api/case-studies/{case_id}"""
+    route = scope.get("route")
+    if route is None and "app" in scope:
+        # Responses served by a middleware (e.g. cache hits) never reach the router
+        for candidate in scope["app"].router.routes:
+            match, _ = candidate.matches(scope)
+            if match == Match.FULL:
+                route = candidate
+                break
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+
+class TelemetryMiddleware:
+    """ASGI middleware recording latency, size, status and concurrency per route"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        started = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            method = scope["method"]
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - started, method, route)
+            HTTP_RESPONSE_SIZE.observe(size, method, route)
+            HTTP_REQUESTS.inc(method, route, str(status))
+
+
+class MongoCommandListener(monitoring.CommandListener):
+    """Driver command monitoring: duration per command name and collection"""
+
+    def __init__(self):
+        # (request_id, connection_id) -> collection, from started until succeeded/failed
+        self._collections: Dict[Tuple[int, object], str] = {}
+
+    @staticmethod
+    def _collection(event: monitoring.CommandStartedEvent) -> str:
+        target = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            target = event.command.get("collection")
+        return target if isinstance(target, str) else ""
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        self._collections[(event.request_id, event.connection_id)] = self._collection(event)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        collection = self._collections.pop((event.request_id, event.connection_id), "")
+        MONGO_COMMAND_DURATION.observe(event.duration_micros / 1e6, event.command_name, collection)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection = self._collections.pop((event.request_id, event.connection_id), "")
+        MONGO_COMMAND_DURATION.observe(event.duration_micros / 1e6, event.command_name, collection)
+        MONGO_COMMAND_FAILURES.inc(event.command_name, collection)
+
+
+def _address(event) -> str:
+    host, port = event.address
+    return f"{host}:{port}"
+
+
+class ConnectionPoolStats(monitoring.ConnectionPoolListener):
+    """Driver pool monitoring: open, checked-out and waiting connections and checkout waits"""
+
+    def __init__(self):
+        # Checkout start and end are reported on the thread doing the checkout
+        self._local = threading.local()
+
+    def pool_created(self, event) -> None:
+        pass
+
+    def pool_ready(self, event) -> None:
+        pass
+
+    def pool_cleared(self, event) -> None:
+        pass
+
+    def pool_closed(self, event) -> None:
+        pass
+
+    def connection_created(self, event) -> None:
+        MONGO_POOL_CONNECTIONS.inc(_address(event))
+
+    def connection_ready(self, event) -> None:
+        pass
+
+    def connection_closed(self, event) -> None:
+        MONGO_POOL_CONNECTIONS.dec(_address(event))
+
+    def connection_check_out_started(self, event) -> None:
+        self._local.started = time.perf_counter()
+        MONGO_POOL_WAITING.inc(_address(event))
+
+    def connection_check_out_failed(self, event) -> None:
+        address = _address(event)
+        MONGO_POOL_WAITING.dec(address)
+        MONGO_POOL_CHECKOUT_FAILURES.inc(address, str(event.reason))
+
+    def connection_checked_out(self, event) -> None:
+        address = _address(event)
+        MONGO_POOL_WAITING.dec(address)
+        MONGO_POOL_CHECKED_OUT.inc(address)
+        started = getattr(self._local, "started", None)
+        if started is not None:
+            MONGO_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started, address)
+            self._local.started = None
+
+    def connection_checked_in(self, event) -> None:
+        MONGO_POOL_CHECKED_OUT.dec(_address(event))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Live pool state per server address"""
+        pools: Dict[str, Dict[str, Any]] = {}
+
+        def pool(address: str) -> Dict[str, Any]:
+            return pools.setdefault(address, {
+                "open": 0, "checked_out": 0, "waiting": 0,
+                "checkouts": 0, "checkout_failures": 0, "average_wait_ms": 0.0,
+            })
+
+        for gauge, key in ((MONGO_POOL_CONNECTIONS, "open"), (MONGO_POOL_CHECKED_OUT, "checked_out"),
+                           (MONGO_POOL_WAITING, "waiting")):
+            for (address,), value in gauge.values().items():
+                pool(address)[key] = int(value)
+        for (address, _), value in MONGO_POOL_CHECKOUT_FAILURES.values().items():
+            pool(address)["checkout_failures"] += int(value)
+        for (address,), (count, total) in MONGO_POOL_CHECKOUT_WAIT.totals().items():
+            pool(address)["checkouts"] = count
+            pool(address)["average_wait_ms"] = round(total / count * 1000, 3) if count else 0.0
+        return pools
+
+
+mongo_listener = MongoCommandListener()
+pool_stats = ConnectionPoolStats()
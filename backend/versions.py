@@ -0,0 +1,40 @@
+"""
+Per-collection data versions.
+
+Writers call bump_versions() after changing a collection; readers that keep
+derived data in memory compare get_versions() (a single point read) with the
+version they computed from and recompute only when it moved. The same read
+also returns when each version last moved, which the API sends as
+Last-Modified.
+"""
+
+from datetime import datetime
+from typing import Dict, Tuple
+
+VERSIONS_DOCUMENT_ID = "versions"
+MODIFIED_FIELD = "modified_at"
+
+
+def bump_versions(db, *collections: str) -> None:
+    if collections:
+        now = datetime.utcnow()
+        db.stats.update_one(
+            {"_id": VERSIONS_DOCUMENT_ID},
+            {
+                "$inc": {name: 1 for name in collections},
+                "$max": {f"{MODIFIED_FIELD}.{name}": now for name in collections},
+            },
+            upsert=True,
+        )
+
+
+def read_versions(db) -> Tuple[Dict[str, int], Dict[str, datetime]]:
+    """Versions and the time each was last bumped, in one point read"""
+    document = db.stats.find_one({"_id": VERSIONS_DOCUMENT_ID}) or {}
+    modified = document.get(MODIFIED_FIELD) or {}
+    versions = {name: value for name, value in document.items() if name not in ("_id", MODIFIED_FIELD)}
+    return versions, modified
+
+
+def get_versions(db) -> Dict[str, int]:
+    return read_versions(db)[0]
@@ -6,9 +6,14 @@ Tests all critical API endpoints with data validation and business logic verific
 
 import requests
 import json
+import os
 import time
 from typing import Dict, List, Any
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "backend"))
 
 # Configuration
 BASE_URL = "http://localhost:8001"
@@ -51,6 +56,33 @@ class GTMBackendTester:
             self.log_test("Server Health Check", False, f"Server not accessible: {str(e)}")
             return False
     
+    def test_readiness(self):
+        """Test GET /api/health/ready reports Mongo reachability and pool statistics"""
+        try:
+            response = requests.get(f"{API_BASE}/health/ready", timeout=10)
+            if response.status_code not in (200, 503):
+                self.log_test("Readiness Probe", False, f"HTTP {response.status_code}: {response.text}")
+                return
+                
+            data = response.json()
+            if response.status_code != 200 or data.get("status") != "ready":
+                self.log_test("Readiness Probe", False, f"Not ready: {data.get('mongo', {}).get('error')}")
+                return
+                
+            mongo = data.get("mongo", {})
+            if "pools" not in mongo or "maxPoolSize" not in mongo.get("settings", {}):
+                self.log_test("Readiness Probe", False, f"Missing pool details: {mongo}")
+                return
+                
+            if not isinstance(data.get("worker_pid"), int):
+                self.log_test("Readiness Probe", False, f"Missing worker pid: {data}")
+                return
+                
+            self.log_test("Readiness Probe", True, f"Worker {data['worker_pid']}: Mongo ping {mongo.get('ping_ms')}ms, read preference {mongo.get('read_preference')}")
+            
+        except Exception as e:
+            self.log_test("Readiness Probe", False, f"Unexpected error: {str(e)}")
+    
     def test_dashboard_stats(self):
         """Test GET /api/dashboard-stats endpoint"""
         try:
@@ -106,8 +138,39 @@ class GTMBackendTester:
             if data["mnc_studies"] != 1:
                 self.log_test("Dashboard Stats API", False, f"Expected 1 MNC study, got {data['mnc_studies']}")
                 return
-                
-            self.log_test("Dashboard Stats API", True, f"All validations passed. Success rate: {success_rate}%", data)
+
+            # Validate the breakdowns: one row per value, counts adding up to the total
+            for breakdown, label in (("by_company_type", "company_type"), ("by_industry", "industry")):
+                rows = data.get(breakdown)
+                if not isinstance(rows, list) or not rows:
+                    self.log_test("Dashboard Stats API", False, f"{breakdown} missing or empty")
+                    return
+                for row in rows:
+                    if label not in row or not isinstance(row.get("count"), int) or row["count"] <= 0:
+                        self.log_test("Dashboard Stats API", False, f"Invalid {breakdown} row: {row}")
+                        return
+                    if not 0 <= row.get("average_success_rate", -1) <= 100:
+                        self.log_test("Dashboard Stats API", False, f"Invalid average_success_rate in {breakdown}: {row}")
+                        return
+                if sum(row["count"] for row in rows) != data["total_case_studies"]:
+                    self.log_test("Dashboard Stats API", False, f"{breakdown} counts don't add up to the total")
+                    return
+                if len({row[label] for row in rows}) != len(rows):
+                    self.log_test("Dashboard Stats API", False, f"Duplicate {label} rows in {breakdown}")
+                    return
+
+            # Server-side total over every case study, not just the first listing page
+            revenue = data.get("total_revenue_impact")
+            if not isinstance(revenue, (int, float)) or abs(revenue - 184_100_000) > 1:
+                self.log_test("Dashboard Stats API", False, f"Expected total_revenue_impact of $184.1M, got {revenue}")
+                return
+
+            company_types = {row["company_type"]: row["count"] for row in data["by_company_type"]}
+            if company_types != {"startup": 2, "mnc": 1}:
+                self.log_test("Dashboard Stats API", False, f"Unexpected by_company_type counts: {company_types}")
+                return
+
+            self.log_test("Dashboard Stats API", True,f"All validations passed. Success rate: {success_rate}%", data)
             
         except requests.exceptions.RequestException as e:
             self.log_test("Dashboard Stats API", False, f"Request failed: {str(e)}")
@@ -119,7 +182,7 @@ class GTMBackendTester:
     def test_case_studies_list(self):
         """Test GET /api/case-studies endpoint"""
         try:
-            response = requests.get(f"{API_BASE}/case-studies", timeout=10)
+            response = requests.get(f"{API_BASE}/case-studies", params={"view": "full"}, timeout=10)
             
             if response.status_code != 200:
                 self.log_test("Case Studies List API", False, f"HTTP {response.status_code}: {response.text}")
@@ -210,6 +273,240 @@ class GTMBackendTester:
             self.log_test("Case Studies List API", False, f"Unexpected error: {str(e)}")
             return None
     
+    def test_case_studies_pagination(self):
+        """Test cursor pagination and summary projection on GET /api/case-studies"""
+        try:
+            seen_ids = []
+            after = None
+            summary_fields = {"id", "company_name", "company_type", "industry", "success_rate", "revenue_impact"}
+            
+            while True:
+                params = {"limit": 2}
+                if after:
+                    params["after"] = after
+                response = requests.get(f"{API_BASE}/case-studies", params=params, timeout=10)
+                
+                if response.status_code != 200:
+                    self.log_test("Case Studies Pagination", False, f"HTTP {response.status_code}: {response.text}")
+                    return
+                    
+                data = response.json()
+                page = data["case_studies"]
+                
+                if len(page) > 2:
+                    self.log_test("Case Studies Pagination", False, f"Page exceeded limit: {len(page)} items")
+                    return
+                    
+                extra_fields = [set(study) - summary_fields for study in page if set(study) - summary_fields]
+                if extra_fields:
+                    self.log_test("Case Studies Pagination", False, f"Summary view returned extra fields: {extra_fields[0]}")
+                    return
+                    
+                seen_ids.extend(study["id"] for study in page)
+                after = data.get("next_cursor")
+                if not after:
+                    break
+                    
+            if len(seen_ids) != len(set(seen_ids)) or len(seen_ids) != 3:
+                self.log_test("Case Studies Pagination", False, f"Expected 3 distinct case studies across pages, got {seen_ids}")
+                return
+                
+            response = requests.get(f"{API_BASE}/case-studies", params={"after": "not-a-cursor"}, timeout=10)
+            if response.status_code != 400:
+                self.log_test("Case Studies Pagination", False, f"Invalid cursor returned HTTP {response.status_code}, expected 400")
+                return
+                
+            self.log_test("Case Studies Pagination", True, f"Walked {len(seen_ids)} case studies in pages of 2")
+            
+        except Exception as e:
+            self.log_test("Case Studies Pagination", False, f"Unexpected error: {str(e)}")
+    
+    def test_case_studies_filtering(self):
+        """Test server-side filters and sort keys on GET /api/case-studies"""
+        try:
+            params = {"company_type": "startup", "min_success_rate": 95, "view": "full"}
+            response = requests.get(f"{API_BASE}/case-studies", params=params, timeout=10)
+            studies = response.json().get("case_studies", [])
+            if response.status_code != 200 or not studies:
+                self.log_test("Case Studies Filtering", False, f"HTTP {response.status_code}, {len(studies)} results")
+                return
+                
+            if any(study["company_type"] != "startup" or study["success_rate"] < 95 for study in studies):
+                self.log_test("Case Studies Filtering", False, "Filter returned non-matching case studies")
+                return
+                
+            response = requests.get(f"{API_BASE}/case-studies", params={"sort": "-success_rate"}, timeout=10)
+            rates = [study["success_rate"] for study in response.json().get("case_studies", [])]
+            if rates != sorted(rates, reverse=True):
+                self.log_test("Case Studies Filtering", False, f"Not sorted by success_rate desc: {rates}")
+                return
+                
+            response = requests.get(f"{API_BASE}/case-studies", params={"sort": "not_a_field"}, timeout=10)
+            if response.status_code != 400:
+                self.log_test("Case Studies Filtering", False, f"Invalid sort returned HTTP {response.status_code}, expected 400")
+                return
+                
+            self.log_test("Case Studies Filtering", True, f"Filters and sorting applied ({len(studies)} high-performing startups)")
+            
+        except Exception as e:
+            self.log_test("Case Studies Filtering", False, f"Unexpected error: {str(e)}")
+    
+    def test_case_studies_query_plans(self):
+        """Explain the listing's filter+sort combinations and assert none of them scan the collection"""
+        try:
+            from indexes import ensure_indexes
+            import repository
+            from repository import case_study_filter, case_study_sort
+            
+            db = repository.connect()
+            case_studies_collection = repository.case_studies_collection
+            
+            ensure_indexes(db)
+            combinations = [
+                ({}, None),
+                ({}, "-success_rate"),
+                ({}, "company_name"),
+                ({}, "-created_at"),
+                ({"company_type": "startup"}, None),
+                ({"company_type": "startup"}, "-success_rate"),
+                ({"industry": "SaaS/Cloud Storage", "min_success_rate": 85}, "-success_rate"),
+                ({"product_category": "B2B Cloud Solutions"}, "success_rate"),
+                ({"min_success_rate": 85, "max_success_rate": 99}, "-success_rate"),
+            ]
+            
+            def stages(plan):
+                if isinstance(plan, dict):
+                    if "stage" in plan:
+                        yield plan["stage"]
+                    for value in plan.values():
+                        yield from stages(value)
+                elif isinstance(plan, list):
+                    for item in plan:
+                        yield from stages(item)
+            
+            for filters, sort in combinations:
+                query = case_study_filter(**filters)
+                explain = case_studies_collection.find(query).sort(case_study_sort(sort)).limit(21).explain()
+                if "COLLSCAN" in set(stages(explain["queryPlanner"]["winningPlan"])):
+                    self.log_test("Case Studies Query Plans", False, f"COLLSCAN for filters={filters} sort={sort}")
+                    return
+                    
+            self.log_test("Case Studies Query Plans", True, f"{len(combinations)} filter/sort combinations use indexes")
+            
+        except Exception as e:
+            self.log_test("Case Studies Query Plans", False, f"Unexpected error: {str(e)}")
+    
+    def test_indexes(self):
+        """Test that startup created every declared index and GET /api/admin/indexes reports them"""
+        try:
+            from indexes import REQUIRED_INDEXES
+            
+            response = requests.get(f"{API_BASE}/admin/indexes", timeout=10)
+            if response.status_code != 200:
+                self.log_test("Index Report", False, f"HTTP {response.status_code}: {response.text}")
+                return
+                
+            report = response.json()
+            if set(report) != set(REQUIRED_INDEXES):
+                self.log_test("Index Report", False, f"Expected collections {sorted(REQUIRED_INDEXES)}, got {sorted(report)}")
+                return
+                
+            for collection_name, entry in report.items():
+                if not all(isinstance(entry.get(key), list) for key in ("missing", "undeclared", "unused")) \
+                        or not isinstance(entry.get("usage"), dict):
+                    self.log_test("Index Report", False, f"Unexpected report shape for {collection_name}: {entry}")
+                    return
+                if entry["missing"]:
+                    self.log_test("Index Report", False, f"Declared indexes missing on {collection_name} after startup: {entry['missing']}")
+                    return
+                    
+            declared = sum(len(models) for models in REQUIRED_INDEXES.values())
+            self.log_test("Index Report", True, f"All {declared} declared indexes present across {len(report)} collections")
+            
+        except Exception as e:
+            self.log_test("Index Report", False, f"Unexpected error: {str(e)}")
+    
+    def test_seed_idempotency(self):
+        """Re-run the seed through the ingest CLI path and check nothing but the data versions changes"""
+        try:
+            import repository
+            from ingest import STAGING_SUFFIX, ingest
+            from seed_data import seed
+            from versions import read_versions
+            
+            db = repository.connect()
+            collections = ["case_studies", "frameworks", "metrics"]
+            
+            def snapshot():
+                return {name: sorted(doc["id"] for doc in db[name].find({}, {"_id": 0, "id": 1})) for name in collections}
+                
+            seed(db)
+            ids, (versions, _) = snapshot(), read_versions(db)
+            for swap in (True, False):
+                reports = seed(db, swap=swap)
+                if any(report.invalid for report in reports):
+                    self.log_test("Seed Idempotency", False, f"Seed reported invalid documents: {[r.errors for r in reports]}")
+                    return
+                if not swap and any(report.upserted or report.modified for report in reports):
+                    self.log_test("Seed Idempotency", False, f"Upsert re-run changed documents: {[r.summary() for r in reports]}")
+                    return
+                if snapshot() != ids:
+                    self.log_test("Seed Idempotency", False, f"Ids or counts changed after re-seeding (swap={swap})")
+                    return
+                    
+                bumped, _ = read_versions(db)
+                expected = {name: versions.get(name, 0) + 1 for name in collections}
+                if {name: bumped.get(name, 0) for name in collections} != expected:
+                    self.log_test("Seed Idempotency", False, f"Versions should be bumped once per seed: {versions} -> {bumped}")
+                    return
+                versions = bumped
+                
+            leftovers = [name for name in db.list_collection_names() if name.endswith(STAGING_SUFFIX)]
+            if leftovers:
+                self.log_test("Seed Idempotency", False, f"Staging collections left behind: {leftovers}")
+                return
+                
+            # Non-object input lines are counted as invalid rather than crashing the load
+            scratch = "frameworks" + STAGING_SUFFIX
+            try:
+                report = ingest(db, "frameworks", [[1, 2], "text", None], target=scratch)
+            finally:
+                db.drop_collection(scratch)
+            if report.invalid != 3 or len(report.errors) != 3:
+                self.log_test("Seed Idempotency", False, f"Non-object documents not rejected: {report.summary()}")
+                return
+                
+            counts = {name: len(values) for name, values in ids.items()}
+            self.log_test("Seed Idempotency", True, f"Re-seeded twice with the same ids {counts}; versions bumped once per run")
+            
+        except Exception as e:
+            self.log_test("Seed Idempotency", False, f"Unexpected error: {str(e)}")
+    
+    def test_sparse_fieldsets(self):
+        """Test ?fields= / ?exclude= projections on GET routes"""
+        try:
+            response = requests.get(f"{API_BASE}/frameworks", params={"fields": "name,description,success_rate"}, timeout=10)
+            frameworks = response.json().get("frameworks", [])
+            if response.status_code != 200 or not frameworks or any(set(fw) != {"name", "description", "success_rate"} for fw in frameworks):
+                self.log_test("Sparse Fieldsets", False, f"Framework projection not applied: HTTP {response.status_code}")
+                return
+                
+            response = requests.get(f"{API_BASE}/case-studies", params={"fields": "id,key_metrics.ltv_cac_ratio"}, timeout=10)
+            studies = response.json().get("case_studies", [])
+            if response.status_code != 200 or not studies or any(set(study.get("key_metrics", {})) != {"ltv_cac_ratio"} for study in studies):
+                self.log_test("Sparse Fieldsets", False, f"Nested projection not applied: HTTP {response.status_code}")
+                return
+                
+            response = requests.get(f"{API_BASE}/case-studies", params={"fields": "not_a_field"}, timeout=10)
+            if response.status_code != 400:
+                self.log_test("Sparse Fieldsets", False, f"Unknown field returned HTTP {response.status_code}, expected 400")
+                return
+                
+            self.log_test("Sparse Fieldsets", True, "fields/exclude projections applied and validated")
+            
+        except Exception as e:
+            self.log_test("Sparse Fieldsets", False, f"Unexpected error: {str(e)}")
+    
     def test_case_study_detail(self, case_studies: List[Dict]):
         """Test GET /api/case-studies/{case_id} endpoint"""
         if not case_studies:
@@ -271,6 +568,92 @@ class GTMBackendTester:
         except Exception as e:
             self.log_test("Case Study Detail API (404 Test)", False, f"Error testing 404: {str(e)}")
     
+    def test_case_study_with_metrics(self, case_studies: List[Dict]):
+        """Test GET /api/case-studies/{case_id}?include=metrics"""
+        if not case_studies:
+            self.log_test("Case Study Embedded Metrics", False, "No case studies available for testing")
+            return
+            
+        try:
+            for study in case_studies:
+                case_id = study["id"]
+                embedded = requests.get(f"{API_BASE}/case-studies/{case_id}", params={"include": "metrics"}, timeout=10)
+                separate = requests.get(f"{API_BASE}/metrics/{case_id}", timeout=10)
+                
+                if embedded.status_code != 200:
+                    self.log_test("Case Study Embedded Metrics", False, f"HTTP {embedded.status_code}: {embedded.text}")
+                    return
+                    
+                embedded_ids = sorted(metric["id"] for metric in embedded.json().get("metrics", []))
+                separate_ids = sorted(metric["id"] for metric in separate.json().get("metrics", []))
+                if embedded_ids != separate_ids:
+                    self.log_test("Case Study Embedded Metrics", False, f"Embedded metrics differ from /api/metrics for {case_id}")
+                    return
+                    
+            self.log_test("Case Study Embedded Metrics", True, "Embedded metrics match the metrics endpoint")
+            
+        except Exception as e:
+            self.log_test("Case Study Embedded Metrics", False, f"Unexpected error: {str(e)}")
+    
+    def test_case_studies_batch(self, case_studies: List[Dict]):
+        """Test POST /api/case-studies/batch multi-get"""
+        if not case_studies:
+            self.log_test("Case Studies Batch API", False, "No case studies available for testing")
+            return
+            
+        try:
+            ids = [study["id"] for study in reversed(case_studies)]
+            payload = {"ids": ids[:1] + ["missing-id"] + ids[1:], "fields": "id,company_name"}
+            response = requests.post(f"{API_BASE}/case-studies/batch", json=payload, timeout=10)
+            
+            if response.status_code != 200:
+                self.log_test("Case Studies Batch API", False, f"HTTP {response.status_code}: {response.text}")
+                return
+                
+            data = response.json()
+            returned_ids = [study["id"] for study in data.get("case_studies", [])]
+            
+            if returned_ids != ids:
+                self.log_test("Case Studies Batch API", False, f"Order not preserved: {returned_ids}")
+                return
+                
+            if data.get("missing") != ["missing-id"]:
+                self.log_test("Case Studies Batch API", False, f"Unexpected missing ids: {data.get('missing')}")
+                return
+                
+            self.log_test("Case Studies Batch API", True, f"Fetched {len(returned_ids)} case studies in one request")
+            
+        except Exception as e:
+            self.log_test("Case Studies Batch API", False, f"Unexpected error: {str(e)}")
+    
+    def test_case_study_benchmarks(self, case_studies: List[Dict]):
+        """Test GET /api/case-studies/{id}/benchmarks percentile standings"""
+        if not case_studies:
+            self.log_test("Case Study Benchmarks API", False, "No case studies available for testing")
+            return
+            
+        try:
+            case_id = case_studies[0]["id"]
+            response = requests.get(f"{API_BASE}/case-studies/{case_id}/benchmarks", timeout=10)
+            if response.status_code != 200:
+                self.log_test("Case Study Benchmarks API", False, f"HTTP {response.status_code}: {response.text}")
+                return
+                
+            portfolio = response.json().get("segments", {}).get("portfolio", {}).get("metrics", {})
+            success = portfolio.get("success_rate")
+            if not success:
+                self.log_test("Case Study Benchmarks API", False, "No portfolio success_rate standing")
+                return
+                
+            if success["peer_count"] != len(case_studies) or not 0 <= success["percentile"] <= 100:
+                self.log_test("Case Study Benchmarks API", False, f"Unexpected success_rate standing: {success}")
+                return
+                
+            self.log_test("Case Study Benchmarks API", True, f"success_rate percentile {success['percentile']} of {success['peer_count']} peers")
+            
+        except Exception as e:
+            self.log_test("Case Study Benchmarks API", False, f"Unexpected error: {str(e)}")
+    
     def test_frameworks(self):
         """Test GET /api/frameworks endpoint"""
         try:
@@ -381,6 +764,397 @@ class GTMBackendTester:
             except Exception as e:
                 self.log_test(f"Metrics API ({case_id})", False, f"Unexpected error: {str(e)}")
     
+    def test_response_cache(self):
+        """Test that repeated reads are served from the response cache"""
+        try:
+            # A query string no earlier request used gets its own cache entry
+            params = {"cache_test": str(time.time_ns())}
+            first = requests.get(f"{API_BASE}/frameworks", params=params, timeout=10)
+            second = requests.get(f"{API_BASE}/frameworks", params=params, timeout=10)
+            
+            if first.headers.get("x-cache") != "MISS" or second.headers.get("x-cache") != "HIT":
+                self.log_test("Response Cache", False, f"Expected MISS then HIT, got {first.headers.get('x-cache')} then {second.headers.get('x-cache')}")
+                return
+                
+            if first.content != second.content:
+                self.log_test("Response Cache", False, "Cached body differs from original response")
+                return
+                
+            stats = requests.get(f"{API_BASE}/cache/stats", timeout=10).json()
+            if stats.get("hits", 0) < 1:
+                self.log_test("Response Cache", False, f"Cache stats did not record the hit: {stats}")
+                return
+                
+            self.log_test("Response Cache", True, f"Hit rate {stats['hit_rate']:.0%} over {stats['hits'] + stats['misses']} lookups")
+            
+        except Exception as e:
+            self.log_test("Response Cache", False, f"Unexpected error: {str(e)}")
+    
+    def test_compression(self):
+        """Test gzip/br/identity negotiation and that every negotiable response varies on Accept-Encoding"""
+        try:
+            import gzip
+            from compression import available_encodings
+            
+            def fetch(path, accept_encoding, **params):
+                # Raw bytes, so the test sees exactly the encoding the server sent
+                response = requests.get(f"{API_BASE}{path}", params=params, headers={"Accept-Encoding": accept_encoding},
+                                        stream=True, timeout=10)
+                return response, response.raw.read(decode_content=False)
+                
+            identity, identity_body = fetch("/case-studies", "identity", view="full")
+            if identity.status_code != 200 or identity.headers.get("content-encoding"):
+                self.log_test("Compression", False, f"identity request got {identity.status_code} {identity.headers.get('content-encoding')}")
+                return
+                
+            decoders = {"gzip": gzip.decompress}
+            if "br" in available_encodings():
+                import brotli
+                decoders["br"] = brotli.decompress
+            for encoding, decode in decoders.items():
+                response, body = fetch("/case-studies", encoding, view="full")
+                if response.headers.get("content-encoding") != encoding:
+                    self.log_test("Compression", False, f"Accept-Encoding: {encoding} got {response.headers.get('content-encoding')}")
+                    return
+                if json.loads(decode(body)) != json.loads(identity_body) or len(body) >= len(identity_body):
+                    self.log_test("Compression", False, f"{encoding} body does not decode to the identity body or is not smaller")
+                    return
+                    
+            # Identity responses must vary too, or a shared cache could serve them to clients asking for compression
+            small, _ = fetch("/cache/stats", "gzip")
+            for name, response in (("identity", identity), ("below minimum size", small)):
+                if response.headers.get("content-encoding") or "accept-encoding" not in response.headers.get("vary", "").lower():
+                    self.log_test("Compression", False, f"{name} response: encoding {response.headers.get('content-encoding')}, "
+                                                        f"Vary {response.headers.get('vary')}")
+                    return
+                    
+            self.log_test("Compression", True, f"{', '.join(decoders)} and identity negotiated; {len(identity_body):,} identity bytes")
+            
+        except Exception as e:
+            self.log_test("Compression", False, f"Unexpected error: {str(e)}")
+    
+    def test_conditional_get(self):
+        """Test ETag/Last-Modified validators and 304 Not Modified"""
+        try:
+            first = requests.get(f"{API_BASE}/frameworks", timeout=10)
+            etag = first.headers.get("etag")
+            last_modified = first.headers.get("last-modified")
+            if not etag or not last_modified:
+                self.log_test("Conditional GET", False, f"Missing validators: ETag={etag}, Last-Modified={last_modified}")
+                return
+                
+            revalidated = requests.get(f"{API_BASE}/frameworks", headers={"If-None-Match": etag}, timeout=10)
+            if revalidated.status_code != 304 or revalidated.content:
+                self.log_test("Conditional GET", False, f"If-None-Match: expected empty 304, got HTTP {revalidated.status_code}")
+                return
+                
+            since = requests.get(f"{API_BASE}/frameworks", headers={"If-Modified-Since": last_modified}, timeout=10)
+            if since.status_code != 304:
+                self.log_test("Conditional GET", False, f"If-Modified-Since: expected 304, got HTTP {since.status_code}")
+                return
+                
+            stale = requests.get(f"{API_BASE}/frameworks", headers={"If-None-Match": '"stale"'}, timeout=10)
+            if stale.status_code != 200 or stale.headers.get("etag") != etag:
+                self.log_test("Conditional GET", False, f"Mismatched ETag: expected 200 with {etag}, got HTTP {stale.status_code}")
+                return
+                
+            self.log_test("Conditional GET", True, f"ETag {etag}, Last-Modified {last_modified}")
+            
+        except Exception as e:
+            self.log_test("Conditional GET", False, f"Unexpected error: {str(e)}")
+    
+    def test_search(self):
+        """Test GET /api/search ranking, highlighting and facets"""
+        try:
+            response = requests.get(f"{API_BASE}/search", params={"q": "compliance"}, timeout=10)
+            if response.status_code != 200:
+                self.log_test("Search API", False, f"HTTP {response.status_code}: {response.text}")
+                return
+                
+            data = response.json()
+            case_results = data.get("case_studies", {})
+            hits = case_results.get("results", [])
+            if not hits:
+                self.log_test("Search API", False, "No case studies matched 'compliance'")
+                return
+                
+            scores = [hit["score"] for hit in hits]
+            if scores != sorted(scores, reverse=True):
+                self.log_test("Search API", False, f"Results not ranked by score: {scores}")
+                return
+                
+            if not any("<mark>" in snippet["text"] for hit in hits for snippet in hit.get("highlights", [])):
+                self.log_test("Search API", False, "No highlighted snippets in results")
+                return
+                
+            facet_total = sum(bucket["count"] for bucket in case_results.get("facets", {}).get("company_type", []))
+            if facet_total != case_results.get("total"):
+                self.log_test("Search API", False, f"company_type facets sum to {facet_total}, total is {case_results.get('total')}")
+                return
+                
+            self.log_test("Search API", True, f"{case_results['total']} case studies and {data.get('frameworks', {}).get('total', 0)} frameworks matched")
+            
+        except Exception as e:
+            self.log_test("Search API", False, f"Unexpected error: {str(e)}")
+    
+    def test_metrics_rollup(self):
+        """Test GET /api/analytics/metrics-rollup aggregates and percentiles"""
+        try:
+            response = requests.get(f"{API_BASE}/analytics/metrics-rollup",
+                                    params={"group_by": "metric_name,metric_unit", "percentiles": "50,90"}, timeout=10)
+            if response.status_code != 200:
+                self.log_test("Metrics Rollup API", False, f"HTTP {response.status_code}: {response.text}")
+                return
+                
+            rows = response.json().get("rollup", [])
+            if not rows:
+                self.log_test("Metrics Rollup API", False, "Rollup returned no rows")
+                return
+                
+            for row in rows:
+                if not row["min"] <= row["p50"] <= row["p90"] <= row["max"]:
+                    self.log_test("Metrics Rollup API", False, f"Percentiles out of order for {row['metric_name']}: {row}")
+                    return
+                    
+            bad = requests.get(f"{API_BASE}/analytics/metrics-rollup", params={"group_by": "company_name"}, timeout=10)
+            if bad.status_code != 400:
+                self.log_test("Metrics Rollup API", False, f"Unknown group_by returned HTTP {bad.status_code}, expected 400")
+                return
+                
+            for percentiles in ("nan", "inf", "-1", "101", "50,abc"):
+                bad = requests.get(f"{API_BASE}/analytics/metrics-rollup", params={"percentiles": percentiles}, timeout=10)
+                if bad.status_code != 400:
+                    self.log_test("Metrics Rollup API", False, f"percentiles={percentiles} returned HTTP {bad.status_code}, expected 400")
+                    return
+                
+            self.log_test("Metrics Rollup API", True, f"{len(rows)} metric series, {sum(row['count'] for row in rows)} data points")
+            
+        except Exception as e:
+            self.log_test("Metrics Rollup API", False, f"Unexpected error: {str(e)}")
+    
+    def test_normalization(self):
+        """Test parse_quantity on the display-string formats stored in case studies"""
+        try:
+            from normalization import parse_quantity
+            
+            expected = {
+                "$847K": (847_000, "USD", 1_000),
+                "$2,847": (2_847, "USD", 1),
+                "$47.2B": (47_200_000_000, "USD", 1_000_000_000),
+                "$1.2 million": (1_200_000, "USD", 1_000_000),
+                "€3.5M": (3_500_000, "EUR", 1_000_000),
+                "10.0x": (10, "ratio", 1),
+                "2.4X": (2.4, "ratio", 1),
+                "3.2%": (3.2, "percent", 1),
+                "4.2 months": (4.2, "months", 1),
+                "12 mo": (12, "months", 1),
+                "1 year": (1, "years", 1),
+                # Only the leading quantity counts; "18 months" is context
+                "$18.7M ARR in 18 months": (18_700_000, "USD", 1_000_000),
+                "1,250": (1_250, "count", 1),
+            }
+            for raw, (value, unit, scale) in expected.items():
+                parsed = parse_quantity(raw)
+                if parsed is None or abs(parsed["value"] - value) > 1e-6 * max(1, value) \
+                        or parsed["unit"] != unit or parsed["scale"] != scale:
+                    self.log_test("KPI Normalization", False, f"parse_quantity({raw!r}) = {parsed}, expected {value} {unit} x{scale}")
+                    return
+                    
+            for raw in ["N/A", "", "Series B", None, True, {"value": 1}]:
+                if parse_quantity(raw) is not None:
+                    self.log_test("KPI Normalization", False, f"parse_quantity({raw!r}) should not parse")
+                    return
+                    
+            self.log_test("KPI Normalization", True, f"{len(expected)} display formats parsed")
+            
+        except Exception as e:
+            self.log_test("KPI Normalization", False, f"Unexpected error: {str(e)}")
+    
+    def test_ndjson_export(self, case_studies: List[Dict]):
+        """Test GET /api/export/case-studies and /api/export/metrics NDJSON streams"""
+        try:
+            response = requests.get(f"{API_BASE}/export/case-studies", params={"batch_size": 2}, stream=True, timeout=10)
+            if response.status_code != 200 or "application/x-ndjson" not in response.headers.get("content-type", ""):
+                self.log_test("NDJSON Export", False, f"HTTP {response.status_code}, content-type {response.headers.get('content-type')}")
+                return
+                
+            exported = [json.loads(line) for line in response.iter_lines() if line]
+            if len(exported) != 3:
+                self.log_test("NDJSON Export", False, f"Expected 3 exported case studies, got {len(exported)}")
+                return
+                
+            response = requests.get(f"{API_BASE}/export/case-studies", params={"company_type": "startup"}, timeout=10)
+            startups = [json.loads(line) for line in response.text.splitlines() if line]
+            if len(startups) != 2 or any(study["company_type"] != "startup" for study in startups):
+                self.log_test("NDJSON Export", False, f"company_type filter returned {len(startups)} rows")
+                return
+                
+            if case_studies:
+                case_id = case_studies[0]["id"]
+                response = requests.get(f"{API_BASE}/export/metrics", params={"case_study_id": case_id}, timeout=10)
+                metrics = [json.loads(line) for line in response.text.splitlines() if line]
+                if any(metric["case_study_id"] != case_id for metric in metrics):
+                    self.log_test("NDJSON Export", False, "case_study_id filter returned other case studies' metrics")
+                    return
+                    
+            self.log_test("NDJSON Export", True, f"Streamed {len(exported)} case studies with filters applied")
+            
+        except Exception as e:
+            self.log_test("NDJSON Export", False, f"Unexpected error: {str(e)}")
+    
+    def test_prometheus_metrics(self):
+        """Test GET /metrics exposes per-route request histograms"""
+        try:
+            requests.get(f"{API_BASE}/frameworks", timeout=10)
+            response = requests.get(f"{BASE_URL}/metrics", timeout=10)
+            if response.status_code != 200:
+                self.log_test("Prometheus Metrics", False, f"HTTP {response.status_code}: {response.text}")
+                return
+                
+            text = response.text
+            expected = 'http_request_duration_seconds_count{method="GET",route="/api/frameworks"}'
+            if expected not in text:
+                self.log_test("Prometheus Metrics", False, f"Missing series: {expected}")
+                return
+                
+            if "# TYPE mongo_command_duration_seconds histogram" not in text:
+                self.log_test("Prometheus Metrics", False, "Missing Mongo command histogram")
+                return
+                
+            self.log_test("Prometheus Metrics", True, f"{text.count(chr(10))} exposition lines")
+            
+        except Exception as e:
+            self.log_test("Prometheus Metrics", False, f"Unexpected error: {str(e)}")
+    
+    def test_slow_query_log(self):
+        """Test the slow-query log: threshold, redaction, ring buffer, sampled explain and the admin endpoint"""
+        try:
+            from types import SimpleNamespace
+            from slow_queries import SlowQueryLog
+            
+            explain_reply = {"executionStats": {"totalDocsExamined": 40, "totalKeysExamined": 0, "executionTimeMillis": 120},
+                             "queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}}
+            explained = []
+            
+            class ExplainClient:
+                def __getitem__(self, database):
+                    return self
+                    
+                def command(self, command):
+                    explained.append(command)
+                    return explain_reply
+                    
+            def run_find(log, request_id, duration_ms, company_name="Acme"):
+                command = {"find": "case_studies", "filter": {"company_name": company_name, "success_rate": {"$gte": 90}},
+                           "sort": {"success_rate": -1}, "lsid": {"id": "session"}}
+                log.started(SimpleNamespace(command_name="find", command=command, request_id=request_id, connection_id=1))
+                log.succeeded(SimpleNamespace(command_name="find", request_id=request_id, connection_id=1, database_name="db",
+                                              duration_micros=int(duration_ms * 1000), reply={"cursor": {"firstBatch": [{}, {}]}}))
+                
+            log = SlowQueryLog(threshold_ms=100, size=3, explain_rate=0, collections=["case_studies"])
+            run_find(log, 1, 5)
+            if log.entries:
+                self.log_test("Slow Query Log", False, "A 5ms query under the 100ms threshold was recorded")
+                return
+                
+            for request_id in range(2, 7):
+                run_find(log, request_id, 150 + request_id, company_name=f"Secret {request_id}")
+            entries = log.recent()
+            if [entry["duration_ms"] for entry in entries] != [156, 155, 154]:
+                self.log_test("Slow Query Log", False, f"Ring buffer of 3 should keep the newest first: {entries}")
+                return
+                
+            shape = entries[0]["shape"]
+            if shape["filter"] != {"company_name": "?", "success_rate": {"$gte": "?"}} or shape["sort"] != {"success_rate": -1}:
+                self.log_test("Slow Query Log", False, f"Filter literals not redacted or sort lost: {shape}")
+                return
+            if "Secret" in json.dumps(entries, default=str) or entries[0]["docs_returned"] != 2:
+                self.log_test("Slow Query Log", False, f"Unexpected entry contents: {entries[0]}")
+                return
+                
+            sampled = SlowQueryLog(threshold_ms=100, size=3, explain_rate=1, collections=["case_studies"])
+            sampled.bind(ExplainClient())
+            run_find(sampled, 1, 200)
+            deadline = time.time() + 5
+            while sampled.entries[0]["explain"] is None and time.time() < deadline:
+                time.sleep(0.01)
+            sampled.shutdown()
+            summary = sampled.entries[0]["explain"]
+            if not summary or not summary.get("collection_scan") or summary.get("docs_examined") != 40:
+                self.log_test("Slow Query Log", False, f"Sampled explain not summarized: {summary}")
+                return
+            if "lsid" in explained[0]["explain"]:
+                self.log_test("Slow Query Log", False, "Driver session fields were passed to explain")
+                return
+                
+            response = requests.get(f"{API_BASE}/admin/slow-queries", params={"limit": 5}, timeout=10)
+            if response.status_code != 200:
+                self.log_test("Slow Query Log", False, f"HTTP {response.status_code}: {response.text}")
+                return
+            data = response.json()
+            if not {"threshold_ms", "explain_rate", "entries"} <= data.keys() or not isinstance(data["entries"], list):
+                self.log_test("Slow Query Log", False, f"Unexpected endpoint shape: {data}")
+                return
+                
+            cleared = requests.post(f"{API_BASE}/admin/slow-queries/clear", timeout=10)
+            if cleared.status_code not in (404, 405):
+                self.log_test("Slow Query Log", False, f"Unauthenticated clear endpoint answered HTTP {cleared.status_code}")
+                return
+                
+            self.log_test("Slow Query Log", True, f"Threshold {data['threshold_ms']}ms, {len(data['entries'])} live entries")
+            
+        except Exception as e:
+            self.log_test("Slow Query Log", False, f"Unexpected error: {str(e)}")
+    
+    def test_request_coalescing(self):
+        """Test that concurrent identical reads are counted by the single-flight layer"""
+        def coalescing_counts() -> Dict[str, float]:
+            text = requests.get(f"{BASE_URL}/metrics", timeout=10).text
+            counts = {}
+            for line in text.splitlines():
+                if line.startswith('singleflight_calls_total{operation="benchmark_distributions"'):
+                    role = line.split('role="')[1].split('"')[0]
+                    counts[role] = float(line.rsplit(" ", 1)[1])
+            return counts
+            
+        def burst(pool, sessions) -> List[int]:
+            # Every thread connects first and then waits at the barrier, so the 20 requests reach the server together
+            barrier = threading.Barrier(len(sessions))
+            
+            def fetch(session):
+                session.get(BASE_URL, timeout=10)
+                barrier.wait(timeout=10)
+                return session.get(f"{API_BASE}/benchmarks", params={"segment": "company_type"}, timeout=30).status_code
+                
+            return list(pool.map(fetch, sessions))
+            
+        try:
+            sessions = [requests.Session() for _ in range(20)]
+            with ThreadPoolExecutor(max_workers=len(sessions)) as pool:
+                # Timing decides how many requests overlap; a few bursts make at least one overlap near-certain
+                for attempt in range(5):
+                    before = coalescing_counts()
+                    failed = [status for status in burst(pool, sessions) if status != 200]
+                    if failed:
+                        self.log_test("Request Coalescing", False, f"Concurrent requests failed: {failed}")
+                        return
+                    after = coalescing_counts()
+                    delta = {role: after.get(role, 0) - before.get(role, 0) for role in ("leader", "coalesced")}
+                    if delta["leader"] + delta["coalesced"] != 20 or delta["leader"] < 1:
+                        self.log_test("Request Coalescing", False, f"Unexpected single-flight counts for 20 requests: {delta}")
+                        return
+                    if delta["coalesced"] >= 1:
+                        break
+                        
+            if delta["coalesced"] < 1:
+                self.log_test("Request Coalescing", False, f"No request was coalesced in {attempt + 1} bursts of 20: {delta}")
+                return
+                
+            self.log_test("Request Coalescing", True, f"20 concurrent requests ran {delta['leader']:.0f} queries ({delta['coalesced']:.0f} coalesced)")
+            
+        except Exception as e:
+            self.log_test("Request Coalescing", False, f"Unexpected error: {str(e)}")
+    
     def test_performance(self):
         """Test API response times"""
         endpoints = [
@@ -415,21 +1189,75 @@ class GTMBackendTester:
             print("❌ Server not accessible. Stopping tests.")
             return self.generate_report()
         
+        # Test readiness
+        self.test_readiness()
+        
         # Test dashboard stats
         self.test_dashboard_stats()
         
         # Test case studies list and get data for other tests
         case_studies = self.test_case_studies_list()
         
+        # Test cursor pagination
+        self.test_case_studies_pagination()
+        
+        # Test filtering, sorting and their query plans
+        self.test_case_studies_filtering()
+        self.test_case_studies_query_plans()
+        self.test_seed_idempotency()
+        self.test_indexes()
+        
+        # Test sparse fieldsets
+        self.test_sparse_fieldsets()
+        
         # Test case study details
         self.test_case_study_detail(case_studies)
         
+        # Test detail with embedded metrics
+        self.test_case_study_with_metrics(case_studies)
+        
+        # Test batch multi-get
+        self.test_case_studies_batch(case_studies)
+        
+        # Test peer benchmarks
+        self.test_case_study_benchmarks(case_studies)
+        
         # Test frameworks
         self.test_frameworks()
         
         # Test metrics
         self.test_metrics(case_studies)
         
+        # Test full-text search
+        self.test_search()
+        
+        # Test metrics rollup
+        self.test_metrics_rollup()
+        
+        # Test KPI normalization
+        self.test_normalization()
+        
+        # Test NDJSON export
+        self.test_ndjson_export(case_studies)
+        
+        # Test response cache
+        self.test_response_cache()
+        
+        # Test conditional GET
+        self.test_conditional_get()
+        
+        # Test response compression
+        self.test_compression()
+        
+        # Test Prometheus instrumentation
+        self.test_prometheus_metrics()
+        
+        # Test slow-query log
+        self.test_slow_query_log()
+        
+        # Test single-flight coalescing
+        self.test_request_coalescing()
+        
         # Test performance
         self.test_performance()
         
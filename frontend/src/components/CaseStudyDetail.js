@@ -56,13 +56,11 @@ const CaseStudyDetail = () => {
     try {
       setLoading(true);
       
-      const [studyResponse, metricsResponse] = await Promise.all([
-        gtmAPI.getCaseStudy(id),
-        gtmAPI.getCaseMetrics(id)
-      ]);
+      // Metrics are embedded in the same response, saving a second request
+      const { metrics: caseMetrics, ...studyResponse } = await gtmAPI.getCaseStudy(id, { include: 'metrics' });
 
       setCaseStudy(studyResponse);
-      setMetrics(metricsResponse.metrics || []);
+      setMetrics(caseMetrics || []);
       setError(null);
     } catch (err) {
       console.error('Error fetching case study:', err);
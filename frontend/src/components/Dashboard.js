@@ -24,6 +24,22 @@ import {
   formatNumber
 } from '../utils/helpers';
 
+// Only the fields the case study cards render
+const CASE_STUDY_CARD_FIELDS = [
+  'id',
+  'company_name',
+  'company_type',
+  'industry',
+  'product_category',
+  'challenge',
+  'success_rate',
+  'revenue_impact',
+  'key_metrics.ltv_cac_ratio',
+  'key_metrics.customer_acquisition_cost',
+  'key_metrics.monthly_recurring_revenue',
+  'key_metrics.churn_rate'
+].join(',');
+
 const Dashboard = () => {
   const [dashboardStats, setDashboardStats] = useState(null);
   const [caseStudies, setCaseStudies] = useState([]);
@@ -41,7 +57,7 @@ const Dashboard = () => {
       // Fetch dashboard stats and case studies in parallel
       const [statsResponse, studiesResponse] = await Promise.all([
         gtmAPI.getDashboardStats(),
-        gtmAPI.getCaseStudies()
+        gtmAPI.getAllCaseStudies({ fields: CASE_STUDY_CARD_FIELDS })
       ]);
 
       setDashboardStats(statsResponse);
@@ -79,16 +95,8 @@ const Dashboard = () => {
     );
   }
 
-  // Calculate total revenue impact from case studies
-  const totalRevenueImpact = caseStudies.reduce((sum, study) => {
-    const impact = study.revenue_impact.match(/\$(\d+(?:\.\d+)?)[MB]/);
-    if (impact) {
-      const value = parseFloat(impact[1]);
-      const unit = impact[0].includes('M') ? 1000000 : 1000000000;
-      return sum + (value * unit);
-    }
-    return sum;
-  }, 0);
+  // Portfolio-wide total, aggregated server-side over every case study
+  const totalRevenueImpact = dashboardStats?.total_revenue_impact || 0;
 
   return (
     <div className="min-h-screen bg-gray-50">
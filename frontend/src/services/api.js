@@ -46,18 +46,45 @@ export const gtmAPI = {
   },
 
   // Case studies
-  getCaseStudies: async () => {
+  getCaseStudies: async (params = {}) => {
     try {
-      const response = await api.get('/api/case-studies');
+      const response = await api.get('/api/case-studies', { params });
       return response.data;
     } catch (error) {
       throw error;
     }
   },
 
-  getCaseStudy: async (caseId) => {
+  // Every case study, following next_cursor page by page
+  getAllCaseStudies: async (params = {}) => {
     try {
-      const response = await api.get(`/api/case-studies/${caseId}`);
+      const caseStudies = [];
+      let after = null;
+      do {
+        const response = await api.get('/api/case-studies', {
+          params: { limit: 100, ...params, ...(after ? { after } : {}) }
+        });
+        caseStudies.push(...(response.data.case_studies || []));
+        after = response.data.next_cursor;
+      } while (after);
+      return { case_studies: caseStudies };
+    } catch (error) {
+      throw error;
+    }
+  },
+
+  getCaseStudy: async (caseId, params = {}) => {
+    try {
+      const response = await api.get(`/api/case-studies/${caseId}`, { params });
+      return response.data;
+    } catch (error) {
+      throw error;
+    }
+  },
+
+  getCaseStudiesBatch: async (ids, params = {}) => {
+    try {
+      const response = await api.post('/api/case-studies/batch', { ids, ...params });
       return response.data;
     } catch (error) {
       throw error;
@@ -74,6 +101,16 @@ export const gtmAPI = {
     }
   },
 
+  // Search
+  search: async (q, params = {}) => {
+    try {
+      const response = await api.get('/api/search', { params: { q, ...params } });
+      return response.data;
+    } catch (error) {
+      throw error;
+    }
+  },
+
   // Metrics
   getCaseMetrics: async (caseId) => {
     try {